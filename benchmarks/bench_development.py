@@ -0,0 +1,74 @@
+"""End-of-season development: the per-player loop vs the batch engine.
+
+Run from the repository root:
+    python benchmarks/bench_development.py
+"""
+import random
+import time
+
+import numpy as np
+
+from terminal_football_manager.constants import TRAINER_TIERS
+from terminal_football_manager.development import develop_world
+from terminal_football_manager.manager_mode import create_teams
+
+
+def loop_development(teams):
+    # The per-player off-season loop the batch engine replaced, minus the printing
+    for team in teams:
+        for player in list(team.youth_academy):
+            player.age += 1
+            growth_room = player.potential - player.ovr
+            if player.age < 24:
+                player.ovr = max(10, player.ovr + (random.randint(1, min(5, max(1, growth_room // 4))) if growth_room > 0 else random.randint(0, 1)))
+        for player in list(team.players):
+            player.age += 1
+            if player.age >= 40:
+                team.remove_player(player)
+                continue
+            if player.age < 24:
+                growth_room = player.potential - player.ovr
+                ovr_change = random.randint(1, min(5, max(1, growth_room // 5))) if growth_room > 0 else random.randint(0, 1)
+            elif player.age <= 29:
+                ovr_change = random.randint(0, 1)
+            elif player.age <= 32:
+                ovr_change = random.randint(-1, 0)
+            else:
+                ovr_change = random.randint(-3, -1)
+            if player.trainer_level > 0:
+                ovr_change += TRAINER_TIERS[list(TRAINER_TIERS.keys())[player.trainer_level - 1]]["boost"]
+            player.ovr = max(10, player.ovr + ovr_change)
+            for _ in range(abs(ovr_change)):
+                attr = random.choice(list(player.attributes.keys()))
+                player.attributes[attr] = max(10, min(125, player.attributes[attr] + (1 if ovr_change > 0 else -1)))
+            player.trainer_level = 0
+
+
+def world(copies):
+    random.seed(1)
+    base = create_teams()
+    return [team.copy() for _ in range(copies) for team in base]
+
+
+def main():
+    copies = 100
+    teams = world(copies)
+    n_players = sum(len(t.players) + len(t.youth_academy) for t in teams)
+
+    start = time.perf_counter()
+    loop_development(teams)
+    loop_time = time.perf_counter() - start
+
+    teams = world(copies)
+    start = time.perf_counter()
+    develop_world(teams, np.random.default_rng(1))
+    batch_time = time.perf_counter() - start
+
+    print(f"players:          {n_players:12,}")
+    print(f"per-player loop:  {loop_time:12.3f} s")
+    print(f"batch engine:     {batch_time:12.3f} s")
+    print(f"speed-up:         {loop_time / batch_time:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
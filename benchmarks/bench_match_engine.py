@@ -0,0 +1,51 @@
+"""Matches per second: game_logic.simulate_match vs the batch match engine.
+
+Run from the repository root:
+    python benchmarks/bench_match_engine.py
+"""
+import random
+import time
+
+from terminal_football_manager.game_logic import generate_fixtures, simulate_match, reset_all_team_stats
+from terminal_football_manager.manager_mode import create_teams
+from terminal_football_manager.match_engine import simulate_fixtures
+
+
+def season_fixtures(teams):
+    leagues = {}
+    for team in teams:
+        leagues.setdefault(team.league, []).append(team)
+    fixtures = []
+    for league_teams in leagues.values():
+        fixtures.extend(generate_fixtures(league_teams))
+    return fixtures
+
+
+def main():
+    random.seed(1)
+    teams = create_teams()
+    fixtures = season_fixtures(teams)
+    n_matches = sum(len(md) for md in fixtures)
+
+    reset_all_team_stats(teams)
+    start = time.perf_counter()
+    for matchday in fixtures:
+        for home, away in matchday:
+            simulate_match(home, away)
+    loop_rate = n_matches / (time.perf_counter() - start)
+
+    reset_all_team_stats(teams)
+    rounds = 20
+    start = time.perf_counter()
+    for _ in range(rounds):
+        simulate_fixtures(fixtures)
+    batch_rate = rounds * n_matches / (time.perf_counter() - start)
+
+    print(f"fixtures per season: {n_matches}")
+    print(f"simulate_match:      {loop_rate:12,.0f} matches/s")
+    print(f"batch engine:        {batch_rate:12,.0f} matches/s")
+    print(f"speed-up:            {batch_rate / loop_rate:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
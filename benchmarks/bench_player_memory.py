@@ -0,0 +1,63 @@
+"""Per-player memory of the slotted Player vs the previous dict-backed layout.
+
+Run from the repository root:
+    python benchmarks/bench_player_memory.py [n_players]
+"""
+import gc
+import random
+import sys
+import tracemalloc
+
+from terminal_football_manager.manager_mode import generate_player
+from terminal_football_manager.models import Player
+
+
+class DictPlayer:
+    """The pre-__slots__ Player layout: same fields, stored in an instance __dict__."""
+    def __init__(self, data):
+        self.name = data["name"]
+        self.position = data["position"]
+        self.age = data["age"]
+        self.ovr = data["ovr"]
+        self.potential = data["potential"]
+        self.attributes = data["attributes"]
+        self.country = data["country"]
+        self.trainer_level = 0
+        self.season_goals = 0
+        self.season_clean_sheets = 0
+        self.team = None
+        self.stamina = 100
+        self.morale = 70
+        self.form = 50
+        self.injury_days = 0
+        self.is_banned = False
+        self.match_streak = 0
+        self.traits = []
+
+
+def measure(build, source):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    players = [build(dict(d, attributes=dict(d["attributes"]))) for d in source]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The copied source dicts are freed by now; only the players themselves remain counted
+    return (after - before) / len(players), players
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(1)
+    source = [generate_player().to_dict() for _ in range(n)]
+
+    dict_bytes, _ = measure(DictPlayer, source)
+    slot_bytes, _ = measure(Player.from_dict, source)
+    print(f"players:          {n:,}")
+    print(f"dict-backed:      {dict_bytes:8.0f} bytes/player")
+    print(f"slotted Player:   {slot_bytes:8.0f} bytes/player")
+    print(f"reduction:        {1 - slot_bytes / dict_bytes:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
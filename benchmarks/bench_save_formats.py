@@ -0,0 +1,42 @@
+"""Save/load time and file size: JSON save vs the streamed binary save.
+
+Run from the repository root:
+    python benchmarks/bench_save_formats.py
+"""
+import os
+import random
+import tempfile
+import time
+
+from terminal_football_manager.manager_mode import create_teams, serialize_manager_state
+from terminal_football_manager.persistence import JsonSaveBackend, BinarySaveBackend
+
+
+def bench(backend, teams, rounds=10):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        backend.write("Manager Mode", serialize_manager_state(teams, teams[0].name, 1))
+    save_time = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        mode, state = backend.read()
+    load_time = (time.perf_counter() - start) / rounds
+    assert mode == "Manager Mode" and len(state["all_club_teams"]) == len(teams)
+    return save_time, load_time, os.path.getsize(backend.path)
+
+
+def main():
+    random.seed(1)
+    teams = create_teams()
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            "json": bench(JsonSaveBackend(os.path.join(tmp, "save.json")), teams),
+            "binary": bench(BinarySaveBackend(os.path.join(tmp, "save.bin")), teams),
+        }
+    print(f"{'backend':8} {'save ms':>9} {'load ms':>9} {'size KiB':>9}")
+    for name, (save_time, load_time, size) in results.items():
+        print(f"{name:8} {save_time * 1000:9.1f} {load_time * 1000:9.1f} {size / 1024:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Startup cost of the terminal-football-manager entry point, from python -X importtime.
+
+Compares importing the entry point (terminal_football_manager.main) with
+importing everything the menu used to load eagerly. Each measurement runs in a
+fresh interpreter; the best of several runs is reported.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py
+"""
+import os
+import subprocess
+import sys
+
+RUNS = 5
+ENTRY_POINT = "import terminal_football_manager.main"
+EAGER = ("import terminal_football_manager.main, terminal_football_manager.manager_mode, "
+         "terminal_football_manager.player_career, terminal_football_manager.fut_mode")
+
+
+def import_times(statement):
+    """Returns {module: cumulative microseconds} for one fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def best_total(statement, module):
+    return min(import_times(statement)[module] for _ in range(RUNS))
+
+
+def main():
+    entry = best_total(ENTRY_POINT, "terminal_football_manager.main")
+    eager_times = [import_times(EAGER) for _ in range(RUNS)]
+    eager = min(sum(t.get(m, 0) for m in ("terminal_football_manager.main", "terminal_football_manager.manager_mode",
+                                           "terminal_football_manager.player_career", "terminal_football_manager.fut_mode"))
+                for t in eager_times)
+    slowest = sorted(import_times(ENTRY_POINT).items(), key=lambda item: item[1], reverse=True)[:8]
+
+    print(f"entry point import:     {entry / 1000:8.1f} ms")
+    print(f"all game modes import:  {eager / 1000:8.1f} ms")
+    print("slowest modules at startup (cumulative):")
+    for name, micros in slowest:
+        print(f"  {name:40} {micros / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
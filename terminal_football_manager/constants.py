@@ -4,6 +4,9 @@ import random
 
 # --- Player Data ---
 POSITIONS = ["GK", "CB", "LB", "RB", "CMF", "AMF", "LWF", "RWF", "CF", "SS", "RW", "LW", "CAM", "CDM", "ST"]
+DEFENDERS = {"CB", "LB", "RB"}
+MIDFIELDERS = {"CMF", "AMF", "CAM", "CDM"}
+FORWARDS = {"LWF", "RWF", "CF", "SS", "RW", "LW", "ST"}
 
 ATTRIBUTE_WEIGHTS = {
     "GK": {"goalkeeping": 0.5, "reflexes": 0.4, "handling": 0.3, "kicking": 0.2, "positioning": 0.3, "jumping": 0.1},
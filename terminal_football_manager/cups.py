@@ -0,0 +1,158 @@
+from collections import namedtuple
+import random
+
+import numpy as np
+
+from .match_engine import TeamProfiles, minute_goal_chances, play_goals
+from .ui import console
+
+# Knockout cup engine. Entrants are placed in a seeded bracket (seed 1 and 2 can
+# only meet in the final, top seeds get the byes when the field is not a power
+# of two) and every round is played as one batch through the match engine:
+# all first legs and second legs together, then extra time for every level tie
+# at once, then penalty shootouts for whatever is still level. Cup matches do
+# not count towards league stats.
+
+EXTRA_TIME_MINUTES = 30
+PENALTY_KICKS = 5
+PENALTY_CONVERSION = 0.75
+
+TieResult = namedtuple("TieResult", ["team_a", "team_b", "goals_a", "goals_b", "legs", "extra_time", "penalties", "winner"])
+CupResult = namedtuple("CupResult", ["name", "winner", "runner_up", "semi_finalists", "rounds"])
+
+def seed_by_ovr(teams):
+    """Entrants ordered as seeds, strongest squad first."""
+    return sorted(teams, key=lambda t: t.get_team_ovr(), reverse=True)
+
+def bracket_order(size):
+    """Seed numbers (1-based) in bracket slot order for a power-of-two ``size``."""
+    order = [1]
+    while len(order) < size:
+        order = [s for seed in order for s in (seed, 2 * len(order) + 1 - seed)]
+    return order
+
+def round_name(n_teams):
+    return {2: "Final", 4: "Semi-finals", 8: "Quarter-finals"}.get(n_teams, f"Round of {n_teams}")
+
+def penalty_shootout(n, rng):
+    """Returns (a, b) penalty scores for n shootouts: five kicks each, then sudden death."""
+    a = rng.binomial(PENALTY_KICKS, PENALTY_CONVERSION, n)
+    b = rng.binomial(PENALTY_KICKS, PENALTY_CONVERSION, n)
+    level = np.flatnonzero(a == b)
+    while level.size:
+        a[level] += rng.random(level.size) < PENALTY_CONVERSION
+        b[level] += rng.random(level.size) < PENALTY_CONVERSION
+        level = level[a[level] == b[level]]
+    return a, b
+
+def play_ties(ties, legs, rng):
+    """Plays a round of (team_a, team_b) ties in one batch; team_a hosts the first leg.
+
+    Returns a TieResult per tie. With two legs the aggregate decides; extra
+    time is played at the end of the last leg and penalties follow.
+    """
+    n = len(ties)
+    profiles = TeamProfiles({id(t): t for tie in ties for t in tie}.values())
+    a_idx = np.array([profiles.index[id(a)] for a, _ in ties], dtype=np.int64)
+    b_idx = np.array([profiles.index[id(b)] for _, b in ties], dtype=np.int64)
+    home = np.concatenate((a_idx, b_idx)) if legs == 2 else a_idx
+    away = np.concatenate((b_idx, a_idx)) if legs == 2 else b_idx
+    home_chance, away_chance = minute_goal_chances(profiles.ovr[home], profiles.ovr[away],
+                                                   profiles.finishing[home], profiles.finishing[away])
+    home_goals, away_goals = play_goals(home_chance, away_chance, rng=rng)
+    goals_a = home_goals[:n] + (away_goals[n:] if legs == 2 else 0)
+    goals_b = away_goals[:n] + (home_goals[n:] if legs == 2 else 0)
+
+    # Extra time for every level tie at once, in the last leg's fixture
+    level = np.flatnonzero(goals_a == goals_b)
+    extra_time = np.zeros(n, dtype=bool)
+    extra_time[level] = True
+    if level.size:
+        last = slice(n, 2 * n) if legs == 2 else slice(0, n)
+        et_home, et_away = play_goals(home_chance[last][level], away_chance[last][level], minutes=EXTRA_TIME_MINUTES, rng=rng)
+        goals_a[level] += et_away if legs == 2 else et_home
+        goals_b[level] += et_home if legs == 2 else et_away
+
+    shootout = np.flatnonzero(goals_a == goals_b)
+    pens_a, pens_b = penalty_shootout(shootout.size, rng)
+    penalties = dict(zip(shootout.tolist(), zip(pens_a.tolist(), pens_b.tolist())))
+
+    leg_scores = list(zip(home_goals.tolist(), away_goals.tolist()))
+    results = []
+    for i, (a, b) in enumerate(ties):
+        ga, gb = int(goals_a[i]), int(goals_b[i])
+        pens = penalties.get(i)
+        a_wins = ga > gb if pens is None else pens[0] > pens[1]
+        legs_played = [leg_scores[i], leg_scores[n + i]] if legs == 2 else [leg_scores[i]]
+        results.append(TieResult(a, b, ga, gb, legs_played, bool(extra_time[i]), pens, a if a_wins else b))
+    return results
+
+def loser(result):
+    return result.team_b if result.winner is result.team_a else result.team_a
+
+def format_tie(result, user_team=None):
+    detail = " agg" if len(result.legs) == 2 else ""
+    if result.penalties:
+        detail += f", {result.penalties[0]}-{result.penalties[1]} pens"
+    elif result.extra_time:
+        detail += ", a.e.t."
+    line = f"{result.team_a.name} {result.goals_a}-{result.goals_b} {result.team_b.name}" + (f" ({detail.strip(', ')})" if detail else "")
+    if user_team is not None and user_team in (result.team_a, result.team_b):
+        return f"[bold yellow]{line}[/bold yellow]"
+    return line
+
+def pay_prizes(result, prizes, entrants, user_team=None, pay_participation=True):
+    """Pays ``prizes`` ("participation", "semi_finalist", "runner_up", "winner"; each optional) to the clubs that earned them."""
+    earned = {}
+    if pay_participation and prizes.get("participation"):
+        for team in entrants:
+            earned[id(team)] = [team, prizes["participation"]]
+    placings = [("winner", [result.winner]), ("runner_up", [result.runner_up]), ("semi_finalist", result.semi_finalists)]
+    for key, teams in placings:
+        for team in teams:
+            if team is not None and prizes.get(key):
+                earned.setdefault(id(team), [team, 0])[1] += prizes[key]
+    for team, amount in earned.values():
+        team.budget += amount
+        if team is user_team:
+            console.print(f"[green]Your club earned €{amount:,} in {result.name} prize money![/green]")
+
+def run_knockout(seeds, name, prizes=None, legs=1, final_legs=1, user_team=None, pay_participation=True, rng=None):
+    """Plays a knockout cup between ``seeds`` (strongest first) and pays out ``prizes``.
+
+    ``legs`` applies to every round but the final, which has ``final_legs``.
+    Returns a CupResult, or None with fewer than two entrants.
+    """
+    seeds = list(seeds)
+    if len(seeds) < 2:
+        return None
+    rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64)) # Follows the seeded global RNG
+    size = 1 << (len(seeds) - 1).bit_length()
+    bracket = [seeds[s - 1] if s <= len(seeds) else None for s in bracket_order(size)]
+
+    rounds = []
+    semi_finalists = []
+    runner_up = None
+    while len(bracket) > 1:
+        title = round_name(len(bracket))
+        pairs = [(bracket[i], bracket[i + 1]) for i in range(0, len(bracket), 2)]
+        ties = [(a, b) for a, b in pairs if a is not None and b is not None]
+        results = play_ties(ties, final_legs if len(bracket) == 2 else legs, rng) if ties else []
+        winners = iter(r.winner for r in results)
+        bracket = [next(winners) if a is not None and b is not None else (a if a is not None else b) for a, b in pairs]
+        rounds.append((title, results))
+
+        console.print(f"\n[bold blue]{name} - {title}[/bold blue]")
+        for result in results:
+            console.print(format_tie(result, user_team))
+        if title == "Semi-finals":
+            semi_finalists = [loser(r) for r in results]
+        if title == "Final":
+            runner_up = loser(results[0])
+
+    winner = bracket[0]
+    console.print(f"🏆 [bold green]{winner.name}[/bold green] has won the {name}!")
+    result = CupResult(name, winner, runner_up, semi_finalists, rounds)
+    if prizes:
+        pay_prizes(result, prizes, seeds, user_team, pay_participation)
+    return result
@@ -0,0 +1,254 @@
+from abc import ABC, abstractmethod
+
+from .constants import TRAINER_TIERS
+from .transfer_market import transfer
+from .ui import console
+
+# Every Manager Mode decision that used to block on console.input goes through
+# a DecisionPolicy. InteractivePolicy keeps the original prompts and menus;
+# GreedyPolicy plays the user's club like a sensible AI; ScriptedPolicy replays
+# canned answers (falling back to another policy once they run out), so whole
+# careers can run unattended for balance regression and soak testing.
+
+SENIOR_SQUAD_LIMIT = 22 # Youth promotions stop at this squad size
+TRANSFER_SQUAD_LIMIT = 30 # Same cap the AI clubs buy up to
+WAGE_RESERVE_MATCHDAYS = 40 # Automated policies never spend the wages of this many matchdays
+SEASON_SPEND_SHARE = 0.25 # GreedyPolicy spends at most this share of its start-of-season surplus per season
+MIN_SENIOR_SQUAD = 18 # GreedyPolicy never sells below this squad size to cut wages
+
+class DecisionPolicy(ABC):
+    """Decides on behalf of the user's club.
+
+    Subclasses implement the abstract decision methods; the helpers below carry
+    out the resulting actions exactly like the interactive menus do.
+    """
+    interactive = False
+
+    @abstractmethod
+    def accept_sponsorship(self, team, offer):
+        """Returns True to accept a start-of-season sponsorship of ``offer``."""
+
+    @abstractmethod
+    def manage_club(self, team):
+        """Runs the matchday management step: facility upgrades and special training."""
+
+    def before_matchday(self, team):
+        """Called right before each matchday is simulated."""
+
+    @abstractmethod
+    def promote_youth(self, team):
+        """Runs the start-of-season youth promotions."""
+
+    @abstractmethod
+    def transfer_business(self, team, market, other_teams, all_club_teams, scouting=None):
+        """Does the user's business in a transfer window with the AI listings in ``market``.
+
+        ``scouting`` is the season's ScoutingIndex of every club's players, when there is one.
+        """
+
+    @abstractmethod
+    def choose_job_offer(self, team, offers):
+        """Returns the accepted offer from ``offers`` or None to stay."""
+
+    # --- Actions ---
+
+    @staticmethod
+    def spendable(team):
+        return team.budget - team.total_wage_bill * WAGE_RESERVE_MATCHDAYS
+
+    @staticmethod
+    def upgrade_cost(team, facility):
+        return (200_000 if facility == "stadium" else 150_000) * getattr(team, f"{facility}_level")
+
+    @classmethod
+    def upgrade(cls, team, facility):
+        """Upgrades "stadium" or "academy" one level if affordable; returns True on success."""
+        level = getattr(team, f"{facility}_level")
+        cost = cls.upgrade_cost(team, facility)
+        if level >= 100 or team.budget < cost:
+            return False
+        team.budget -= cost
+        setattr(team, f"{facility}_level", level + 1)
+        return True
+
+    @staticmethod
+    def assign_trainer(team, player, tier):
+        """Assigns the 1-based trainer ``tier`` to ``player`` if affordable; returns True on success."""
+        cost = list(TRAINER_TIERS.values())[tier - 1]["cost"]
+        if player.trainer_level > 0 or team.budget < cost:
+            return False
+        team.budget -= cost
+        player.trainer_level = tier
+        return True
+
+    @staticmethod
+    def promote(team, player):
+        if len(team.players) >= SENIOR_SQUAD_LIMIT:
+            return False
+        team.youth_academy.remove(player)
+        team.add_player(player)
+        return True
+
+    @staticmethod
+    def sell(team, player, buyer, fee):
+        """Sells ``player`` to ``buyer`` for ``fee`` if the buyer can pay and has room; returns True on success."""
+        if buyer.budget < fee or len(buyer.players) >= TRANSFER_SQUAD_LIMIT:
+            return False
+        transfer(player, team, buyer, fee)
+        return True
+
+    @staticmethod
+    def buy(team, listing, market):
+        """Buys a ``market`` listing at its fee; returns True on success."""
+        if team.budget < listing.fee or len(team.players) >= TRANSFER_SQUAD_LIMIT:
+            return False
+        market.complete(listing, team)
+        return True
+
+
+class InteractivePolicy(DecisionPolicy):
+    """Asks the user at the terminal, as the game always has."""
+    interactive = True
+
+    def accept_sponsorship(self, team, offer):
+        return console.input("[bold yellow]Accept sponsorship? (yes/no):[/bold yellow] ").lower() == 'yes'
+
+    def manage_club(self, team):
+        from .manager_mode import run_management_menu # manager_mode imports this module
+        run_management_menu(team)
+
+    def before_matchday(self, team):
+        console.input("\n[bold green]Press Enter to simulate the next matchday...[/bold green]")
+
+    def promote_youth(self, team):
+        from .manager_mode import run_youth_promotions
+        run_youth_promotions(team)
+
+    def transfer_business(self, team, market, other_teams, all_club_teams, scouting=None):
+        from .manager_mode import run_transfer_menu
+        run_transfer_menu(team, market, other_teams, all_club_teams, scouting)
+
+    def choose_job_offer(self, team, offers):
+        choice = console.input("[bold yellow]Enter the number of the offer to accept, or 0 to decline all offers:[/bold yellow] ")
+        try:
+            choice_idx = int(choice) - 1
+        except ValueError:
+            console.print("[red]Invalid input. All offers declined. You remain at your current club.[/red]")
+            return None
+        if 0 <= choice_idx < len(offers):
+            return offers[choice_idx]
+        console.print("[yellow]All offers declined. You remain at your current club.[/yellow]")
+        return None
+
+
+class GreedyPolicy(DecisionPolicy):
+    """Takes every decision that looks good right now, within a season allowance and a wage reserve.
+
+    Each season it spends at most SEASON_SPEND_SHARE of what it holds above the
+    wage reserve at the start of the season, and whenever the budget falls
+    below the reserve it sells bench players to cut the wage bill.
+    """
+
+    def __init__(self):
+        self.allowance = 0 # Left to spend this season, set when the season's sponsorship comes in
+
+    def _can_spend(self, team, cost):
+        return cost <= min(self.allowance, self.spendable(team))
+
+    def accept_sponsorship(self, team, offer):
+        self.allowance = SEASON_SPEND_SHARE * max(0, self.spendable(team) + offer)
+        return True
+
+    def manage_club(self, team):
+        budget = team.budget
+        for facility in ("stadium", "academy"):
+            if self._can_spend(team, self.upgrade_cost(team, facility)):
+                self.upgrade(team, facility)
+        untrained = [p for p in team.players if p.trainer_level == 0]
+        if untrained:
+            player = max(untrained, key=lambda p: p.potential - p.ovr)
+            for tier in range(len(TRAINER_TIERS), 0, -1):
+                if self._can_spend(team, list(TRAINER_TIERS.values())[tier - 1]["cost"]):
+                    self.assign_trainer(team, player, tier)
+                    break
+        self.allowance -= budget - team.budget
+
+    def promote_youth(self, team):
+        for player in sorted(team.youth_academy, key=lambda p: p.ovr, reverse=True):
+            if not self.promote(team, player):
+                break
+
+    def transfer_business(self, team, market, other_teams, all_club_teams, scouting=None):
+        self.cut_wages(team, other_teams)
+        # Sign the best listed player who would lift the starting 11
+        candidates = [l for l in market.in_ovr_range(int(team.get_team_ovr()) + 1) if self._can_spend(team, l.fee)]
+        if candidates:
+            budget = team.budget
+            self.buy(team, max(candidates, key=lambda l: l.player.ovr), market)
+            self.allowance -= budget - team.budget
+
+    def cut_wages(self, team, other_teams):
+        """Sells the best-paid bench players to the richest clubs that can pay while the wage reserve is short."""
+        buyers = sorted(other_teams, key=lambda t: t.budget, reverse=True)
+        while self.spendable(team) < 0 and len(team.players) > MIN_SENIOR_SQUAD:
+            starters = set(map(id, sorted(team.players, key=lambda p: p.ovr, reverse=True)[:team.STARTING_XI]))
+            player = max((p for p in team.players if id(p) not in starters), key=lambda p: p.salary)
+            fee = player.market_value
+            if not any(self.sell(team, player, buyer, fee) for buyer in buyers):
+                break
+
+    def choose_job_offer(self, team, offers):
+        best = max(offers, key=lambda offer: offer["club"].get_team_ovr())
+        return best if best["club"].get_team_ovr() > team.get_team_ovr() else None
+
+
+class ScriptedPolicy(DecisionPolicy):
+    """Replays scripted answers per decision, then defers to ``fallback``.
+
+    ``script`` maps a decision method name to a list of answers, one per call:
+    accept_sponsorship takes a bool, choose_job_offer an offer index or None,
+    manage_club a list of "stadium"/"academy" upgrades, promote_youth a list of
+    youth player names and transfer_business a list of listed player names to buy.
+    """
+
+    def __init__(self, script, fallback=None):
+        self.script = {decision: list(answers) for decision, answers in script.items()}
+        self.fallback = fallback if fallback is not None else GreedyPolicy()
+
+    def _next(self, decision):
+        answers = self.script.get(decision)
+        return answers.pop(0) if answers else None
+
+    def accept_sponsorship(self, team, offer):
+        answer = self._next("accept_sponsorship")
+        return self.fallback.accept_sponsorship(team, offer) if answer is None else answer
+
+    def manage_club(self, team):
+        answer = self._next("manage_club")
+        if answer is None:
+            return self.fallback.manage_club(team)
+        for facility in answer:
+            self.upgrade(team, facility)
+
+    def before_matchday(self, team):
+        self.fallback.before_matchday(team)
+
+    def promote_youth(self, team):
+        answer = self._next("promote_youth")
+        if answer is None:
+            return self.fallback.promote_youth(team)
+        for player in [p for p in team.youth_academy if p.name in answer]:
+            self.promote(team, player)
+
+    def transfer_business(self, team, market, other_teams, all_club_teams, scouting=None):
+        answer = self._next("transfer_business")
+        if answer is None:
+            return self.fallback.transfer_business(team, market, other_teams, all_club_teams, scouting)
+        for listing in [l for l in market if l.player.name in answer]:
+            self.buy(team, listing, market)
+
+    def choose_job_offer(self, team, offers):
+        if not self.script.get("choose_job_offer"):
+            return self.fallback.choose_job_offer(team, offers)
+        index = self._next("choose_job_offer")
+        return offers[index] if index is not None and 0 <= index < len(offers) else None
@@ -0,0 +1,111 @@
+import random
+
+import numpy as np
+
+from .constants import TRAINER_TIERS
+
+# Batch off-season development. Ageing, growth towards potential, decline,
+# trainer boosts and retirements are computed for every player in the world at
+# once with NumPy, using the same rules the per-player loop always applied:
+#
+#   under 24  grow 1..min(5, room // divisor) while below potential, else 0..1
+#   24-29     0..+1      30-32  -1..0      33+  -3..-1
+#
+# Senior players add their trainer's boost and move one random attribute a
+# point per OVR gained or lost; academy players grow faster (divisor 4) but get
+# neither. OVRs are written straight to the players and each squad's rating is
+# invalidated once (bumping its squad_version) instead of once per player.
+
+RETIREMENT_AGE = 40
+MIN_OVR = 10
+ATTRIBUTE_MIN = 10
+ATTRIBUTE_MAX = 125
+SENIOR_GROWTH_DIVISOR = 5
+YOUTH_GROWTH_DIVISOR = 4
+
+# Indexed by trainer_level (0 = no trainer)
+TRAINER_BOOSTS = np.array([0] + [tier["boost"] for tier in TRAINER_TIERS.values()], dtype=np.int64)
+
+def ovr_change_range(age, ovr, potential, growth_divisor):
+    """Inclusive (low, high) bounds of each player's OVR change at their new ``age``."""
+    room = potential - ovr
+    young = age < 24
+    growing = young & (room > 0)
+    conditions = [growing, young, age <= 29, age <= 32]
+    low = np.select(conditions, [1, 0, 0, -1], -3)
+    high = np.select(conditions, [np.minimum(5, np.maximum(1, room // growth_divisor)), 1, 1, 0], -1)
+    return low, high
+
+def shift_attributes(players, change, rng):
+    """Moves a random attribute one point per unit of ``change`` for each player, in bulk."""
+    steps = np.abs(change)
+    groups = {} # attribute key tuple -> row indices of the players sharing it
+    for i in np.flatnonzero(steps).tolist():
+        groups.setdefault(players[i]._attribute_keys, []).append(i)
+    for keys, rows in groups.items():
+        k = len(keys)
+        values = np.frombuffer(b"".join(players[i]._attribute_values for i in rows), dtype="<i2")
+        values = values.reshape(len(rows), k).astype(np.int64)
+        counts = rng.multinomial(steps[rows], np.full(k, 1 / k))
+        # Same result as clamping after every single step, starting from an out-of-range value too
+        up = np.clip(values + counts, ATTRIBUTE_MIN, ATTRIBUTE_MAX)
+        down = np.clip(np.minimum(values, ATTRIBUTE_MAX + 1) - counts, ATTRIBUTE_MIN, ATTRIBUTE_MAX)
+        shifted = np.where(counts == 0, values, np.where(change[rows, None] > 0, up, down))
+        packed = shifted.astype("<i2").tobytes()
+        for j, i in enumerate(rows):
+            players[i]._attribute_values = packed[2 * k * j:2 * k * (j + 1)]
+
+def develop_players(players, growth_divisor, rng, trained=False):
+    """Ages ``players`` a year and applies their OVR changes; returns the array of changes.
+
+    With ``trained``, trainer boosts and attribute shifts are applied and trainers
+    are reset. Players reaching RETIREMENT_AGE are aged but otherwise left alone.
+    """
+    n = len(players)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    age = np.fromiter((p.age for p in players), dtype=np.int64, count=n) + 1
+    ovr = np.fromiter((p.ovr for p in players), dtype=np.int64, count=n)
+    potential = np.fromiter((p.potential for p in players), dtype=np.int64, count=n)
+    low, high = ovr_change_range(age, ovr, potential, growth_divisor)
+    change = rng.integers(low, high + 1)
+    if trained:
+        trainer = np.fromiter((p.trainer_level for p in players), dtype=np.int64, count=n)
+        change += TRAINER_BOOSTS[np.clip(trainer, 0, len(TRAINER_BOOSTS) - 1)]
+    change[age >= RETIREMENT_AGE] = 0
+    new_ovr = np.maximum(MIN_OVR, ovr + change)
+    if trained:
+        shift_attributes(players, change, rng)
+    for player, player_age, player_ovr in zip(players, age.tolist(), new_ovr.tolist()):
+        player.age = player_age
+        player._ovr = player_ovr # Squads are invalidated once each in develop_world
+        if trained:
+            player.trainer_level = 0
+    return change
+
+def develop_world(teams, rng=None):
+    """Runs the off-season development of every senior and academy player in ``teams``.
+
+    Retired players are taken off their squads. Returns a list of
+    (team, player, is_youth) for every retirement.
+    """
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64)) # Follows the seeded global RNG
+    teams = list(teams)
+    develop_players([p for t in teams for p in t.players], SENIOR_GROWTH_DIVISOR, rng, trained=True)
+    develop_players([p for t in teams for p in t.youth_academy], YOUTH_GROWTH_DIVISOR, rng)
+
+    retired = []
+    for team in teams:
+        leaving = [p for p in team.players if p.age >= RETIREMENT_AGE]
+        if leaving:
+            team.players[:] = [p for p in team.players if p.age < RETIREMENT_AGE]
+            for player in leaving:
+                player.team = None
+            retired.extend((team, p, False) for p in leaving)
+        leaving = [p for p in team.youth_academy if p.age >= RETIREMENT_AGE]
+        if leaving:
+            team.youth_academy[:] = [p for p in team.youth_academy if p.age < RETIREMENT_AGE]
+            retired.extend((team, p, True) for p in leaving)
+        team._invalidate_rating()
+    return retired
@@ -0,0 +1,114 @@
+from collections import namedtuple
+import random
+
+import numpy as np
+from rich.table import Table
+
+from .match_engine import TeamProfiles, minute_goal_chances, play_goals
+from .parallel import submit, default_workers
+from .ui import console
+
+# Monte Carlo forecast of a league's remaining season. The league is reduced to
+# a LeagueSnapshot of plain arrays (current table plus per-fixture goal chances)
+# so each worker process receives a few kilobytes instead of the Team/Player
+# object graph, and rollouts are played as whole (rollouts x fixtures) batches.
+
+LeagueSnapshot = namedtuple("LeagueSnapshot", [
+    "names", "points", "goal_difference", "goals_for",
+    "home_idx", "away_idx", "home_chance", "away_chance"
+])
+
+SeasonForecast = namedtuple("SeasonForecast", ["names", "position_probs", "rollouts", "relegation_spots"])
+
+ROLLOUT_CHUNK = 2_000 # Rollouts per array batch, bounds worker memory
+
+def snapshot_league(league, remaining_fixtures=None):
+    """Builds a picklable snapshot from a League's current table and its unplayed fixtures."""
+    if remaining_fixtures is None:
+        remaining_fixtures = league.fixtures[league.matchdays_played:]
+    teams = list(league.table) if league.table else list(league.teams.values())
+    profiles = TeamProfiles(teams)
+    fixtures = [(h, a) for matchday in remaining_fixtures for h, a in matchday if h is not None and a is not None]
+    home_idx = np.array([profiles.index[id(h)] for h, _ in fixtures], dtype=np.int64)
+    away_idx = np.array([profiles.index[id(a)] for _, a in fixtures], dtype=np.int64)
+    home_chance, away_chance = minute_goal_chances(
+        profiles.ovr[home_idx], profiles.ovr[away_idx],
+        profiles.finishing[home_idx], profiles.finishing[away_idx]
+    )
+    return LeagueSnapshot(
+        tuple(t.name for t in teams),
+        np.array([t.points for t in teams], dtype=np.int64),
+        np.array([t.goal_difference for t in teams], dtype=np.int64),
+        np.array([t.goals_for for t in teams], dtype=np.int64),
+        home_idx, away_idx, home_chance, away_chance
+    )
+
+def run_rollouts(snapshot, rollouts, seed):
+    """Plays out the rest of the season ``rollouts`` times; returns a (team x position) count matrix."""
+    rng = np.random.default_rng(seed)
+    n = len(snapshot.names)
+    counts = np.zeros(n * n, dtype=np.int64)
+    home_idx, away_idx = snapshot.home_idx, snapshot.away_idx
+    # Incidence matrices turn per-fixture results into per-team totals with one matmul
+    home_of = np.zeros((len(home_idx), n), dtype=np.int64); home_of[np.arange(len(home_idx)), home_idx] = 1
+    away_of = np.zeros((len(away_idx), n), dtype=np.int64); away_of[np.arange(len(away_idx)), away_idx] = 1
+
+    done = 0
+    while done < rollouts:
+        size = min(ROLLOUT_CHUNK, rollouts - done)
+        shape = (size, len(home_idx))
+        hg, ag = play_goals(np.broadcast_to(snapshot.home_chance, shape), np.broadcast_to(snapshot.away_chance, shape), rng=rng)
+        home_pts = 3 * (hg > ag) + (hg == ag)
+        away_pts = 3 * (ag > hg) + (hg == ag)
+        points = snapshot.points + home_pts @ home_of + away_pts @ away_of
+        goal_difference = snapshot.goal_difference + (hg - ag) @ home_of + (ag - hg) @ away_of
+        goals_for = snapshot.goals_for + hg @ home_of + ag @ away_of
+
+        # Same ordering as League.update_table minus its head-to-head tie-break; remaining ties keep current table order
+        order = np.lexsort((-goals_for, -goal_difference, -points))
+        positions = np.empty_like(order)
+        np.put_along_axis(positions, order, np.arange(n), axis=1)
+        counts += np.bincount((np.arange(n) * n + positions).ravel(), minlength=n * n)
+        done += size
+    return counts.reshape(n, n)
+
+def forecast_season(league, remaining_fixtures=None, rollouts=10_000, relegation_spots=2, workers=None):
+    """Simulates the remainder of the season ``rollouts`` times across the process pool."""
+    snapshot = snapshot_league(league, remaining_fixtures)
+    n = len(snapshot.names)
+    seeds = np.random.SeedSequence(random.getrandbits(64))
+    if workers is None:
+        workers = default_workers()
+    if workers <= 1 or len(snapshot.home_idx) == 0:
+        counts = run_rollouts(snapshot, rollouts, seeds)
+    else:
+        chunks = [rollouts // workers + (1 if i < rollouts % workers else 0) for i in range(workers)]
+        futures = [submit(run_rollouts, snapshot, size, child) for size, child in zip(chunks, seeds.spawn(workers)) if size]
+        counts = sum(f.result() for f in futures)
+    return SeasonForecast(snapshot.names, counts / max(1, rollouts), rollouts, min(relegation_spots, n))
+
+def title_odds(forecast):
+    return dict(zip(forecast.names, forecast.position_probs[:, 0].tolist()))
+
+def relegation_odds(forecast):
+    if not forecast.relegation_spots: return {name: 0.0 for name in forecast.names}
+    return dict(zip(forecast.names, forecast.position_probs[:, -forecast.relegation_spots:].sum(axis=1).tolist()))
+
+def print_title_race(forecast, user_team_name=None, top=5):
+    titles = title_odds(forecast)
+    relegation = relegation_odds(forecast)
+    expected = forecast.position_probs @ np.arange(1, len(forecast.names) + 1)
+    contenders = sorted(forecast.names, key=lambda name: titles[name], reverse=True)[:top]
+    if user_team_name in forecast.names and user_team_name not in contenders:
+        contenders.append(user_team_name)
+
+    table = Table(title=f"Title Race ({forecast.rollouts:,} simulations)", show_header=True, header_style="bold magenta")
+    table.add_column("Team", style="cyan")
+    table.add_column("Title", justify="right", style="bold yellow")
+    table.add_column("Avg Pos", justify="right")
+    table.add_column("Relegation", justify="right", style="red")
+    for name in contenders:
+        i = forecast.names.index(name)
+        style = "bold green" if name == user_team_name else None
+        table.add_row(name, f"{titles[name]:.1%}", f"{expected[i]:.1f}", f"{relegation[name]:.1%}", style=style)
+    console.print(table)
@@ -1,4 +1,3 @@
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.layout import Layout
@@ -9,15 +8,14 @@ import time
 from datetime import datetime, timedelta
 
 from .fut_data import AGENT_TIERS, PLAYER_PACKS, STADIUM_NAMES, FUTPlayer, get_players_by_card_type, get_players_by_ovr_range, CHAMPIONS_LEAGUE_TEAMS_DATA, CHAMPIONS_LEAGUE_REWARDS, BIG_CLUBS_FUT_START, FUT_PLAYERS_DATA
-from .models import Player, Team
+from .models import Player, Team, RatedSquad
 from .constants import ATTRIBUTE_WEIGHTS, POSITIONS, FIRST_NAMES, LAST_NAMES, NATIONAL_FIRST_NAMES, NATIONAL_LAST_NAMES, COUNTRIES
 from .game_logic import League, generate_fixtures, assign_goal_scorers, simulate_match, reset_all_team_stats, reset_player_season_stats
-
-console = Console()
+from .ui import console
 
 from .persistence import save_game, load_game
 
-class FutClub:
+class FutClub(RatedSquad):
     def __init__(self, name, budget):
         self.name = name
         self.stadium_name = "The Arena"
@@ -63,7 +61,7 @@ class FutClub:
         club.season_fixtures = data.get("season_fixtures", [])
         club.my_bids = data.get("my_bids", [])
         for p_data in data["players"]:
-            club.players.append(Player.from_dict(p_data))
+            club.add_player(Player.from_dict(p_data)) # Sets player.team, so OVR changes reach the cached rating
         return club
 
     def add_player(self, player):
@@ -73,11 +71,6 @@ class FutClub:
     def add_budget(self, amount):
         self.budget += int(amount)
 
-    def get_team_ovr(self):
-        if not self.players: return 0
-        top_11 = sorted(self.players, key=lambda p: p.ovr, reverse=True)[:11]
-        return sum(p.ovr for p in top_11) / len(top_11)
-
 class Auction:
     def __init__(self, player, seller_name, start_bid, end_time):
         self.player = player
@@ -165,7 +158,7 @@ def view_match_status(fut_club):
                 fut_club.next_match_time = now + timedelta(minutes=10) # Cooldown
                 # Drain Stamina
                 for p in fut_club.players: p.stamina = max(10, p.stamina - random.randint(10, 25))
-                save_game("FUT", fut_club.to_dict())
+                save_game("FUT", fut_club.to_dict(), incremental=True)
         else:
             wait = fut_club.next_match_time - now
             console.print(f"[yellow]Squad is recovering. Next match available in {str(wait).split('.')[0]}.[/yellow]")
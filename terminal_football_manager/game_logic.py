@@ -1,14 +1,19 @@
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+import bisect
 import random
-import time
 
-from .models import Player, Team
-from .constants import ATTRIBUTE_WEIGHTS, POSITIONS, COUNTRIES, NATIONAL_FIRST_NAMES
+import numpy as np
 
-console = Console()
+from .models import Player, Team, saved_data
+from .match_events import MatchEvent, NULL_SINK, RichSink, KICKOFF, MINUTE, GOAL, MISS, FULL_TIME
+from .constants import ATTRIBUTE_WEIGHTS, POSITIONS, COUNTRIES, NATIONAL_FIRST_NAMES
+from .cups import CupResult, pay_prizes, run_knockout, seed_by_ovr
+from .group_stage import GROUP_SIZE, GroupStage, draw_groups
+from .national_teams import NATIONAL_TEAM_NAMES, generate_national_team_squad, simulate_world_cup
+from .leaderboards import first_choice_keeper, season_leaders, season_score
+from .match_engine import ASSIST_CHANCE
+from .ui import console
 
 # --- Constants & Prizes ---
 AWARD_PRIZES = {
@@ -18,13 +23,6 @@ AWARD_PRIZES = {
     "TOTS_PLAYER": 2_000_000
 }
 
-NATIONAL_TEAM_NAMES = [
-    "Brazil", "Germany", "Argentina", "France", "Italy", "Spain", "England", 
-    "Portugal", "Belgium", "Netherlands", "Uruguay", "Croatia", "Mexico", 
-    "USA", "Colombia", "Chile", "Sweden", "Switzerland", "Denmark", "Poland",
-    "Senegal", "Nigeria", "Egypt", "Japan", "South Korea", "Australia"
-]
-
 COMMENTARY = {
     "START": ["Kickoff! The atmosphere is electric at {stadium}.", "The referee blows the whistle and we are underway!"],
     "CHANCE": ["{player} finds some space in the box!", "A brilliant through ball by {player} splits the defense!", "{player} is clear on goal!"],
@@ -37,16 +35,109 @@ COMMENTARY = {
 }
 
 class League:
+    """A league's teams, fixtures and standings.
+
+    Standings are kept as a sorted list of (points, goal difference, goals for)
+    keys. record_result() marks the two teams of a fixture, and update_table()
+    re-files only the marked teams' keys with bisect, so a fixture costs two
+    O(log n) searches (plus the list shift, a memmove) rather than a sort of
+    every team. Positions are read straight off the keys: position() is a
+    bisect, and the full table is only assembled when it is read after a
+    change. Teams level on all three are ordered by a head-to-head mini-table
+    read from the per-pair results that record_result() accumulates.
+    """
     def __init__(self, teams):
         self.teams = {team.name: team for team in teams}
-        self.table = []
+        self._slot = {name: i for i, name in enumerate(self.teams)}
+        self._team_at = list(self.teams.values())
+        n = len(self.teams)
+        self.h2h_points = np.zeros((n, n), dtype=np.int64) # [i, j]: points team i took off team j
+        self.h2h_goals = np.zeros((n, n), dtype=np.int64) # [i, j]: goals team i scored against team j
+        self._keys = [] # Ascending (-points, -goal_difference, -goals_for, slot)
+        self._key_of = {}
+        self._changed = set(range(n)) # Slots whose keys update_table() has to re-file
+        self._table = None # Assembled on first read after a change
         self.fixtures = []
+        self.matchdays_played = 0
         self.update_table()
 
+    @staticmethod
+    def _standing(team):
+        return (-team.points, -team.goal_difference, -team.goals_for)
+
+    def record_result(self, home, away, home_goals, away_goals):
+        """Adds a played fixture to the head-to-head record and marks both teams for update_table()."""
+        h, a = self._slot.get(home.name), self._slot.get(away.name)
+        if h is None or a is None:
+            return
+        self.h2h_goals[h, a] += home_goals
+        self.h2h_goals[a, h] += away_goals
+        self.h2h_points[h, a] += 3 if home_goals > away_goals else 1 if home_goals == away_goals else 0
+        self.h2h_points[a, h] += 3 if away_goals > home_goals else 1 if home_goals == away_goals else 0
+        self._changed.update((h, a))
+
     def update_table(self):
-        self.table = sorted(list(self.teams.values()), key=lambda t: (t.points, t.goal_difference, t.goals_for), reverse=True)
+        """Re-files the teams recorded since the last call (team stats are updated by the match engines)."""
+        for slot in self._changed:
+            key = self._standing(self._team_at[slot]) + (slot,)
+            old = self._key_of.get(slot)
+            if old == key:
+                continue
+            if old is not None:
+                del self._keys[bisect.bisect_left(self._keys, old)]
+            bisect.insort(self._keys, key)
+            self._key_of[slot] = key
+        if self._changed:
+            self._table = None # Head-to-head order may have changed even where keys did not
+            self._changed.clear()
+
+    def _tie_group(self, i):
+        """(start, end) of the run of keys level with ``self._keys[i]`` on points, GD and goals."""
+        level = self._keys[i][:3]
+        return bisect.bisect_left(self._keys, level), bisect.bisect_left(self._keys, level + (len(self._keys),))
+
+    def _ordered_group(self, start, end):
+        slots = [key[3] for key in self._keys[start:end]]
+        return self._head_to_head(slots) if len(slots) > 1 else slots
 
-    def print_table(self):
+    @property
+    def table(self):
+        """Teams in standings order as of the last update_table()."""
+        if self._table is None:
+            table = []
+            i = 0
+            while i < len(self._keys):
+                start, end = self._tie_group(i)
+                table.extend(self._team_at[slot] for slot in self._ordered_group(start, end))
+                i = end
+            self._table = table
+        return self._table
+
+    def team_at(self, position):
+        """The team at 1-based table ``position``."""
+        start, end = self._tie_group(position - 1)
+        return self._team_at[self._ordered_group(start, end)[position - 1 - start]]
+
+    def _head_to_head(self, slots):
+        """Orders tied teams by points, goal difference and goals in the games between them."""
+        idx = np.array(slots)
+        points = self.h2h_points[np.ix_(idx, idx)].sum(axis=1)
+        goals = self.h2h_goals[np.ix_(idx, idx)]
+        scored, conceded = goals.sum(axis=1), goals.sum(axis=0)
+        order = np.lexsort((-scored, -(scored - conceded), -points)) # Stable: full ties keep slot order
+        return [slots[k] for k in order.tolist()]
+
+    def position(self, team):
+        """1-based table position of ``team`` as of the last update_table()."""
+        slot = self._slot.get(team.name)
+        if slot is None or slot not in self._key_of:
+            return None
+        i = bisect.bisect_left(self._keys, self._key_of[slot])
+        start, end = self._tie_group(i)
+        return start + 1 + (self._ordered_group(start, end).index(slot) if end - start > 1 else 0)
+
+    def print_table(self, focus=None, around=2):
+        """Prints the standings; with ``focus`` only the leader and the rows around that team."""
         table = Table(title="League Standings", show_header=True, header_style="bold magenta")
         table.add_column("#", style="dim")
         table.add_column("Team", style="cyan")
@@ -56,8 +147,14 @@ class League:
         table.add_column("L", justify="right")
         table.add_column("GD", justify="right")
         table.add_column("Pts", justify="right", style="bold yellow")
-        for i, team in enumerate(self.table, 1):
-            table.add_row(str(i), team.name, str(team.games_played), str(team.wins), str(team.draws), str(team.losses), str(team.goal_difference), str(team.points))
+        rows = range(1, len(self._keys) + 1)
+        pos = self.position(focus) if focus is not None else None
+        if pos:
+            rows = sorted({1} | set(range(max(1, pos - around), min(len(self._keys), pos + around) + 1)))
+        for i in rows:
+            team = self.team_at(i) if pos else self.table[i - 1] # A focused view reads only its rows
+            style = "bold green" if team is focus else None
+            table.add_row(str(i), team.name, str(team.games_played), str(team.wins), str(team.draws), str(team.losses), str(team.goal_difference), str(team.points), style=style)
         console.print(table)
 
 def generate_fixtures(teams):
@@ -90,13 +187,20 @@ def assign_goal_scorers(team, goals):
         scorer = random.choice(team.players)
         scorer.season_goals += 1
 
-def simulate_match(home_team, away_team, is_international_match=False, user_team_ref=None):
+def simulate_match(home_team, away_team, is_international_match=False, user_team_ref=None, sink=None, leaderboards=None):
+    """Plays a single match minute by minute, emitting match events to ``sink``.
+
+    Without an explicit sink, matches involving the user's team are rendered live
+    and all other fixtures run silently. Goals, assists and clean sheets are filed
+    in ``leaderboards`` (e.g. season_leaders) only when it is given, so matches
+    outside the career world (FUT) stay off the season's boards.
+    """
     if home_team is None or away_team is None: return 0, 0
-    is_user_involved = user_team_ref and (home_team == user_team_ref or away_team == user_team_ref)
-    stadium = getattr(home_team, 'stadium_name', f"{home_team.name} Stadium")
-    
-    if is_user_involved:
-        console.print(Panel(f"[bold green]{home_team.name} vs {away_team.name}[/bold green]\n[cyan]Venue: {stadium}[/cyan]"))
+    if sink is None:
+        is_user_involved = user_team_ref and (home_team == user_team_ref or away_team == user_team_ref)
+        sink = RichSink(console) if is_user_involved else NULL_SINK
+    verbose = sink.verbose
+    sink.emit(MatchEvent(KICKOFF, 0, home_team, away_team))
     
     home_goals, away_goals = 0, 0
     home_ovr, away_ovr = home_team.get_team_ovr(), away_team.get_team_ovr()
@@ -106,26 +210,27 @@ def simulate_match(home_team, away_team, is_international_match=False, user_team
     if not home_eligible: home_eligible = home_team.players
     if not away_eligible: away_eligible = away_team.players
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-        task = progress.add_task("Match in progress...", total=90) if is_user_involved else None
-        for minute in range(1, 91):
-            if is_user_involved: 
-                progress.update(task, advance=1, description=f"Minute {minute}' - {home_goals}:{away_goals}")
-                if minute % 15 == 0: time.sleep(0.1)
-
-            if random.random() < 0.1: # 10% event chance
-                att_team = home_team if random.random() < (home_ovr/(home_ovr+away_ovr)) else away_team
-                pool = home_eligible if att_team == home_team else away_eligible
-                if not pool: continue
-                player = random.choice(pool)
-                
-                if random.random() < (player.ovr / 220): # Scoring logic
-                    if is_user_involved: console.print(f"{minute}' [bold red]GOAL! {player.name} scores for {att_team.name}![/bold red]")
-                    if att_team == home_team: home_goals += 1
-                    else: away_goals += 1
-                    player.season_goals += 1
-                elif is_user_involved and random.random() < 0.2:
-                    console.print(f"{minute}' {player.name} misses a great opportunity!")
+    for minute in range(1, 91):
+        if verbose: sink.emit(MatchEvent(MINUTE, minute, home_team, away_team, home_goals=home_goals, away_goals=away_goals))
+
+        if random.random() < 0.1: # 10% event chance
+            att_team = home_team if random.random() < (home_ovr/(home_ovr+away_ovr)) else away_team
+            pool = home_eligible if att_team == home_team else away_eligible
+            if not pool: continue
+            player = random.choice(pool)
+            
+            if random.random() < (player.ovr / 220): # Scoring logic
+                if att_team == home_team: home_goals += 1
+                else: away_goals += 1
+                player.season_goals += 1
+                assister = random.choice(pool) if random.random() < ASSIST_CHANCE else None
+                if assister is not None and assister is not player: # Drawing the scorer means an unassisted goal
+                    assister.season_assists += 1
+                    if leaderboards is not None: leaderboards.record(assister)
+                if leaderboards is not None: leaderboards.record(player)
+                sink.emit(MatchEvent(GOAL, minute, home_team, away_team, att_team, player, home_goals, away_goals))
+            elif verbose and random.random() < 0.2:
+                sink.emit(MatchEvent(MISS, minute, home_team, away_team, att_team, player, home_goals, away_goals))
 
     home_team.games_played += 1; away_team.games_played += 1
     home_team.goals_for += home_goals; home_team.goals_against += away_goals
@@ -136,30 +241,101 @@ def simulate_match(home_team, away_team, is_international_match=False, user_team
         away_team.wins += 1; away_team.points += 3; home_team.losses += 1
     else:
         home_team.draws += 1; home_team.points += 1; away_team.draws += 1; away_team.points += 1
+    for conceded, eligible in ((away_goals, home_eligible), (home_goals, away_eligible)):
+        keeper = first_choice_keeper(eligible) if conceded == 0 else None
+        if keeper is not None:
+            keeper.season_clean_sheets += 1
+            if leaderboards is not None: leaderboards.record(keeper)
     
-    if is_user_involved:
-        console.print(f"[bold green]FT: {home_team.name} {home_goals} - {away_goals} {away_team.name}[/bold green]")
+    sink.emit(MatchEvent(FULL_TIME, 90, home_team, away_team, home_goals=home_goals, away_goals=away_goals))
     return home_goals, away_goals
 
+TABLE_STATS = ("points", "games_played", "wins", "draws", "losses", "goals_for", "goals_against")
+SEASON_STATS = ("season_goals", "season_assists", "season_clean_sheets")
+
 def reset_all_team_stats(teams):
     for t in teams:
+        saved = saved_data(t)
+        if saved is not None: # Unbuilt stubs are reset in their saved dict, without building them
+            saved.update(dict.fromkeys(TABLE_STATS, 0))
+            continue
         t.points = 0; t.games_played = 0; t.wins = 0; t.draws = 0; t.losses = 0; t.goals_for = 0; t.goals_against = 0
 
 def reset_player_season_stats(teams):
     for t in teams:
-        for p in t.players: p.season_goals = 0; p.season_clean_sheets = 0
+        saved = saved_data(t)
+        if saved is not None:
+            for p_data in saved["players"]: p_data.update(dict.fromkeys(SEASON_STATS, 0))
+            continue
+        for p in t.players: p.season_goals = 0; p.season_assists = 0; p.season_clean_sheets = 0
+
+def club_name(player):
+    return player.team.name if player.team is not None else "Free agent"
+
+def print_top_scorers(user_team_ref=None, n=5):
+    """Live golden boot table, read off the season leaderboards."""
+    table = Table(title="Top Scorers", show_header=True, header_style="bold magenta")
+    table.add_column("#", justify="right")
+    table.add_column("Player", style="cyan")
+    table.add_column("Club")
+    table.add_column("Goals", justify="right", style="bold yellow")
+    table.add_column("Assists", justify="right")
+    for i, p in enumerate(season_leaders.top_scorers(n), 1):
+        style = "bold green" if user_team_ref is not None and p.team is user_team_ref else None
+        table.add_row(str(i), p.name, club_name(p), str(p.season_goals), str(p.season_assists), style=style)
+    console.print(table)
+
+def present_season_awards(user_team_ref):
+    """End-of-season awards and Team of the Season, read off the running season leaderboards.
 
-def present_season_awards(all_club_teams, user_team_ref):
+    Player of the Season is the Team of the Season pick with the best season
+    score, which the award line prints alongside the OVR.
+    """
     console.print(Panel("[bold gold1]END OF SEASON AWARDS[/bold gold1]", border_style="yellow"))
-    all_players = []
-    for t in all_club_teams: all_players.extend(t.players)
-    
-    top_scorer = max(all_players, key=lambda p: p.season_goals)
-    best_player = max(all_players, key=lambda p: p.ovr)
-    
-    console.print(f"🏆 [bold cyan]Golden Boot:[/bold cyan] {top_scorer.name} ({top_scorer.season_goals} Goals)")
-    console.print(f"🌟 [bold gold1]Player of the Season:[/bold gold1] {best_player.name} (OVR: {best_player.ovr})")
-    
+    top_scorer = next(iter(season_leaders.top_scorers(1)), None)
+    top_assister = next(iter(season_leaders.top_assists(1)), None)
+    top_keeper = next(iter(season_leaders.top_clean_sheets(1)), None)
+    tots = season_leaders.team_of_the_season()
+    tots_players = [p for _, players in tots for p in players]
+    best_player = max(tots_players, key=lambda p: (season_score(p), p.ovr), default=None)
+
+    if top_scorer is not None:
+        console.print(f"🏆 [bold cyan]Golden Boot:[/bold cyan] {top_scorer.name}, {club_name(top_scorer)} ({top_scorer.season_goals} Goals)")
+    if top_assister is not None:
+        console.print(f"🎯 [bold cyan]Playmaker Award:[/bold cyan] {top_assister.name}, {club_name(top_assister)} ({top_assister.season_assists} Assists)")
+    if top_keeper is not None:
+        console.print(f"🧤 [bold cyan]Golden Glove:[/bold cyan] {top_keeper.name}, {club_name(top_keeper)} ({top_keeper.season_clean_sheets} Clean Sheets)")
+    if best_player is not None:
+        # Ranked by season contribution (goals, assists, clean sheets), not OVR; the label says so
+        console.print(
+            f"🌟 [bold gold1]Player of the Season:[/bold gold1] {best_player.name}, {club_name(best_player)} "
+            f"(Season score: {season_score(best_player)} from {best_player.season_goals} G / {best_player.season_assists} A / "
+            f"{best_player.season_clean_sheets} CS, OVR: {best_player.ovr})"
+        )
+
+    if tots_players:
+        table = Table(title="Team of the Season", show_header=True, header_style="bold magenta")
+        table.add_column("Line")
+        table.add_column("Player", style="cyan")
+        table.add_column("Club")
+        table.add_column("Pos")
+        table.add_column("G", justify="right")
+        table.add_column("A", justify="right")
+        table.add_column("CS", justify="right")
+        for line, players in tots:
+            for p in players:
+                style = "bold green" if p.team is user_team_ref else None
+                table.add_row(line, p.name, club_name(p), p.position, str(p.season_goals), str(p.season_assists), str(p.season_clean_sheets), style=style)
+        console.print(table)
+        # Each Team of the Season pick earns their club a bonus
+        user_picks = 0
+        for p in tots_players:
+            if p.team is not None:
+                p.team.budget += AWARD_PRIZES["TOTS_PLAYER"]
+                user_picks += p.team is user_team_ref
+        if user_picks:
+            console.print(f"[green]{user_picks} of your players made the Team of the Season: €{user_picks * AWARD_PRIZES['TOTS_PLAYER']:,} bonus![/green]")
+
     # Financial rewards for user if they finished high
     if user_team_ref.points > 0:
         prize = AWARD_PRIZES["1st"] if user_team_ref.wins > 10 else 5_000_000
@@ -167,28 +343,49 @@ def present_season_awards(all_club_teams, user_team_ref):
         console.print(f"[green]Your club received €{prize:,} in season rewards![/green]")
 
 # --- Competition Simulation ---
-def simulate_competition_group_stage(participants, name, user):
+def simulate_competition_group_stage(participants, name, user, prizes=None):
+    """Draws ``participants`` into groups of four, plays them and returns the knockout seeds.
+
+    Every entrant earns the "participation" prize; the top two of each group go through.
+    """
     console.print(Panel(f"[bold blue]{name} - Group Stage[/bold blue]"))
-    # Return top teams for knockout
-    return sorted(participants, key=lambda t: t.get_team_ovr(), reverse=True)[:8]
+    n_groups = len(participants) // GROUP_SIZE
+    if n_groups < 2:
+        return seed_by_ovr(participants) # Too few entrants for groups: straight to the knockouts
+    rng = np.random.default_rng(random.getrandbits(64)) # Follows the seeded global RNG
+    stage = GroupStage(name, draw_groups(participants, n_groups, rng))
+    stage.play(rng)
+    stage.print_tables(user)
+    if prizes and prizes.get("participation"):
+        pay_prizes(CupResult(name, None, None, [], []), {"participation": prizes["participation"]}, stage.teams, user)
+    return stage.knockout_seeds()
 
 def simulate_competition_knockout_stage(qualifiers, name, prizes, user):
+    """Two-legged knockout ties and a one-off final between the group stage ``qualifiers`` (seeded in order)."""
     if not qualifiers: return None
     console.print(Panel(f"[bold blue]{name} - Knockout Stage[/bold blue]"))
-    winner = qualifiers[0]
-    console.print(f"🏆 [bold green]{winner.name}[/bold green] has won the {name}!")
-    return winner
+    result = run_knockout(qualifiers, name, prizes, legs=2, final_legs=1, user_team=user,
+                          pay_participation=False) # Paid in the group stage
+    return result.winner if result else qualifiers[0]
 
-def simulate_international_tournament(parts, name, prizes, user): return parts[0]
-def simulate_knockout_cup(parts, name, prizes, user): 
+def simulate_international_tournament(parts, name, prizes, user):
+    """Straight single-leg knockout, for competitions without enough entrants for groups."""
+    if not parts: return None
+    result = run_knockout(seed_by_ovr(parts), name, prizes, user_team=user)
+    return result.winner if result else parts[0]
+
+def simulate_knockout_cup(parts, name, prizes, user):
+    if not parts: return None
     console.print(f"Simulating {name}...")
-    return parts[0]
-def simulate_home_away_cup(parts, name, prizes, user): 
+    result = run_knockout(seed_by_ovr(parts), name, prizes, user_team=user)
+    return result.winner if result else parts[0]
+
+def simulate_home_away_cup(parts, name, prizes, user):
+    if not parts: return None
     console.print(f"Simulating {name}...")
-    return parts[0]
-def simulate_world_cup(teams, user): 
-    console.print(Panel("[bold yellow]WORLD CUP YEAR[/bold yellow]", border_style="red"))
+    result = run_knockout(seed_by_ovr(parts), name, prizes, legs=2, final_legs=1, user_team=user)
+    return result.winner if result else parts[0]
+
 def run_playoffs(relegated, challengers, user): return challengers[:2], relegated
 def generate_sponsorship_offer(ovr): return int(10_000_000 * (ovr/80))
 def calculate_merchandise_revenue(team, league): return int(2_000_000 * (team.get_team_ovr()/80))
-def generate_national_team_squad(country, players): return [p for p in players if p.country == country][:23]
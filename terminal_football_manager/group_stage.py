@@ -0,0 +1,175 @@
+import random
+
+import numpy as np
+from rich.table import Table
+
+from .match_engine import TeamProfiles, minute_goal_chances, play_goals
+from .ui import console
+
+# Continental group stage. Participants are drawn into groups from OVR pots
+# (one team per pot in each group, avoiding two clubs from the same league
+# where the draw allows) and play a double round robin. A matchday of every
+# group is one batched call into the match engine. Standings are a compact
+# (teams x 6) int array of P/W/D/L/GF/GA plus head-to-head points and goals
+# matrices; groups are ranked with one lexsort on points, goal difference and
+# goals for, and teams level on all three by their head-to-head record, the
+# same tie-breaks League uses. Group games do not count towards league stats.
+
+GROUP_SIZE = 4
+QUALIFIERS_PER_GROUP = 2
+P, W, D, L, GF, GA = range(6)
+
+def round_robin(k):
+    """(home, away) slot pairs per matchday of a double round robin between ``k`` slots (k even)."""
+    slots = list(range(k))
+    first_half = []
+    for _ in range(k - 1):
+        first_half.append([(slots[i], slots[k - 1 - i]) for i in range(k // 2)])
+        slots.insert(1, slots.pop())
+    return first_half + [[(a, h) for h, a in matchday] for matchday in first_half]
+
+def draw_groups(participants, n_groups, rng):
+    """Draws ``n_groups`` groups of GROUP_SIZE from OVR pots; returns a list of team lists."""
+    seeded = sorted(participants, key=lambda t: t.get_team_ovr(), reverse=True)[:n_groups * GROUP_SIZE]
+    groups = [[] for _ in range(n_groups)]
+    for pot_start in range(0, len(seeded), n_groups):
+        pot = [seeded[i] for i in (pot_start + rng.permutation(n_groups)).tolist()]
+        slots = _place_pot(pot, groups, list(range(n_groups))) or list(range(n_groups)) # Clashes unavoidable: draw order
+        for team, g in zip(pot, slots):
+            groups[g].append(team)
+    return groups
+
+def _place_pot(pot, groups, open_groups):
+    """A group per ``pot`` team with no two clubs from one league together, or None if there is none."""
+    if not pot:
+        return []
+    team = pot[0]
+    for g in open_groups:
+        if all(t.league != team.league for t in groups[g]):
+            rest = _place_pot(pot[1:], groups, [o for o in open_groups if o != g])
+            if rest is not None:
+                return [g] + rest
+    return None
+
+class GroupStage:
+    """The groups of one competition, their fixtures and standings."""
+
+    def __init__(self, name, groups):
+        self.name = name
+        self.groups = [list(group) for group in groups]
+        self.teams = [team for group in self.groups for team in group]
+        n = len(self.teams)
+        self.group_of = np.repeat(np.arange(len(self.groups)), GROUP_SIZE)
+        self.stats = np.zeros((n, 6), dtype=np.int64)
+        self.h2h_points = np.zeros((n, n), dtype=np.int64) # [i, j]: points team i took off team j
+        self.h2h_goals = np.zeros((n, n), dtype=np.int64) # [i, j]: goals team i scored against team j
+        # Every group's fixtures of a matchday as flat (home, away) index arrays
+        offsets = np.arange(len(self.groups)) * GROUP_SIZE
+        self.matchdays = []
+        for pairs in round_robin(GROUP_SIZE):
+            home = np.array([h for h, _ in pairs]) + offsets[:, None]
+            away = np.array([a for _, a in pairs]) + offsets[:, None]
+            self.matchdays.append((home.ravel(), away.ravel()))
+
+    @property
+    def points(self):
+        return 3 * self.stats[:, W] + self.stats[:, D]
+
+    @property
+    def goal_difference(self):
+        return self.stats[:, GF] - self.stats[:, GA]
+
+    def record(self, home, away, home_goals, away_goals):
+        """Adds a batch of results to the standings and head-to-head matrices."""
+        home_win, away_win = home_goals > away_goals, away_goals > home_goals
+        draw = ~(home_win | away_win)
+        for idx, scored, conceded, won, lost in ((home, home_goals, away_goals, home_win, away_win),
+                                                 (away, away_goals, home_goals, away_win, home_win)):
+            np.add.at(self.stats, (idx, P), 1)
+            np.add.at(self.stats, (idx, W), won)
+            np.add.at(self.stats, (idx, D), draw)
+            np.add.at(self.stats, (idx, L), lost)
+            np.add.at(self.stats, (idx, GF), scored)
+            np.add.at(self.stats, (idx, GA), conceded)
+        np.add.at(self.h2h_goals, (home, away), home_goals)
+        np.add.at(self.h2h_goals, (away, home), away_goals)
+        np.add.at(self.h2h_points, (home, away), 3 * home_win + draw)
+        np.add.at(self.h2h_points, (away, home), 3 * away_win + draw)
+
+    def play(self, rng=None):
+        """Plays every matchday, each one as a single batch across all groups."""
+        rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64)) # Follows the seeded global RNG
+        profiles = TeamProfiles(self.teams) # Same order as self.teams, so indices line up
+        for home, away in self.matchdays:
+            home_chance, away_chance = minute_goal_chances(profiles.ovr[home], profiles.ovr[away],
+                                                           profiles.finishing[home], profiles.finishing[away])
+            home_goals, away_goals = play_goals(home_chance, away_chance, rng=rng)
+            self.record(home, away, home_goals, away_goals)
+
+    def _head_to_head(self, idx):
+        """Orders tied team indices by points, goal difference and goals in the games between them."""
+        sub = np.ix_(idx, idx)
+        points = self.h2h_points[sub].sum(axis=1)
+        scored, conceded = self.h2h_goals[sub].sum(axis=1), self.h2h_goals[sub].sum(axis=0)
+        return idx[np.lexsort((-scored, -(scored - conceded), -points))] # Stable: full ties keep draw order
+
+    def standings(self):
+        """(groups x GROUP_SIZE) array of team indices, each group's table top to bottom."""
+        points, gd, gf = self.points, self.goal_difference, self.stats[:, GF]
+        order = np.lexsort((np.arange(len(self.teams)), -gf, -gd, -points, self.group_of))
+        keys = np.stack((self.group_of, points, gd, gf), axis=1)[order]
+        level = np.flatnonzero((keys[1:] == keys[:-1]).all(axis=1))
+        i = 0
+        while i < level.size: # Runs of teams level on everything but head-to-head (rare)
+            start = j = level[i]
+            while i < level.size and level[i] == j:
+                i += 1
+                j += 1
+            order[start:j + 1] = self._head_to_head(order[start:j + 1])
+        return order.reshape(len(self.groups), GROUP_SIZE)
+
+    def knockout_seeds(self, best_thirds=0):
+        """Group winners, runners-up and the ``best_thirds`` best third-placed teams as knockout seeds.
+
+        Seeds follow cups.bracket_order: seed s meets seed size + 1 - s in the
+        first round (a bye past the last seed), so without thirds winner s meets
+        the runner-up at seed 2n + 1 - s. Teams are swapped within their tier
+        until no first-round tie pairs two teams from one group, where the draw
+        allows it.
+        """
+        table = self.standings()
+        points, gd, gf = self.points, self.goal_difference, self.stats[:, GF]
+        rank = lambda teams: sorted(teams.tolist(), key=lambda i: (-points[i], -gd[i], -gf[i]))
+        winners, runners_up = rank(table[:, 0]), rank(table[:, 1])
+        opponents = []
+        for w in winners:
+            options = [r for r in runners_up if r not in opponents]
+            opponents.append(next((r for r in options if self.group_of[r] != self.group_of[w]), options[0]))
+        seeds = winners + opponents[::-1] + rank(table[:, 2])[:best_thirds]
+
+        # First-round ties as 0-based seed positions; thirds shift who meets whom
+        size = 1 << (len(seeds) - 1).bit_length()
+        ties = [(a, size - 1 - a) for a in range(size // 2) if size - 1 - a < len(seeds)]
+        tier = lambda k: min(k // len(winners), 2) # 0 winners, 1 runners-up, 2 thirds
+        clash = lambda a, b: self.group_of[seeds[a]] == self.group_of[seeds[b]]
+        for a, b in ties:
+            if clash(a, b):
+                # Swap the lower seed with another tie's lower seed of the same tier where both ties then work
+                for c, d in ties:
+                    if d != b and tier(d) == tier(b) and not clash(a, d) and not clash(c, b):
+                        seeds[b], seeds[d] = seeds[d], seeds[b]
+                        break
+        return [self.teams[i] for i in seeds]
+
+    def print_tables(self, user_team=None):
+        table_idx = self.standings()
+        for g, rows in enumerate(table_idx.tolist()):
+            table = Table(title=f"{self.name} - Group {chr(ord('A') + g)}", show_header=True, header_style="bold magenta")
+            for column in ("#", "Team", "P", "W", "D", "L", "GD", "Pts"):
+                table.add_column(column, justify="left" if column == "Team" else "right", style="cyan" if column == "Team" else None)
+            for pos, i in enumerate(rows, 1):
+                s = self.stats[i]
+                style = "bold green" if self.teams[i] is user_team else ("green" if pos <= QUALIFIERS_PER_GROUP else None)
+                table.add_row(str(pos), self.teams[i].name, str(s[P]), str(s[W]), str(s[D]), str(s[L]),
+                              str(s[GF] - s[GA]), str(3 * s[W] + s[D]), style=style)
+            console.print(table)
@@ -0,0 +1,107 @@
+import heapq
+
+from .constants import DEFENDERS, MIDFIELDERS, FORWARDS
+
+# Running season leaderboards. Every place that adds to a player's season
+# goals, assists or clean sheets in the career world (Manager Mode's
+# simulate_match calls, the batch match engine and the background league
+# shards) files the player here straight away, so the
+# golden boot, assists and clean-sheet tables and the Team of the Season can
+# be read at any point in the season without scanning the world. Each board
+# is a bounded top-k over totals that only grow during a season: the members
+# live in a dict and a lazily pruned min-heap finds the one to drop, so an
+# update is O(log k) and a read O(k log k).
+
+LEADERBOARD_SIZE = 10
+
+# Team of the Season: (line, positions, players), ranked by season_score
+TOTS_FORMATION = (("Goalkeeper", {"GK"}, 1), ("Defence", DEFENDERS, 4), ("Midfield", MIDFIELDERS, 3), ("Attack", FORWARDS, 3))
+GOAL_POINTS, ASSIST_POINTS, CLEAN_SHEET_POINTS = 3, 2, 2
+
+def season_score(player):
+    """Season contribution used to rank the Team of the Season."""
+    return GOAL_POINTS * player.season_goals + ASSIST_POINTS * player.season_assists + CLEAN_SHEET_POINTS * player.season_clean_sheets
+
+def first_choice_keeper(players):
+    """The highest-rated goalkeeper in ``players``, or None."""
+    return max((p for p in players if p.position == "GK"), key=lambda p: p.ovr, default=None)
+
+class TopK:
+    """The ``k`` players with the highest keys seen, for keys that only grow."""
+
+    def __init__(self, k):
+        self.k = k
+        self._members = {} # id(player) -> (key, player)
+        self._heap = [] # (key, id(player)); entries no longer matching _members are skipped
+
+    def __len__(self):
+        return len(self._members)
+
+    def _valid(self, entry):
+        member = self._members.get(entry[1])
+        return member is not None and member[0] == entry[0]
+
+    def update(self, player, key):
+        pid = id(player)
+        if pid not in self._members and len(self._members) >= self.k:
+            while not self._valid(self._heap[0]):
+                heapq.heappop(self._heap)
+            if key <= self._heap[0][0]:
+                return # Ties keep whoever got there first
+            del self._members[heapq.heappop(self._heap)[1]]
+        self._members[pid] = (key, player)
+        heapq.heappush(self._heap, (key, pid))
+        if len(self._heap) > 4 * self.k:
+            self._heap = [(key, pid) for pid, (key, _) in self._members.items()]
+            heapq.heapify(self._heap)
+
+    def top(self, n=None):
+        """[(key, player)], highest key first."""
+        ranked = sorted(self._members.values(), key=lambda member: member[0], reverse=True)
+        return ranked if n is None else ranked[:n]
+
+class SeasonLeaderboards:
+    """The season's golden boot, assists, clean sheets and Team of the Season boards."""
+
+    def __init__(self, k=LEADERBOARD_SIZE):
+        self.k = k
+        self.reset()
+
+    def reset(self):
+        self.goals = TopK(self.k)
+        self.assists = TopK(self.k)
+        self.clean_sheets = TopK(self.k)
+        self.tots = {line: TopK(count) for line, _, count in TOTS_FORMATION}
+
+    def record(self, player):
+        """Re-files ``player`` after one of their season totals went up."""
+        # OVR only breaks ties, so it is read once here rather than tracked
+        if player.season_goals:
+            self.goals.update(player, (player.season_goals, player.ovr))
+        if player.season_assists:
+            self.assists.update(player, (player.season_assists, player.ovr))
+        if player.season_clean_sheets:
+            self.clean_sheets.update(player, (player.season_clean_sheets, player.ovr))
+        for line, positions, _ in TOTS_FORMATION:
+            if player.position in positions:
+                self.tots[line].update(player, (season_score(player), player.ovr))
+                break
+
+    def record_all(self, players):
+        for player in players:
+            self.record(player)
+
+    def top_scorers(self, n=None):
+        return [player for _, player in self.goals.top(n)]
+
+    def top_assists(self, n=None):
+        return [player for _, player in self.assists.top(n)]
+
+    def top_clean_sheets(self, n=None):
+        return [player for _, player in self.clean_sheets.top(n)]
+
+    def team_of_the_season(self):
+        """[(line, [player, ...])] in TOTS_FORMATION order."""
+        return [(line, [player for _, player in self.tots[line].top()]) for line, _, _ in TOTS_FORMATION]
+
+season_leaders = SeasonLeaderboards()
@@ -0,0 +1,117 @@
+from collections import namedtuple
+import random
+
+import numpy as np
+
+from .game_logic import generate_fixtures
+from .match_engine import (TeamProfiles, minute_goal_chances, play_goals, pick_scorers, pick_assisters, player_counts,
+                           tally_results, apply_results)
+from .parallel import submit, default_workers
+from .ui import console
+
+# Season simulation for the leagues the user is not playing in. Each league is
+# an independent shard: it is reduced to a LeagueShard of plain arrays (team
+# strength, scorer pools and a run of fixtures as index pairs), played in one
+# batch in a worker process with its own RNG stream, and only the per-team
+# tallies and per-player goal and assist counts travel back to be merged into
+# the world. Clubs still held as LazyTeam stubs are snapshotted from their
+# saved dicts and only built when their results are merged.
+#
+# A season is played in two halves around the mid-season transfer window.
+# Merging the first half before the window puts every league's scorers on the
+# live leaderboards and credits goals to the club a player scored them for;
+# the second half is then snapshotted again for any league where a squad
+# changed (by squad_version) since the merge, so a player sold in the window
+# only scores for their new club.
+
+LeagueShard = namedtuple("LeagueShard", [
+    "name", "offsets", "cumulative_weights", "home_idx", "away_idx", "home_chance", "away_chance"
+])
+
+ShardResult = namedtuple("ShardResult", ["name", "tally", "goal_counts", "assist_counts"])
+
+def build_shard(name, profiles, fixtures):
+    """Snapshots ``fixtures`` ((home, away) pairs of ``profiles``' teams) as a LeagueShard."""
+    home_idx = np.array([profiles.index[id(h)] for h, _ in fixtures], dtype=np.int64)
+    away_idx = np.array([profiles.index[id(a)] for _, a in fixtures], dtype=np.int64)
+    home_chance, away_chance = minute_goal_chances(
+        profiles.ovr[home_idx], profiles.ovr[away_idx],
+        profiles.finishing[home_idx], profiles.finishing[away_idx]
+    )
+    return LeagueShard(name, profiles.offsets, profiles.cumulative_weights, home_idx, away_idx, home_chance, away_chance)
+
+def play_shard(shard, seed):
+    """Plays a run of a league's fixtures; runs in a worker process."""
+    rng = np.random.default_rng(seed)
+    n = len(shard.offsets) - 1
+    home_goals, away_goals = play_goals(shard.home_chance, shard.away_chance, rng=rng)
+    team_idx, goals = np.concatenate((shard.home_idx, shard.away_idx)), np.concatenate((home_goals, away_goals))
+    scorers = pick_scorers(shard.offsets, shard.cumulative_weights, team_idx, goals, rng)
+    assisters = pick_assisters(shard.offsets, shard.cumulative_weights, team_idx, goals, scorers, rng)
+    n_players = int(shard.offsets[-1])
+    return ShardResult(shard.name, tally_results(n, shard.home_idx, shard.away_idx, home_goals, away_goals),
+                       player_counts(scorers, n_players), player_counts(assisters, n_players))
+
+class LeagueSeasons:
+    """Other leagues' seasons, played in the background a half at a time and merged back into the world."""
+
+    def __init__(self, leagues, workers=None, leaderboards=None):
+        self.workers = default_workers() if workers is None else workers
+        self.leaderboards = leaderboards # Where merged goals, assists and clean sheets are filed, if anywhere
+        self.profiles = {}
+        self.halves = {} # name -> (first half fixtures, second half fixtures)
+        for name, teams in leagues.items():
+            if len(teams) < 2:
+                continue
+            profiles = self.profiles[name] = TeamProfiles(teams)
+            matchdays = generate_fixtures(profiles.teams)
+            mid = len(matchdays) // 2 # Same split as the user's league around its transfer window
+            self.halves[name] = ([f for md in matchdays[:mid] for f in md], [f for md in matchdays[mid:] for f in md])
+        self.versions = {}
+        self._start(0)
+
+    def _start(self, half):
+        shards = [build_shard(name, self.profiles[name], fixtures[half]) for name, fixtures in self.halves.items()]
+        seeds = np.random.SeedSequence(random.getrandbits(64)).spawn(len(shards))
+        if self.workers <= 1 or len(shards) <= 1:
+            self.futures = None
+            self.results = [play_shard(shard, seed) for shard, seed in zip(shards, seeds)]
+        else:
+            self.futures = [submit(play_shard, shard, seed) for shard, seed in zip(shards, seeds)]
+            self.results = None
+
+    def merge(self):
+        """Waits for every shard and adds its results to the live teams and players; returns the league names."""
+        results = self.results if self.futures is None else [f.result() for f in self.futures]
+        for result in results:
+            profiles = self.profiles[result.name]
+            apply_results(profiles.teams, profiles.live_players(), result.tally, result.goal_counts, result.assist_counts, self.leaderboards)
+        self.futures, self.results = None, []
+        # Stamped after merging, which builds any stubs, so only later squad changes count
+        self.versions = {name: [t.squad_version for t in profiles.teams] for name, profiles in self.profiles.items()}
+        return [result.name for result in results]
+
+    def play_second_half(self):
+        """Starts the second half of every league; call after merge() and the transfer window."""
+        for name, profiles in self.profiles.items():
+            if [t.squad_version for t in profiles.teams] != self.versions[name]:
+                self.profiles[name] = TeamProfiles(profiles.teams) # A squad changed: snapshot it again
+        self._start(1)
+
+def simulate_other_leagues(all_club_teams, skip_leagues, workers=None, leaderboards=None):
+    """Starts a season for every league not in ``skip_leagues``.
+
+    Call .merge() and .play_second_half() on the result at the mid-season
+    window, and .merge() again when the season ends. Merged results are filed
+    in ``leaderboards`` when it is given.
+    """
+    leagues = {}
+    for team in all_club_teams:
+        if team.league not in skip_leagues:
+            leagues.setdefault(team.league, []).append(team)
+    return LeagueSeasons(leagues, workers, leaderboards)
+
+def print_league_champions(all_club_teams, leagues):
+    for name in leagues:
+        table = sorted([t for t in all_club_teams if t.league == name], key=lambda t: (t.points, t.goal_difference, t.goals_for), reverse=True)
+        console.print(f"[bold cyan]{name}:[/bold cyan] {table[0].name} ([yellow]{table[0].points} pts[/yellow])")
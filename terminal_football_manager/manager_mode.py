@@ -0,0 +1,811 @@
+import random
+
+from rich.panel import Panel
+
+from .ui import console
+
+# Manager Mode: world generation, the transfer and club management menus and
+# the season loop. main.py imports this module only once Manager Mode starts.
+
+from .constants import POSITIONS, TRAINER_TIERS
+from .models import Team, LazyTeam, saved_data
+from .game_logic import (
+    League, generate_fixtures, simulate_match,
+    reset_all_team_stats, reset_player_season_stats,
+    simulate_competition_group_stage, simulate_competition_knockout_stage,
+    simulate_international_tournament, simulate_knockout_cup,
+    simulate_home_away_cup, generate_sponsorship_offer,
+    calculate_merchandise_revenue, simulate_world_cup,
+    present_season_awards, print_top_scorers, run_playoffs
+)
+from .match_engine import seed_engine, SpeculativeMatchday
+from .leaderboards import season_leaders
+from .match_events import NULL_SINK
+from .decisions import InteractivePolicy, GreedyPolicy
+from .forecast import forecast_season, print_title_race
+from .league_shards import simulate_other_leagues, print_league_champions
+from .transfer_market import TransferMarket, Listing, transfer
+from .scouting import ScoutingIndex
+from .development import develop_world, RETIREMENT_AGE
+from .qualification import allocate, continental_rules
+from .player_factory import generate_players, draw_names, INTERNATIONAL_COUNTRY_MIX, DOMESTIC_COUNTRY_MIX
+from .world_template import build_world, INTERNATIONAL_LEAGUE_GROUPS
+
+# --- Generation Logic ---
+
+def generate_player_name(player_country=None):
+    return draw_names([player_country])[0]
+
+def generate_player(is_youth=False, min_ovr=None, max_ovr=None, position=None, country_pool=None):
+    """Generates a single player; bulk callers use player_factory.generate_players."""
+    return generate_players(1, is_youth, min_ovr, max_ovr, position, country_pool)[0]
+
+def create_teams(seed=None):
+    """Builds a new world from the cached world template; the same ``seed`` gives the same world."""
+    return build_world(seed)
+
+def run_off_season_training(all_teams, user_team_ref):
+    console.print("\n[bold blue]--- Off-Season Training & Development ---[/bold blue]")
+
+    # Snapshot the user's squad so its changes can be reported after the batch run
+    tier_names = list(TRAINER_TIERS.keys())
+    seniors_before = [(p, p.ovr, p.trainer_level) for p in user_team_ref.players]
+    youth_before = [(p, p.ovr) for p in user_team_ref.youth_academy]
+
+    develop_world(all_teams)
+
+    for player, old_ovr, trainer_level in seniors_before:
+        if player.age >= RETIREMENT_AGE:
+            console.print(f"[bold red][RETIREMENT][/bold red] [cyan]{player.name}[/cyan] ([yellow]{player.age}[/yellow], [blue]{user_team_ref.name}[/blue]) has retired!")
+            continue
+        if 0 < trainer_level <= len(tier_names):
+            tier_name = tier_names[trainer_level - 1]
+            console.print(f"[bold green][TRAINING][/bold green] [cyan]{player.name}[/cyan] gets a [bold]+{TRAINER_TIERS[tier_name]['boost']} OVR[/bold] boost from their {tier_name} trainer!")
+        if player.ovr != old_ovr:
+            console.print(f"[cyan]{player.name}[/cyan] ([yellow]{player.age}[/yellow]) OVR: [red]{old_ovr}[/red] -> [green]{player.ovr}[/green]")
+
+    for player, old_ovr in youth_before:
+        if player.age >= RETIREMENT_AGE:
+            console.print(f"[bold red][RETIREMENT][/bold red] Youth player [cyan]{player.name}[/cyan] ([yellow]{player.age}[/yellow], [blue]{user_team_ref.name}[/blue]) has retired from the academy!")
+        elif player.ovr != old_ovr:
+            console.print(f"Youth: [cyan]{player.name}[/cyan] ([yellow]{player.age}[/yellow]) OVR: [red]{old_ovr}[/red] -> [green]{player.ovr}[/green]")
+
+    if random.random() < 0.1:
+        wonderkid = generate_player(is_youth=True)
+        wonderkid.ovr = random.randint(98, 103)
+        eligible_teams = [t for t in all_teams if t.name not in ["Dreamwarriors", "CF Tesa"]]
+        if eligible_teams:
+            chosen_team = random.choice(eligible_teams)
+            chosen_team.youth_academy.append(wonderkid)
+            wonderkid.team = chosen_team 
+            console.print(Panel(f"[bold green]A generational talent has emerged![/bold green]\n[cyan]{wonderkid.age}[/cyan]-year-old [bold]{wonderkid.position}[/bold], [green]{wonderkid.ovr} OVR[/green]) has joined the [blue]{chosen_team.name}[/blue] youth academy!", title="[bold yellow]BREAKING NEWS[/bold yellow]", border_style="yellow"))
+
+def restock_youth_academy(all_teams, user_team_ref): # Added user_team_ref
+    console.print("\n[bold blue]--- Youth Academies Restocking ---[/bold blue]")
+    
+    for mix, teams in ((INTERNATIONAL_COUNTRY_MIX, [t for t in all_teams if t.league in INTERNATIONAL_LEAGUE_GROUPS]),
+                       (DOMESTIC_COUNTRY_MIX, [t for t in all_teams if t.league not in INTERNATIONAL_LEAGUE_GROUPS])):
+        counts = [1 + (team.academy_level // 10) for team in teams]
+        new_players = iter(generate_players(sum(counts), is_youth=True, country_mix=mix))
+        for team, num_new_youth in zip(teams, counts):
+            for _ in range(num_new_youth):
+                new_player = next(new_players)
+                new_player.ovr += team.academy_level // 10
+                team.youth_academy.append(new_player)
+                new_player.team = team
+            if team == user_team_ref and num_new_youth > 0: # Only print for user's team
+                console.print(f"[blue]{team.name}'s[/blue] academy has produced [bold green]{num_new_youth}[/bold green] new talent(s).")
+
+def run_youth_promotions(user_team):
+    while True:
+        console.print("\n[bold blue]--- Youth Academy Promotions ---[/bold blue]")
+        if not user_team.youth_academy:
+            console.print("[red]Your youth academy is empty.[/red]"); console.input("[green]Press Enter to continue...[/green]"); return
+
+        console.print(f"Your senior squad currently has [bold]{len(user_team.players)}/22[/bold] players.")
+        console.print("Select a player to promote to the senior squad (max 22 players).")
+        for i, p in enumerate(user_team.youth_academy): console.print(f"[{i+1}] [cyan]{p}[/cyan]")
+        
+        try:
+            choice = int(console.input("Enter player number to promote (or 0 to go back): "))
+            if choice == 0: return
+            if 1 <= choice <= len(user_team.youth_academy):
+                if len(user_team.players) >= 22:
+                    console.print("[red]\nSenior squad is full! You must sell or release a player first.[/red]"); continue
+                
+                player = user_team.youth_academy.pop(choice - 1)
+                user_team.add_player(player) 
+                console.print(f"\n[bold green]{player.name}[/bold green] has been promoted to the senior squad!")
+            else: console.print("[red]Invalid choice.[/red]")
+        except ValueError: console.print("[red]Invalid input.[/red]")
+
+def run_management_menu(user_team):
+    while True:
+        console.print(Panel(
+            f"Your budget: [green]€{user_team.budget:,}[/green]\n"
+            f"Total Squad Value: [green]€{user_team.total_squad_value:,}[/green]\n"
+            f"Total Weekly Wage Bill: [green]€{user_team.total_wage_bill:,}[/green]",
+            title="[bold blue]Management Menu[/bold blue]",
+            border_style="blue"
+        ))
+        
+        stadium_cost = 200_000 * user_team.stadium_level
+        academy_cost = 150_000 * user_team.academy_level
+
+        console.print(f"\n1. Upgrade Stadium")
+        console.print(f"   - Level: [bold yellow]{user_team.stadium_level}[/bold yellow]/100 | Capacity: {user_team.stadium_capacity:,}")
+        console.print(f"   - Upgrade Cost: [red]€{stadium_cost:,}[/red]")
+
+        console.print(f"\n2. Upgrade Youth Academy")
+        console.print(f"   - Level: [bold yellow]{user_team.academy_level}[/bold yellow]/100")
+        console.print(f"   - Upgrade Cost: [red]€{academy_cost:,}[/red]")
+
+        console.print("\n3. Assign Special Player Training")
+        console.print("\n4. Exit Management Menu")
+
+        choice = console.input("[bold yellow]Enter your choice:[/bold yellow] ")
+        if choice == '1':
+            if user_team.stadium_level >= 100: console.print("[red]\nStadium is already max level.[/red]"); continue
+            if user_team.budget >= stadium_cost:
+                user_team.budget -= stadium_cost; user_team.stadium_level += 1
+                console.print("[green]\nStadium upgrade successful![/green]")
+            else: console.print("[red]\nNot enough budget.[/red]")
+        elif choice == '2':
+            if user_team.academy_level >= 100: console.print("[red]\nYouth Academy is already max level.[/red]"); continue
+            if user_team.budget >= academy_cost:
+                user_team.budget -= academy_cost; user_team.academy_level += 1
+                console.print("[green]\nYouth Academy upgrade successful![/green]")
+            else: console.print("[red]\nNot enough budget.[/red]")
+        elif choice == '3': run_special_training_menu(user_team)
+        elif choice == '4': return
+        else: console.print("[red]Invalid choice.[/red]")
+
+def run_special_training_menu(user_team):
+    while True:
+        console.print("\n[bold blue]--- Special Training Assignment ---[/bold blue]")
+        console.print("Select a player to assign a special trainer to for this season.")
+        
+        players = sorted(user_team.players, key=lambda p: p.name)
+        for i, p in enumerate(players): console.print(f"[{i+1}] [cyan]{p}[/cyan]")
+
+        try:
+            player_choice = int(console.input("[bold yellow]Enter player number (or 0 to go back):[/bold yellow] "))
+            if player_choice == 0: return
+            if 1 <= player_choice <= len(players):
+                player = players[player_choice - 1]
+                if player.trainer_level > 0: console.print(f"[red]\n{player.name} already has a trainer assigned for this season.[/red]"); continue
+
+                console.print(f"\nSelect a trainer tier for [cyan]{player.name}[/cyan]:")
+                tiers_list = list(TRAINER_TIERS.items())
+                for i, (name, data) in enumerate(tiers_list): console.print(f"[{i+1}] [magenta]{name}[/magenta] - Cost: [red]€{data['cost']:,}[/red], Boost: [green]+{data['boost']} OVR[/green]")
+                
+                trainer_choice = int(console.input("[bold yellow]Enter tier (or 0 to cancel):[/bold yellow] "))
+                if 1 <= trainer_choice <= len(tiers_list):
+                    name, data = tiers_list[trainer_choice-1]
+                    if user_team.budget >= data['cost']:
+                        user_team.budget -= data['cost']
+                        player.trainer_level = trainer_choice
+                        console.print(f"[bold green]\nSUCCESS! A {name} trainer assigned to {player.name}.[/bold green]")
+                    else: console.print("[red]\nNot enough budget.[/red]")
+                elif trainer_choice != 0: console.print("[red]Invalid tier.[/red]")
+            else: console.print("[red]Invalid player choice.[/red]")
+        except ValueError: console.print("[red]Invalid input.[/red]")
+
+def run_transfer_window(league_teams, user_team, window_name, all_club_teams, policy=None, scouting=None): # Added all_club_teams
+    console.print(f"\n[bold blue]--- {window_name} Transfer Window is OPEN ---[/bold blue]")
+    
+    # Ensure all players are linked to their current teams for transfer logic
+    for team in all_club_teams: # Iterate through all clubs
+        for player in team.players:
+            player.team = team
+        for player in team.youth_academy:
+            player.team = team
+
+    other_teams = [t for t in all_club_teams if t != user_team] # Consider all clubs for transfers
+    
+    market = TransferMarket()
+    # AI teams putting players on transfer list
+    for team in other_teams:
+        if not team.players: continue
+        players_sorted_by_age = sorted(team.players, key=lambda p: p.age, reverse=True)
+        
+        # Logic to decide which players AI puts on transfer list
+        # Older players
+        if players_sorted_by_age and random.random() < 0.3: # 30% chance for oldest player
+            market.list_player(players_sorted_by_age[0], team)
+        
+        # Young promising players (less chance)
+        eligible_young_players = [p for p in team.players if p.age < 28 and p not in market]
+        if eligible_young_players and random.random() < 0.15: # 15% chance for a young player
+            market.list_player(random.choice(eligible_young_players), team)
+        
+        # Surplus players
+        if len(team.players) > 22 and random.random() < 0.5: # 50% chance to list a surplus player
+            extra_players = [p for p in team.players if p not in market]
+            if extra_players:
+                market.list_player(random.choice(extra_players), team)
+
+    policy = policy or InteractivePolicy()
+    policy.transfer_business(user_team, market, other_teams, all_club_teams, scouting)
+
+    console.print("\n[bold blue]--- AI Transfer Activity ---[/bold blue]")
+    # AI teams buying and selling among themselves
+    completed = market.run_ai_round(other_teams)
+
+    if not completed:
+        console.print("[yellow]No major AI transfers in this window.[/yellow]")
+    
+    console.print(f"\n[bold blue]--- {window_name} Transfer Window is CLOSED ---[/bold blue]")
+
+def offer_purchase(user_team, player, seller_team, market):
+    """Prices ``player`` for the user and completes the deal if they confirm."""
+    international_league_groups_keys = ["Premier League", "La Liga", "Serie A", "Ligue 1"]
+    # Dynamic pricing for international players or highly sought players
+    transfer_fee = player.market_value
+    if player.ovr > 90: # Boost price for very high OVR players
+        transfer_fee = int(transfer_fee * random.uniform(1.2, 1.8)) 
+    if player.team.league in international_league_groups_keys: # Further boost for international league players
+        transfer_fee = int(transfer_fee * random.uniform(1.1, 1.5))
+
+    if user_team.budget >= transfer_fee:
+        confirm = console.input(f"[bold yellow]Confirm purchase of {player.name} from {seller_team.name} for [green]€{transfer_fee:,}[/green]? (yes/no): [/bold yellow]").lower()
+        if confirm == 'yes':
+            transfer(player, seller_team, user_team, transfer_fee)
+            # Take the player off the market to prevent duplicate purchases
+            market.delist(player)
+            console.print(f"\n[bold green]SUCCESS! {player.name} joins {user_team.name} for €{transfer_fee:,}![/bold green]")
+        else: console.print("[red]Transfer cancelled.[/red]")
+    else: console.print("[red]Not enough budget.[/red]")
+
+def run_scout_search(user_team, market, scouting):
+    """Filters every senior player in the world through the scouting index and offers to buy a hit."""
+    console.print("\n[bold blue]--- Scout Search ---[/bold blue] [italic](leave blank for any)[/italic]")
+    try:
+        position = console.input(f"Position ({'/'.join(POSITIONS)}): ").strip().upper() or None
+        max_age = console.input("Maximum age: ").strip()
+        min_ovr = console.input("Minimum OVR: ").strip()
+        max_value = console.input("Maximum value (€M): ").strip()
+        hits = scouting.query(position=position, max_age=int(max_age) if max_age else None, min_ovr=int(min_ovr) if min_ovr else None,
+                              max_value=int(float(max_value) * 1_000_000) if max_value else None, exclude_team=user_team, limit=15)
+    except ValueError:
+        console.print("[red]Invalid input.[/red]"); return
+    if not hits: console.print("[yellow]Your scouts found nobody matching that search.[/yellow]"); return
+
+    for i, hit in enumerate(hits): console.print(f"[{i+1}] [cyan]{hit.player}[/cyan] (From: [blue]{hit.team.name}[/blue])")
+    try:
+        buy_choice = int(console.input(f"[bold yellow]Enter player number to buy (1-{len(hits)}, or 0 to back):[/bold yellow] "))
+        if 1 <= buy_choice <= len(hits):
+            hit = hits[buy_choice - 1]
+            offer_purchase(user_team, hit.player, hit.team, market)
+        elif buy_choice != 0: console.print("[red]Invalid choice.[/red]")
+    except ValueError: console.print("[red]Invalid input.[/red]")
+
+def run_transfer_menu(user_team, market, other_teams, all_club_teams, scouting=None):
+    """The user's buy/sell menu of a transfer window over the AI listings in ``market``."""
+    while True:
+        console.print(Panel(
+            f"Your budget: [green]€{user_team.budget:,}[/green]\n"
+            f"Your Squad Value: [green]€{user_team.total_squad_value:,}[/green]\n"
+            f"Your Weekly Wage Bill: [green]€{user_team.total_wage_bill:,}[/green]",
+            title="[bold blue]Transfer Window[/bold blue]",
+            border_style="blue"
+        ))
+        console.print("\n[bold yellow]1. View Squad[/bold yellow] | [bold yellow]2. Buy[/bold yellow] | [bold yellow]3. Sell[/bold yellow] | [bold yellow]4. Youth Academy[/bold yellow] | [bold yellow]5. Finish Business[/bold yellow] | [bold yellow]6. Scout Search[/bold yellow]")
+        choice = console.input("[bold yellow]Choice:[/bold yellow] ")
+        
+        if choice == '1':
+            console.print(f"\n[bold blue]--- {user_team.name} Squad ---[/bold blue]")
+            for p in sorted(user_team.players, key=lambda p: p.ovr, reverse=True): console.print(f"- [cyan]{p}[/cyan]")
+        elif choice == '2': # Buy Players
+            
+            # Combine transfer list and scouted international players
+            available_players_to_buy = list(market) # Start with players already listed by AI
+            
+            # Define international league groups for filtering
+            international_league_groups_keys = ["Premier League", "La Liga", "Serie A", "Ligue 1"]
+            
+            scouting_options = []
+            for team in all_club_teams:
+                if team.league in international_league_groups_keys and team != user_team:
+                    # Select a few top players from stronger international teams for scouting
+                    top_players = sorted(team.players, key=lambda p: p.ovr, reverse=True)[:random.randint(1,4)] # Offer 1-4 top players
+                    for p in top_players:
+                        # Ensure player is not already listed or in user's team
+                        if p.team != user_team and p not in market:
+                            scouting_options.append(Listing(p, team))
+            
+            if scouting_options:
+                console.print("\n[bold blue]--- International Scouting Opportunities ---[/bold blue]")
+                random.shuffle(scouting_options) # Mix up the scouted players
+                available_players_to_buy.extend(scouting_options[:random.randint(5, 10)]) # Present a few random scouted players
+                
+            if not available_players_to_buy: console.print("[red]No players available for purchase.[/red]"); continue
+
+            console.print("\n[bold blue]--- Players Available for Purchase ---[/bold blue]")
+            for i, item in enumerate(available_players_to_buy): 
+                console.print(f"[{i+1}] [cyan]{item.player}[/cyan] (From: [blue]{item.seller.name}[/blue])")
+            
+            try:
+                buy_choice = int(console.input(f"[bold yellow]Enter player number to buy (1-{len(available_players_to_buy)}, or 0 to back):[/bold yellow] "))
+                if buy_choice == 0: continue
+                
+                if 1 <= buy_choice <= len(available_players_to_buy):
+                    selected_item = available_players_to_buy[buy_choice - 1]
+                    offer_purchase(user_team, selected_item.player, selected_item.seller, market)
+                else: console.print("[red]Invalid choice.[/red]")
+            except (ValueError, IndexError): console.print("[red]Invalid input.[/red]")
+
+        elif choice == '3': # Sell Players
+            if not user_team.players: console.print("[red]Your squad is empty.[/red]"); continue
+            console.print("\n[bold blue]--- Select a Player to Sell ---[/bold blue]")
+            for i, p in enumerate(user_team.players): console.print(f"[{i+1}] [cyan]{p}[/cyan]")
+            try:
+                sell_choice = int(console.input("[bold yellow]Sell player # (0 to back):[/bold yellow] "))
+                if sell_choice == 0: continue
+                if 1 <= sell_choice <= len(user_team.players):
+                    player_to_sell = user_team.players[sell_choice - 1]
+                    
+                    # AI teams making offers for user's players
+                    # Prioritize stronger, wealthier AI teams for making offers
+                    eligible_buyers = [t for t in other_teams if t.budget >= player_to_sell.market_value and len(t.players) < 30]
+                    
+                    # Filter for teams that are likely to be interested (i.e., player would be an improvement)
+                    interested_buyers = [t for t in eligible_buyers if player_to_sell.ovr > t.get_team_ovr() - 15] # AI won't buy much worse player
+                    
+                    if interested_buyers and random.random() < 0.8: # High chance of an offer if interested buyers exist
+                        # Give preference to richer, stronger teams from international leagues
+                        international_league_groups_keys = ["Premier League", "La Liga", "Serie A", "Ligue 1"]
+                        strong_buyers = [t for t in interested_buyers if t.league in international_league_groups_keys and t.budget > player_to_sell.market_value * 1.5]
+                        
+                        buyer = None
+                        if strong_buyers and random.random() < 0.7: # 70% chance a strong buyer makes an offer
+                            buyer = random.choice(strong_buyers)
+                            offer_amount = int(player_to_sell.market_value * random.uniform(1.1, 1.5)) # Strong buyers offer more
+                        elif interested_buyers: # Otherwise, a regular interested buyer
+                            buyer = random.choice(interested_buyers)
+                            offer_amount = int(player_to_sell.market_value * random.uniform(0.9, 1.2)) # Regular offer
+
+                        if buyer:
+                            console.print(f"\n[bold green]Offer received for {player_to_sell.name} from {buyer.name} for [yellow]€{offer_amount:,}[/yellow]![/bold green]")
+                            confirm = console.input("[bold yellow]Accept offer? (yes/no): [/bold yellow]").lower()
+                            if confirm == 'yes':
+                                user_team.budget += offer_amount
+                                buyer.budget -= offer_amount
+                                user_team.remove_player(player_to_sell)
+                                buyer.add_player(player_to_sell)
+                                console.print(f"\n[bold green]SUCCESS! {player_to_sell.name} sold to {buyer.name} for €{offer_amount:,}![/bold green]")
+                            else: console.print("[red]Offer declined.[/red]")
+                        else:
+                            console.print(f"\n[yellow]No suitable offers came in for {player_to_sell.name} at this time.[/yellow]")
+                    else: console.print(f"\n[yellow]No offers came in for {player_to_sell.name} at this time.[/yellow]")
+                else: console.print("[red]Invalid input.[/red]")
+            except (ValueError, IndexError): console.print("[red]Invalid input.[/red]")
+        elif choice == '4': run_youth_promotions(user_team)
+        elif choice == '5': break
+        elif choice == '6':
+            scouting = scouting or ScoutingIndex(all_club_teams)
+            run_scout_search(user_team, market, scouting)
+        else: console.print("[red]Invalid choice.[/red]")
+
+
+def serialize_manager_state(all_club_teams, user_team_name, season_count):
+    return {
+        "all_club_teams": (t.to_dict() for t in all_club_teams), # Streamed club by club by the save backend
+        "user_team_name": user_team_name,
+        "season_count": season_count
+    }
+
+def deserialize_manager_state(data, lazy=True):
+    """
+    Rebuilds the Manager Mode world from a save. With lazy=True only the user's
+    league and the playoff clubs are built up front; every other club is a
+    LazyTeam stub whose roster is built the first time it is used.
+    """
+    club_data = data["all_club_teams"]
+    user_league = next(t.get("league") for t in club_data if t["name"] == data["user_team_name"])
+    all_teams_map = {}
+    all_club_teams = []
+    for t_data in club_data:
+        if lazy and t_data.get("league") not in (user_league, "Domestic Playoff"):
+            team = LazyTeam(t_data)
+        else:
+            team = Team.from_dict(t_data)
+        all_club_teams.append(team)
+        all_teams_map[team.name] = team
+    
+    user_team = all_teams_map[data["user_team_name"]]
+    season_count = data["season_count"]
+    
+    # Reconstruct league_teams and playoff_teams based on current user_team's league
+    league_teams = [t for t in all_club_teams if t.league == user_team.league and t.league != "Domestic Playoff"]
+    playoff_teams = [t for t in all_club_teams if t.league == "Domestic Playoff"]
+
+    return all_club_teams, league_teams, playoff_teams, user_team, season_count
+
+def handle_job_offers(user_team, all_club_teams, season_number, current_league_teams_sorted, policy=None): # Added current_league_teams_sorted
+    console.print("\n[bold blue]--- Evaluating Manager Job Offers ---[/bold blue]")
+    offers = []
+    
+    international_league_groups_keys = ["Premier League", "La Liga", "Serie A", "Ligue 1"]
+    
+    # Conditions for receiving offers
+    if user_team.stadium_level > 50 and user_team.academy_level > 50 and season_number > 3:
+        # User success factor (e.g., top 3 in current league)
+        user_team_position = -1
+        for i, team in enumerate(current_league_teams_sorted):
+            if team == user_team:
+                user_team_position = i
+                break
+        
+        success_factor = 0
+        if user_team_position != -1 and user_team_position < 3: # Top 3
+            success_factor = 1
+        elif user_team_position != -1 and user_team_position < 8: # Top half
+            success_factor = 0.5
+        
+        if success_factor > 0:
+            # Filter for clubs in bigger leagues that might be interested
+            eligible_clubs = []
+            for club in all_club_teams:
+                if club.league in international_league_groups_keys and club != user_team:
+                    # Basic criteria: user's OVR is high, and the target club is "better" but not astronomically so
+                    if user_team.get_team_ovr() >= club.get_team_ovr() - 10 and user_team.get_team_ovr() <= club.get_team_ovr() + 10: # Similar OVR
+                        eligible_clubs.append(club)
+                    elif user_team.get_team_ovr() >= 100 and club.get_team_ovr() > user_team.get_team_ovr(): # User is strong, target is stronger
+                         eligible_clubs.append(club)
+            
+            if eligible_clubs:
+                # Offer a few random offers
+                random.shuffle(eligible_clubs)
+                for _ in range(random.randint(1, min(3, len(eligible_clubs)))):
+                    offer_club = eligible_clubs.pop(0)
+                    offer_budget = int(offer_club.budget * random.uniform(0.8, 1.2))
+                    offers.append({"club": offer_club, "budget": offer_budget})
+    
+    if offers:
+        console.print(Panel("[bold green]*** Exciting News! You've received job offers! ***[/bold green]", title="[bold yellow]Job Offers[/bold yellow]", border_style="green"))
+        for i, offer in enumerate(offers):
+            console.print(f"[{i+1}] [cyan]{offer['club'].name}[/cyan] (League: [blue]{offer['club'].league}[/blue]) - Offered Budget: [yellow]€{offer['budget']:,}[/yellow]")
+        
+        accepted_offer = (policy or InteractivePolicy()).choose_job_offer(user_team, offers)
+        if accepted_offer is not None:
+            new_user_team = accepted_offer['club']
+            
+            # Make the old user_team an AI team by assigning a default budget/settings
+            # This ensures the old team doesn't just disappear or break game logic
+            user_team.budget = int(user_team.budget * random.uniform(0.5, 0.8)) # Old team budget might drop
+            user_team.stadium_level = max(1, user_team.stadium_level - random.randint(0, 5))
+            user_team.academy_level = max(1, user_team.academy_level - random.randint(0, 5))
+            
+            new_user_team.budget = accepted_offer['budget'] # New budget from the offer
+            
+            console.print(f"\n[bold green]Congratulations! You have accepted the job at {new_user_team.name}![/bold green]")
+            return new_user_team # Only return new user team, main will manage leagues
+    else:
+        console.print("[yellow]No job offers received this season.[/yellow]")
+    
+    return user_team # No change if no offers or declined
+
+def run_season(all_club_teams, league_teams, playoff_teams, user_team, season_number, policy=None, standings=None): # Added all_club_teams
+    """Plays one Manager Mode season. ``standings``, if given, is filled with the final league table."""
+    policy = policy or InteractivePolicy()
+    console.print(f"\n[bold green]{ '='*20}SEASON {season_number} {'='*20}[/bold green]", style="bold blue")
+    
+    if season_number > 1:
+        run_off_season_training(all_club_teams, user_team) # Pass user_team_ref
+        restock_youth_academy(all_club_teams, user_team) # Pass user_team_ref
+        policy.promote_youth(user_team)
+
+    # Only reset stats for teams in the current league and playoffs
+    for team in league_teams + playoff_teams:
+        reset_all_team_stats([team])
+        reset_player_season_stats([team])
+    
+    # Reset stats for all other teams that might be participating in cups later (stubs stay unbuilt)
+    for team in all_club_teams:
+        if team not in league_teams and team not in playoff_teams:
+            reset_all_team_stats([team])
+            reset_player_season_stats([team])
+    season_leaders.reset() # The season's leaderboards fill up as matches record goals, assists and clean sheets
+
+
+    main_league = League(league_teams)
+    main_league.fixtures = generate_fixtures(list(main_league.teams.values())) 
+    scouting = ScoutingIndex(all_club_teams) # Kept up to date through the season's transfers
+    # Every other league plays its season in the background, one worker process per league, in two halves
+    other_leagues = simulate_other_leagues(all_club_teams, {user_team.league}, leaderboards=season_leaders)
+    
+    mid_season_matchday_index = len(main_league.fixtures) // 2
+
+    # --- Start of Season Financials ---
+    console.print("\n[bold blue]--- Start of Season Financials ---[/bold blue]")
+    
+    # All teams receive sponsorship
+    for team in all_club_teams:
+        # Only offer sponsorship if not user team or if user team explicitly accepts
+        if team == user_team:
+            sponsorship_offer = generate_sponsorship_offer(user_team.get_team_ovr())
+            console.print(f"You received a sponsorship offer of [yellow]€{sponsorship_offer:,}[/yellow]!")
+            if policy.accept_sponsorship(user_team, sponsorship_offer):
+                user_team.budget += sponsorship_offer
+                console.print(f"[bold green]Sponsorship accepted! Your new budget is [yellow]€{user_team.budget:,}[/yellow].[/bold green]")
+            else:
+                console.print("[yellow]Sponsorship declined.[/yellow]")
+        else: # AI teams automatically accept sponsorship
+            ai_sponsorship_offer = generate_sponsorship_offer(team.get_team_ovr())
+            saved = saved_data(team)
+            if saved is not None: # Credited to an unbuilt stub's saved dict rather than building it
+                saved["budget"] += ai_sponsorship_offer
+            else:
+                team.budget += ai_sponsorship_offer
+            # console.print(f"[AI Financials] {team.name} received €{ai_sponsorship_offer:,} from sponsorship.") # Suppressed
+
+
+    # CUP DE GURU (Knockout, top 8 domestic teams)
+    domestic_teams_sorted_by_ovr = sorted([t for t in all_club_teams if t.league == user_team.league and t.league != "Domestic Playoff"], key=lambda t: t.get_team_ovr(), reverse=True)
+    cup_de_guru_participants = domestic_teams_sorted_by_ovr[:8]
+    CUP_DE_GURU_PRIZES = {"winner": 10_000_000, "runner_up": 5_000_000, "semi_finalist": 2_000_000}
+
+    # SILVER CUP (Home and away, 16 teams - 8 domestic, 8 random international)
+    silver_cup_domestic_participants = random.sample([t for t in all_club_teams if t.league == user_team.league and t.league != "Domestic Playoff"], min(8, len(league_teams)))
+    
+    console.print("\n[bold blue]--- Preparing Silver Cup Participants ---[/bold blue]")
+    international_league_groups_keys = ["Premier League", "La Liga", "Serie A", "Ligue 1"] # For filtering
+    
+    silver_cup_international_participants = []
+    # Select from already created international club teams
+    available_international_clubs = [t for t in all_club_teams if t.league in international_league_groups_keys]
+    
+    random.shuffle(available_international_clubs)
+    silver_cup_international_participants = available_international_clubs[:8] # Take up to 8 unique international teams
+    
+    silver_cup_participants = silver_cup_domestic_participants + silver_cup_international_participants
+    random.shuffle(silver_cup_participants) # Mix them up
+    SILVER_CUP_PRIZES = {"winner": 15_000_000, "runner_up": 7_000_000}
+
+
+    for i, matchday in enumerate(main_league.fixtures):
+        console.print(f"\n[bold blue]--- Matchday {i + 1} - Weekly Wage Payment ---[/bold blue]")
+        for team in league_teams + playoff_teams: 
+            wage_deduction = team.total_wage_bill
+            team.budget -= wage_deduction
+            if team == user_team: # Only print weekly wages for user's team
+                console.print(f"[green]{team.name}[/green] paid [red]€{wage_deduction:,}[/red] in wages. New budget: [yellow]€{team.budget:,}[/yellow]")
+            
+        # AI-vs-AI fixtures are played in the background while the user is in the menus below
+        ai_fixtures = SpeculativeMatchday([(home, away) for home, away in matchday if home != user_team and away != user_team], leaderboards=season_leaders)
+        policy.manage_club(user_team)
+
+        if i == mid_season_matchday_index:
+            other_leagues.merge() # First half of the other leagues, credited before anyone changes clubs
+            run_transfer_window(league_teams, user_team, "Mid-Season", all_club_teams, policy, scouting) # Pass all_club_teams
+            other_leagues.play_second_half()
+        
+        if i == len(main_league.fixtures) // 4: # Roughly quarter-season
+            console.print(f"\n[bold green]{'='*50}\n{' '*15}CUP DE GURU Quarter-Finals!\n{'='*50}[/bold green]", style="bold blue")
+            simulate_knockout_cup(cup_de_guru_participants, "Cup De Guru", CUP_DE_GURU_PRIZES, user_team)
+            console.print(f"\n[bold green]{'='*50}\n{' '*15}CUP DE GURU Concluded!\n{'='*50}[/bold green]", style="bold blue")
+
+        if i == len(main_league.fixtures) // 2 + len(main_league.fixtures) // 4: # Roughly three-quarter season
+            console.print(f"\n[bold green]{'='*50}\n{' '*15}SILVER CUP Group Stage/First Rounds!\n{'='*50}[/bold green]", style="bold blue")
+            simulate_home_away_cup(silver_cup_participants, "Silver Cup", SILVER_CUP_PRIZES, user_team)
+            console.print(f"\n[bold green]{'='*50}\n{' '*15}SILVER CUP Concluded!\n{'='*50}[/bold green]", style="bold blue")
+
+
+        console.print(f"\n[bold blue]--- Matchday {i + 1}/{len(main_league.fixtures)} ---[/bold blue]")
+        user_match_found = False
+        for home, away in matchday:
+            if home == user_team or away == user_team:
+                console.print(f"Your next match: [cyan]{home.name}[/cyan] vs [cyan]{away.name}[/cyan]")
+                user_match_found = True
+                break
+        if not user_match_found:
+            console.print("[yellow]Your team has no match this matchday.[/yellow]")
+        
+        policy.before_matchday(user_team)
+        
+        console.print(f"\n[bold blue]--- Matchday {i + 1} Results ---[/bold blue]")
+        if not matchday:
+            console.print("[yellow]No matches scheduled for this matchday.[/yellow]")
+            continue
+        # AI-vs-AI results are committed (or replayed if a squad changed); the user's match keeps the live commentary
+        for (home, away), (home_goals, away_goals) in zip(ai_fixtures.matchday, ai_fixtures.commit()):
+            main_league.record_result(home, away, home_goals, away_goals)
+        for home, away in matchday:
+            if home is None or away is None: 
+                continue
+            if home == user_team or away == user_team: # Only print result if user's team is involved
+                # Unattended runs play the user's match silently too
+                home_goals, away_goals = simulate_match(home, away, user_team_ref=user_team, sink=None if policy.interactive else NULL_SINK, leaderboards=season_leaders)
+                main_league.record_result(home, away, home_goals, away_goals)
+                console.print(f"[cyan]{home.name}[/cyan] [bold red]{home_goals}[/bold red] - [bold red]{away_goals}[/bold red] [cyan]{away.name}[/cyan]")
+                
+                # Social Media Feed after user match
+                user_win = (home == user_team and home_goals > away_goals) or (away == user_team and away_goals > home_goals)
+                user_draw = (home_goals == away_goals)
+                
+                tweets = []
+                if user_win:
+                    tweets = [
+                        f"@Fanatic: What a win! {user_team.name} are cooking! 🔥",
+                        f"@StatsGuru: {user_team.name} haven't played this well in years. Tactical masterclass.",
+                        f"@LocalNews: Manager's reputation is skyrocketing after today! #Legend"
+                    ]
+                    user_team.reputation = min(100, user_team.reputation + 2)
+                elif user_draw:
+                    tweets = [
+                        f"@Neutral: Fair result. Both teams looked tired.",
+                        f"@AngryFan: Should have won that. Two points dropped! 😡"
+                    ]
+                else:
+                    tweets = [
+                        f"@TrollFootball: {user_team.name} are officially a banter club. 😂",
+                        f"@Pundit: I don't see how the manager survives this. Dreadful.",
+                        f"@Frustrated: #ManagerOut. Enough is enough."
+                    ]
+                    user_team.reputation = max(0, user_team.reputation - 2)
+                
+                console.print(Panel("\n".join(random.sample(tweets, 2)), title="[bold blue]Social Media Feed[/bold blue]", border_style="cyan"))
+            
+        main_league.matchdays_played = i + 1
+        main_league.update_table()
+        main_league.print_table(focus=user_team)
+        if policy.interactive and main_league.matchdays_played < len(main_league.fixtures):
+            print_title_race(forecast_season(main_league), user_team.name)
+            print_top_scorers(user_team)
+
+    console.print("\n[bold green]--- SEASON OVER ---[/bold green]", style="bold blue")
+    console.print("[bold blue]Final League Table:[/bold blue]")
+    main_league.print_table()
+    if standings is not None:
+        standings[:] = main_league.table
+
+    console.print("\n[bold blue]--- Around the World ---[/bold blue]")
+    print_league_champions(all_club_teams, other_leagues.merge())
+
+    console.print("\n[bold blue]--- End of Season Financials ---[/bold blue]")
+    prize_money = [
+        50_000_000, 45_000_000, 40_000_000, 35_000_000, 30_000_000,
+        25_000_000, 22_000_000, 20_000_000, 18_000_000, 16_000_000,
+        14_000_000, 12_000_000, 10_000_000, 8_000_000
+    ]
+    for i, team in enumerate(main_league.table):
+        if i < len(prize_money): 
+            reward = prize_money[i]
+            team.budget += reward
+            if team == user_team: # Only print prize money for user's team
+                console.print(f"[bold green][PRIZE MONEY][/bold green] [cyan]{team.name}[/cyan] awarded [yellow]€{reward:,}[/yellow] for finishing {i+1}.")
+
+    # Merchandise Revenue - now for all teams
+    for team in all_club_teams:
+        # Use main_league.table for all teams to determine their relative position for merch calculation
+        merch_revenue = calculate_merchandise_revenue(team, main_league.table)
+        team.budget += merch_revenue
+        if team == user_team: # Only print merchandise revenue for user's team
+            console.print(f"[bold green][FINANCIALS][/bold green] [cyan]{team.name}[/cyan] generated [yellow]€{merch_revenue:,}[/yellow] from merchandise sales.")
+
+
+    # Final Sacking Check (only at end of season)
+    if user_team.budget < 0:
+        console.print(f"\n[bold red]CRITICAL: Your budget is €{user_team.budget:,} even after prize money![/bold red]")
+        console.print("[bold red]MANAGER SACKED! The board has decided to let you go.[/bold red]")
+        return None, None, None, None # Return None for all if sacked
+    
+    # AI Team Bailout: Ensure AI teams don't go bankrupt and can still compete
+    for team in all_club_teams:
+        if team != user_team and team.budget < 0:
+            team.budget = 200_000_000 # Bailout for AI teams in debt
+            console.print(f"[bold yellow][AI BAILOUT][/bold yellow] [cyan]{team.name}[/cyan] was in debt and received a [green]€200,000,000 bailout![/green]")
+    
+    # International Competition Prize Structures
+    CL_PRIZES = {"winner": 100_000_000, "runner_up": 50_000_000, "participation": 15_000_000}
+    EL_PRIZES = {"winner": 40_000_000, "runner_up": 20_000_000, "participation": 8_000_000}
+    COL_PRIZES = {"winner": 20_000_000, "runner_up": 10_000_000, "participation": 4_000_000}
+
+    # Continental qualification: direct places from the user's league table, the rest by squad strength
+    international_league_groups_keys = ["Premier League", "La Liga", "Serie A", "Ligue 1"]
+    rules = continental_rules(user_team.league, international_league_groups_keys)
+    continental_participants = allocate(rules, all_club_teams, {user_team.league: main_league.table})
+    competition_prizes = {"Champions League": CL_PRIZES, "Europa League": EL_PRIZES, "Conference League": COL_PRIZES}
+
+    for rule in rules:
+        name, participants, prizes = rule.competition, continental_participants[rule.competition], competition_prizes[rule.competition]
+        if len(participants) >= rule.size:
+            console.print(f"\n[bold green]{'='*50}\n{' '*15}{name.upper()}!\n{'='*50}[/bold green]", style="bold blue")
+            group_qualifiers = simulate_competition_group_stage(participants, name, user_team, prizes)
+            simulate_competition_knockout_stage(group_qualifiers, name, prizes, user_team)
+        else:
+            console.print(f"\n[bold yellow]Not enough teams ({len(participants)}) for a full {name} simulation. Falling back to simplified.[/bold yellow]")
+            simulate_international_tournament(participants, name, prizes, user_team)
+
+    # World Cup integration
+    if season_number % 4 == 0: 
+        simulate_world_cup(all_club_teams, user_team, scouting) # Call-ups come from the scouting index
+
+    present_season_awards(user_team) # Read off the season leaderboards
+
+    # Determine promoted/relegated teams from the domestic league
+    # This logic only applies to the "Domestic League" and "Domestic Playoff"
+    # Need to correctly identify the current domestic league teams for relegation/promotion logic
+    
+    # If the user is in a "Domestic League"
+    if user_team.league == "Domestic League":
+        # Ensure main_league.table is updated before getting relegated teams
+        main_league.update_table() 
+        relegated_teams_from_user_league = main_league.table[-2:] # Assuming last 2 are relegated
+        domestic_playoff_teams_current = sorted([t for t in all_club_teams if t.league == "Domestic Playoff"], key=lambda t: (t.points, t.goal_difference, t.goals_for), reverse=True) # Playoff league table order
+        
+        promoted_to_user_league, demoted_from_user_league_playoffs = run_playoffs(relegated_teams_from_user_league, domestic_playoff_teams_current, user_team)
+        
+        # Update leagues for affected teams in all_club_teams
+        for team in relegated_teams_from_user_league:
+            team.league = "Domestic Playoff" # Relegated teams go to playoff league
+        for team in promoted_to_user_league:
+            team.league = "Domestic League" # Promoted teams come to domestic league
+        for team in demoted_from_user_league_playoffs:
+            team.league = "Domestic Playoff" # Teams that stayed in playoff league
+            
+    run_transfer_window(league_teams, user_team, "End of Season", all_club_teams, policy, scouting) # Pass all_club_teams
+
+    # Manager Job Offers (after transfer window to account for new squad/budget)
+    new_user_team = handle_job_offers(user_team, all_club_teams, season_number, main_league.table, policy) # Pass sorted current league table
+
+    # If user changed teams, update the league_teams and playoff_teams accordingly
+    if new_user_team != user_team:
+        user_team = new_user_team
+        # Reconstruct league_teams and playoff_teams based on the new user_team's league
+        league_teams = [t for t in all_club_teams if t.league == user_team.league and t.league != "Domestic Playoff"]
+        # Playoff teams: if user moves to a non-domestic league, this list might be empty or still refer to domestic playoffs
+        # For simplicity, we'll keep domestic playoff teams as the only ones for now.
+        if user_team.league == "Domestic League":
+            playoff_teams = [t for t in all_club_teams if t.league == "Domestic Playoff"]
+        else:
+            playoff_teams = [] # International leagues typically don't have this playoff structure in this game
+        
+        console.print(f"\n[bold green]--- NEW LEAGUE: {user_team.league} ---[/bold green]")
+
+    else: # If user didn't change teams, update league/playoff teams based on current league changes
+        league_teams = [t for t in all_club_teams if t.league == user_team.league and t.league != "Domestic Playoff"]
+        if user_team.league == "Domestic League":
+            playoff_teams = [t for t in all_club_teams if t.league == "Domestic Playoff"]
+        else:
+            playoff_teams = [] # International leagues typically don't have this playoff structure in this game
+
+
+    return all_club_teams, league_teams, playoff_teams, user_team 
+
+def run_headless_career(seasons, seed=None, policy=None, verbose=False):
+    """
+    Plays a Manager Mode career of up to ``seasons`` seasons without any prompts,
+    letting ``policy`` (GreedyPolicy by default) make the user's decisions.
+    Returns one summary dict per completed season; a sacking ends the career early.
+    """
+    random.seed(seed)
+    seed_engine(seed)
+    policy = policy or GreedyPolicy()
+    console.quiet = not verbose # Every module prints through the shared console
+    try:
+        all_club_teams = create_teams()
+        user_team = random.choice([t for t in all_club_teams if t.league == "Domestic League"])
+        league_teams = [t for t in all_club_teams if t.league == user_team.league and t.league != "Domestic Playoff"]
+        playoff_teams = [t for t in all_club_teams if t.league == "Domestic Playoff"]
+        history = []
+        for season_number in range(1, seasons + 1):
+            table = [] # Final league table, with the head-to-head tie-breaks
+            all_club_teams, league_teams, playoff_teams, new_user_team = run_season(all_club_teams, league_teams, playoff_teams, user_team, season_number, policy, table)
+            history.append({
+                "season": season_number,
+                "club": user_team.name,
+                "league": user_team.league,
+                "position": table.index(user_team) + 1 if user_team in table else None,
+                "points": user_team.points,
+                "budget": user_team.budget,
+                "team_ovr": user_team.get_team_ovr(),
+                "sacked": new_user_team is None
+            })
+            if new_user_team is None:
+                break
+            user_team = new_user_team
+        return history
+    finally:
+        console.quiet = False
@@ -0,0 +1,268 @@
+import numpy as np
+
+from .leaderboards import first_choice_keeper
+from .models import saved_data
+from .parallel import get_thread_pool
+
+# Batch match engine. Plays many fixtures at once with NumPy using the same
+# minute-by-minute model as game_logic.simulate_match: each minute has a 10%
+# chance of an event, the attacking side is picked by OVR share and a random
+# eligible player converts with probability ovr/220. Per minute that is a
+# three-way draw (home goal / away goal / nothing), so a whole match is a
+# single multinomial sample and the scorer of each goal is a draw weighted
+# by player OVR. Assisters are drawn the same way (a goal is unassisted when
+# the draw lands on the scorer), and a side that concedes nothing credits a
+# clean sheet to its first-choice keeper. Every player whose season totals
+# change is filed in the running season leaderboards.
+
+MATCH_MINUTES = 90
+EVENT_CHANCE = 0.1
+SCORING_DIVISOR = 220
+ASSIST_CHANCE = 0.75 # Share of goals with an assist, before excluding self-assists
+
+_rng = np.random.default_rng()
+
+def seed_engine(seed):
+    """Reseeds the engine's random stream (used for reproducible runs)."""
+    global _rng
+    _rng = np.random.default_rng(seed)
+
+def eligible_players(team):
+    """Players available for selection, falling back to the full squad like simulate_match."""
+    eligible = [p for p in team.players if p.injury_days == 0 and not p.is_banned]
+    return eligible if eligible else team.players
+
+def saved_pool(saved):
+    """eligible_players() for an unbuilt stub: slots into its saved ``players`` dicts."""
+    players = saved["players"]
+    eligible = [k for k, p in enumerate(players) if p.get("injury_days", 0) == 0 and not p.get("is_banned", False)]
+    return eligible if eligible else list(range(len(players)))
+
+def minute_goal_chances(home_ovr, away_ovr, home_finishing, away_finishing):
+    """Per-minute probability of a home goal and of an away goal.
+
+    ``*_finishing`` is the mean conversion chance (ovr/220) of the side's eligible pool.
+    """
+    total = home_ovr + away_ovr
+    home_share = np.divide(home_ovr, total, out=np.full(np.shape(total), 0.5), where=total > 0)
+    home_chance = EVENT_CHANCE * home_share * home_finishing
+    away_chance = EVENT_CHANCE * (1 - home_share) * away_finishing
+    return home_chance, away_chance
+
+def play_goals(home_chance, away_chance, minutes=MATCH_MINUTES, rng=None):
+    """Samples (home_goals, away_goals) arrays for fixtures with the given per-minute chances."""
+    rng = rng if rng is not None else _rng
+    # Multinomial over (home goal, away goal, nothing) drawn as two chained binomials,
+    # which vectorizes far better than Generator.multinomial with per-row pvals
+    home_goals = rng.binomial(minutes, home_chance)
+    away_goals = rng.binomial(minutes - home_goals, away_chance / (1 - home_chance))
+    return home_goals, away_goals
+
+class TeamProfiles:
+    """Flat array view of a set of teams: OVR, finishing and the OVR-weighted scorer pools.
+
+    Unbuilt LazyTeam stubs are profiled from their saved dicts, so snapshotting
+    them builds nothing; their pool entries are (team, slot) pairs until
+    live_players() is called.
+    """
+    def __init__(self, teams):
+        self.teams = list(teams)
+        self.index = {id(t): i for i, t in enumerate(self.teams)}
+        self.players = []
+        offsets = [0]
+        weights = []
+        ovrs = []
+        finishing = []
+        for team in self.teams:
+            ovrs.append(team.get_team_ovr())
+            saved = saved_data(team)
+            if saved is None:
+                pool = eligible_players(team)
+                pool_weights = [min(p.ovr, SCORING_DIVISOR) for p in pool]
+            else:
+                pool = [(team, k) for k in saved_pool(saved)]
+                pool_weights = [min(saved["players"][k]["ovr"], SCORING_DIVISOR) for _, k in pool]
+            finishing.append(sum(pool_weights) / (len(pool) * SCORING_DIVISOR) if pool else 0.0)
+            self.players.extend(pool)
+            weights.extend(pool_weights)
+            offsets.append(len(self.players))
+        self.ovr = np.array(ovrs, dtype=float)
+        self.finishing = np.array(finishing, dtype=float)
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.cumulative_weights = np.cumsum(np.array(weights, dtype=float))
+
+    def live_players(self):
+        """``players`` with every stub's (team, slot) pair replaced by its Player, building those stubs."""
+        for i, entry in enumerate(self.players):
+            if isinstance(entry, tuple):
+                team, k = entry
+                self.players[i] = team.loaded_player(k)
+        return self.players
+
+    def pick_scorers(self, team_idx, goals, rng=None):
+        """Returns flat player indices of the scorers for ``goals[i]`` goals by ``team_idx[i]``."""
+        return pick_scorers(self.offsets, self.cumulative_weights, team_idx, goals, rng)
+
+def pick_scorers(offsets, cumulative_weights, team_idx, goals, rng=None):
+    """OVR-weighted scorer draw over flat player pools (see TeamProfiles)."""
+    rng = rng if rng is not None else _rng
+    scoring_teams = np.repeat(team_idx, goals)
+    if scoring_teams.size == 0:
+        return scoring_teams
+    cum = np.concatenate(([0.0], cumulative_weights))
+    low = cum[offsets[scoring_teams]]
+    high = cum[offsets[scoring_teams + 1]]
+    draws = low + rng.random(scoring_teams.size) * (high - low)
+    scorers = np.searchsorted(cumulative_weights, draws, side="right")
+    # Guard against float rounding at the upper edge of a pool
+    return np.minimum(scorers, offsets[scoring_teams + 1] - 1)
+
+def pick_assisters(offsets, cumulative_weights, team_idx, goals, scorers, rng=None):
+    """Flat player index of the assister of each goal in ``scorers`` (from pick_scorers), -1 if unassisted."""
+    rng = rng if rng is not None else _rng
+    assisters = pick_scorers(offsets, cumulative_weights, team_idx, goals, rng)
+    assisted = (rng.random(assisters.size) < ASSIST_CHANCE) & (assisters != scorers)
+    return np.where(assisted, assisters, -1)
+
+def player_counts(picks, n_players):
+    """Per-player counts of the flat player indices in ``picks`` (-1 entries ignored)."""
+    return np.bincount(picks[picks >= 0], minlength=n_players)
+
+def simulate_matchday(matchday, rng=None, leaderboards=None):
+    """Simulates every fixture of a matchday at once and records the results.
+
+    Updates Team stats and player season totals exactly like simulate_match and
+    returns a list of (home_goals, away_goals) in fixture order.
+    """
+    return simulate_fixtures([matchday], rng=rng, leaderboards=leaderboards)[0]
+
+def simulate_fixtures(matchdays, rng=None, leaderboards=None):
+    """Simulates a list of matchdays (e.g. from generate_fixtures) in one batch.
+
+    Returns one list of (home_goals, away_goals) per matchday. Byes (None) are skipped
+    and reported as (0, 0), matching simulate_match. Like simulate_match, goals,
+    assists and clean sheets reach ``leaderboards`` only when it is given.
+    """
+    rng = rng if rng is not None else _rng
+    fixtures, profiles, home_idx, away_idx = _fixture_batch(matchdays)
+    if not fixtures:
+        return [[(0, 0) for _ in matchday] for matchday in matchdays]
+    home_goals, away_goals, scorers, assisters = _play_batch(profiles, home_idx, away_idx, rng)
+    record_results(profiles, home_idx, away_idx, home_goals, away_goals, scorers, assisters, leaderboards)
+    return _results_by_matchday(matchdays, home_goals, away_goals)
+
+def _fixture_batch(matchdays):
+    """Returns (fixtures, profiles, home_idx, away_idx) for the non-bye fixtures of ``matchdays``."""
+    fixtures = [(h, a) for matchday in matchdays for h, a in matchday if h is not None and a is not None]
+    teams = {}
+    for home, away in fixtures:
+        teams.setdefault(id(home), home)
+        teams.setdefault(id(away), away)
+    profiles = TeamProfiles(teams.values())
+    home_idx = np.array([profiles.index[id(h)] for h, _ in fixtures], dtype=np.int64)
+    away_idx = np.array([profiles.index[id(a)] for _, a in fixtures], dtype=np.int64)
+    return fixtures, profiles, home_idx, away_idx
+
+def _play_batch(profiles, home_idx, away_idx, rng):
+    """Samples goals, scorers and assisters for a batch without touching any Team or Player."""
+    home_chance, away_chance = minute_goal_chances(
+        profiles.ovr[home_idx], profiles.ovr[away_idx],
+        profiles.finishing[home_idx], profiles.finishing[away_idx]
+    )
+    home_goals, away_goals = play_goals(home_chance, away_chance, rng=rng)
+    team_idx, goals = np.concatenate((home_idx, away_idx)), np.concatenate((home_goals, away_goals))
+    scorers = profiles.pick_scorers(team_idx, goals, rng)
+    assisters = pick_assisters(profiles.offsets, profiles.cumulative_weights, team_idx, goals, scorers, rng)
+    return home_goals, away_goals, scorers, assisters
+
+def _results_by_matchday(matchdays, home_goals, away_goals):
+    results = iter(zip(home_goals.tolist(), away_goals.tolist()))
+    return [[next(results) if h is not None and a is not None else (0, 0) for h, a in matchday] for matchday in matchdays]
+
+def _speculate(matchday, seed):
+    """Builds a matchday's profiles and plays it; the background job behind SpeculativeMatchday."""
+    _, profiles, home_idx, away_idx = _fixture_batch([matchday])
+    return (profiles, home_idx, away_idx) + _play_batch(profiles, home_idx, away_idx, np.random.default_rng(seed))
+
+class SpeculativeMatchday:
+    """A matchday played ahead of time on the background thread, e.g. while the user is in menus.
+
+    Only each team's squad_version is stamped on the calling thread; building
+    the profiles and the draw both run in the background. commit() records the
+    precomputed results if every stamp still matches; if a squad changed in the
+    meantime (a transfer, an OVR change, possibly while the profiles were being
+    built) the speculation is discarded and the matchday replayed on the current
+    squads with the same seed, so the outcome never depends on whether the
+    speculation was used. Injuries and bans are not tracked by squad_version,
+    but nothing changes them mid-season. Results reach ``leaderboards`` only
+    when it is given.
+    """
+    def __init__(self, matchday, rng=None, leaderboards=None):
+        rng = rng if rng is not None else _rng
+        self.matchday = matchday
+        self.leaderboards = leaderboards
+        self.seed = int(rng.integers(2**63))
+        self.replayed = False
+        teams = {id(t): t for fixture in matchday for t in fixture if t is not None}
+        self.teams = list(teams.values())
+        self.versions = [t.squad_version for t in self.teams]
+        self.future = get_thread_pool().submit(_speculate, matchday, self.seed) if self.teams else None
+
+    def commit(self):
+        """Records the matchday's results and returns (home_goals, away_goals) per fixture like simulate_matchday."""
+        if self.future is None:
+            return [(0, 0) for _ in self.matchday]
+        if [t.squad_version for t in self.teams] == self.versions:
+            profiles, home_idx, away_idx, home_goals, away_goals, scorers, assisters = self.future.result()
+        else:
+            self.future.cancel()
+            self.replayed = True
+            profiles, home_idx, away_idx, home_goals, away_goals, scorers, assisters = _speculate(self.matchday, self.seed)
+        record_results(profiles, home_idx, away_idx, home_goals, away_goals, scorers, assisters, self.leaderboards)
+        return _results_by_matchday([self.matchday], home_goals, away_goals)[0]
+
+def record_results(profiles, home_idx, away_idx, home_goals, away_goals, scorers, assisters, leaderboards=None):
+    """Writes batch results back into Team season stats and player season totals, and ``leaderboards`` if given."""
+    tally = tally_results(len(profiles.teams), home_idx, away_idx, home_goals, away_goals)
+    n = len(profiles.players)
+    apply_results(profiles.teams, profiles.players, tally, player_counts(scorers, n), player_counts(assisters, n), leaderboards)
+
+def tally_results(n, home_idx, away_idx, home_goals, away_goals):
+    """Per-team (played, goals_for, goals_against, wins, draws, losses, clean_sheets) lists for a batch of results."""
+    home_win = home_goals > away_goals
+    away_win = away_goals > home_goals
+    draw = ~(home_win | away_win)
+
+    def per_team(home_values, away_values):
+        return (np.bincount(home_idx, weights=home_values, minlength=n)
+                + np.bincount(away_idx, weights=away_values, minlength=n)).astype(np.int64).tolist()
+
+    return (per_team(np.ones(len(home_idx)), np.ones(len(away_idx))),
+            per_team(home_goals, away_goals), per_team(away_goals, home_goals),
+            per_team(home_win, away_win), per_team(draw, draw), per_team(away_win, home_win),
+            per_team(away_goals == 0, home_goals == 0))
+
+def apply_results(teams, players, tally, goal_counts, assist_counts, leaderboards=None):
+    """Adds a tally_results() tally to ``teams`` and per-player goal and assist counts to ``players``.
+
+    Players whose totals changed are filed in ``leaderboards`` when it is given.
+    """
+    played, goals_for, goals_against, wins, draws, losses, clean_sheets = tally
+    for i, team in enumerate(teams):
+        team.games_played += played[i]
+        team.goals_for += goals_for[i]; team.goals_against += goals_against[i]
+        team.wins += wins[i]; team.draws += draws[i]; team.losses += losses[i]
+        team.points += 3 * wins[i] + draws[i]
+        if clean_sheets[i]:
+            keeper = first_choice_keeper(eligible_players(team))
+            if keeper is not None:
+                keeper.season_clean_sheets += clean_sheets[i]
+                if leaderboards is not None:
+                    leaderboards.record(keeper)
+
+    for i in np.flatnonzero(goal_counts).tolist():
+        players[i].season_goals += int(goal_counts[i])
+    for i in np.flatnonzero(assist_counts).tolist():
+        players[i].season_assists += int(assist_counts[i])
+    if leaderboards is not None:
+        leaderboards.record_all(players[i] for i in np.flatnonzero(goal_counts + assist_counts).tolist())
@@ -0,0 +1,74 @@
+from collections import namedtuple
+import time
+
+# Match event stream emitted by game_logic.simulate_match. A sink decides what
+# to do with it: render it live, record it, or drop it. Sinks with
+# ``verbose = False`` only receive kickoff, goals and full time, and the engine
+# skips generating per-minute ticks and commentary-only events for them.
+
+KICKOFF = "kickoff"
+MINUTE = "minute"
+GOAL = "goal"
+MISS = "miss"
+FULL_TIME = "full_time"
+
+MatchEvent = namedtuple(
+    "MatchEvent",
+    ["kind", "minute", "home", "away", "team", "player", "home_goals", "away_goals"],
+    defaults=(None, None, 0, 0)
+)
+
+class NullSink:
+    """Discards every event. Used for AI-vs-AI fixtures and headless runs."""
+    verbose = False
+
+    def emit(self, event):
+        pass
+
+NULL_SINK = NullSink()
+
+class RecorderSink:
+    """Keeps every event except per-minute ticks, e.g. for replays or tests."""
+    verbose = True
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        if event.kind != MINUTE:
+            self.events.append(event)
+
+    def goals(self):
+        return [e for e in self.events if e.kind == GOAL]
+
+class RichSink:
+    """Renders a match live on the console with a progress spinner and commentary."""
+    verbose = True
+
+    def __init__(self, console, delay=0.1):
+        self.console = console
+        self.delay = delay
+        self.progress = None
+        self.task = None
+
+    def emit(self, event):
+        if event.kind == KICKOFF:
+            from rich.panel import Panel
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            stadium = getattr(event.home, 'stadium_name', f"{event.home.name} Stadium")
+            self.console.print(Panel(f"[bold green]{event.home.name} vs {event.away.name}[/bold green]\n[cyan]Venue: {stadium}[/cyan]"))
+            self.progress = Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True, console=self.console)
+            self.progress.start()
+            self.task = self.progress.add_task("Match in progress...", total=90)
+        elif event.kind == MINUTE:
+            self.progress.update(self.task, advance=1, description=f"Minute {event.minute}' - {event.home_goals}:{event.away_goals}")
+            if event.minute % 15 == 0 and self.delay: time.sleep(self.delay)
+        elif event.kind == GOAL:
+            self.console.print(f"{event.minute}' [bold red]GOAL! {event.player.name} scores for {event.team.name}![/bold red]")
+        elif event.kind == MISS:
+            self.console.print(f"{event.minute}' {event.player.name} misses a great opportunity!")
+        elif event.kind == FULL_TIME:
+            if self.progress is not None:
+                self.progress.stop()
+                self.progress = None
+            self.console.print(f"[bold green]FT: {event.home.name} {event.home_goals} - {event.away_goals} {event.away.name}[/bold green]")
@@ -1,20 +1,94 @@
+from collections.abc import MutableMapping
+import heapq
 import random
+import struct
+import sys
 from .constants import COUNTRIES, POSITIONS, TRAINER_TIERS, ATTRIBUTE_WEIGHTS
 
+_SHARED_ATTRIBUTE_KEYS = {}
+_INT16 = struct.Struct("<h")
+
+class Attributes(MutableMapping):
+    """Dict-like view of a player's attributes.
+
+    Players store attributes as a key tuple shared by every player with the same
+    attribute set plus the values packed as int16 in one small bytes object (a
+    single allocation, versus a 6-entry dict per player); this view reads and
+    writes them.
+    """
+    __slots__ = ("_player",)
+
+    def __init__(self, player):
+        self._player = player
+
+    @staticmethod
+    def shared_keys(keys):
+        """The key tuple shared by every player with attributes ``keys``."""
+        keys = tuple(keys)
+        return _SHARED_ATTRIBUTE_KEYS.setdefault(keys, keys)
+
+    @staticmethod
+    def pack(attributes):
+        """Splits a mapping into its (shared key tuple, value array) storage."""
+        attributes = dict(attributes)
+        values = struct.pack(f"<{len(attributes)}h", *attributes.values())
+        return Attributes.shared_keys(attributes), values
+
+    def _offset(self, key):
+        try:
+            return 2 * self._player._attribute_keys.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __getitem__(self, key):
+        return _INT16.unpack_from(self._player._attribute_values, self._offset(key))[0]
+
+    def __setitem__(self, key, value):
+        if key not in self._player._attribute_keys:
+            self._player.attributes = {**self, key: value}
+            return
+        values = bytearray(self._player._attribute_values)
+        _INT16.pack_into(values, self._offset(key), value)
+        self._player._attribute_values = bytes(values)
+
+    def __delitem__(self, key):
+        if key not in self._player._attribute_keys: raise KeyError(key)
+        self._player.attributes = {k: v for k, v in self.items() if k != key}
+
+    def __iter__(self):
+        return iter(self._player._attribute_keys)
+
+    def __len__(self):
+        return len(self._player._attribute_keys)
+
+    def __contains__(self, key):
+        return key in self._player._attribute_keys
+
+    def __repr__(self):
+        return repr(dict(self))
+
 class Player:
     """Represents a single player with attributes and an overall rating."""
+    # Slotted: large worlds hold 100k+ players and a per-instance __dict__ dominates their footprint
+    __slots__ = (
+        "name", "position", "age", "team", "_ovr", "potential", "_attribute_keys", "_attribute_values", "country",
+        "trainer_level", "season_goals", "season_assists", "season_clean_sheets",
+        "stamina", "morale", "form", "injury_days", "is_banned", "match_streak", "traits"
+    )
+
     def __init__(self, name, position, age, ovr, attributes, country=None, potential=None):
         self.name = name
         self.position = position
         self.age = age
+        self.team = None # This will be set externally when added to a team
         self.ovr = ovr
         self.potential = potential if potential else min(250, ovr + random.randint(5, 45)) # Higher potential ceiling
         self.attributes = attributes
         self.country = country if country else random.choice(COUNTRIES)
         self.trainer_level = 0 
         self.season_goals = 0
+        self.season_assists = 0
         self.season_clean_sheets = 0
-        self.team = None # This will be set externally when added to a team
         
         # New attributes for depth
         self.stamina = 100
@@ -23,7 +97,25 @@ class Player:
         self.injury_days = 0 # Days until recovered
         self.is_banned = False
         self.match_streak = 0 # For "On Fire" logic
-        self.traits = [] # Special abilities
+        self.traits = () # Special abilities (tuple of names, shared empty default)
+
+    @property
+    def ovr(self):
+        return self._ovr
+
+    @ovr.setter
+    def ovr(self, value):
+        self._ovr = value
+        if self.team is not None:
+            self.team._invalidate_rating() # Team rating depends on every player's OVR
+
+    @property
+    def attributes(self):
+        return Attributes(self)
+
+    @attributes.setter
+    def attributes(self, attributes):
+        self._attribute_keys, self._attribute_values = Attributes.pack(attributes)
 
     @property
     def salary(self):
@@ -62,10 +154,11 @@ class Player:
             "age": self.age,
             "ovr": self.ovr,
             "potential": self.potential,
-            "attributes": self.attributes,
+            "attributes": dict(self.attributes),
             "country": self.country,
             "trainer_level": self.trainer_level,
             "season_goals": self.season_goals,
+            "season_assists": self.season_assists,
             "season_clean_sheets": self.season_clean_sheets,
             "stamina": self.stamina,
             "morale": self.morale,
@@ -73,22 +166,31 @@ class Player:
             "injury_days": self.injury_days,
             "is_banned": self.is_banned,
             "match_streak": self.match_streak,
-            "traits": self.traits
+            "traits": list(self.traits)
         }
 
+    def clone(self):
+        """Returns an independent copy without a dict round-trip or touching the global RNG."""
+        player = Player.__new__(Player)
+        for slot in Player.__slots__:
+            setattr(player, slot, getattr(self, slot))
+        player.team = None # Attributes are an immutable bytes object and traits a tuple, so sharing them is copy-on-write
+        return player
+
     @classmethod
     def from_dict(cls, data):
         player = cls(
             data["name"],
-            data["position"],
+            sys.intern(data["position"]), # Loaded saves would otherwise hold one copy of each string per player
             data["age"],
             data["ovr"],
             data["attributes"],
-            data["country"],
+            sys.intern(data["country"]),
             data.get("potential")
         )
         player.trainer_level = data["trainer_level"]
         player.season_goals = data["season_goals"]
+        player.season_assists = data.get("season_assists", 0)
         player.season_clean_sheets = data["season_clean_sheets"]
         player.stamina = data.get("stamina", 100)
         player.morale = data.get("morale", 70)
@@ -96,11 +198,81 @@ class Player:
         player.injury_days = data.get("injury_days", 0)
         player.is_banned = data.get("is_banned", False)
         player.match_streak = data.get("match_streak", 0)
-        player.traits = data.get("traits", [])
+        player.traits = tuple(data.get("traits", ()))
         return player
 
 
-class Team:
+class Roster(list):
+    """Player list that tells its owning squad when its membership changes."""
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner, players=()):
+        super().__init__(players)
+        self._owner = owner
+
+    def _changed(self):
+        self._owner._invalidate_rating()
+
+    def append(self, player): super().append(player); self._changed()
+    def extend(self, players): super().extend(players); self._changed()
+    def insert(self, index, player): super().insert(index, player); self._changed()
+    def remove(self, player): super().remove(player); self._changed()
+    def clear(self): super().clear(); self._changed()
+
+    def pop(self, index=-1):
+        player = super().pop(index)
+        self._changed()
+        return player
+
+    def __setitem__(self, index, value): super().__setitem__(index, value); self._changed()
+    def __delitem__(self, index): super().__delitem__(index); self._changed()
+
+    def __iadd__(self, players):
+        super().__iadd__(players)
+        self._changed()
+        return self
+
+    def __reduce__(self):
+        return (Roster, (self._owner, list(self)))
+
+
+class RatedSquad:
+    """Mixin for clubs with a ``players`` roster and a cached starting-11 OVR.
+
+    The rating is recomputed only after the roster changes or one of its players'
+    OVR changes (Player.ovr notifies ``player.team``), instead of sorting the whole
+    squad on every get_team_ovr() call.
+    """
+    STARTING_XI = 11
+    squad_version = 0 # Bumped on every roster or player OVR change, for caches kept outside the squad
+
+    @property
+    def players(self):
+        return self._players
+
+    @players.setter
+    def players(self, players):
+        self._players = Roster(self, players)
+        self._invalidate_rating()
+
+    def _invalidate_rating(self):
+        self._rating = None
+        self.squad_version += 1
+
+    @classmethod
+    def rating_of(cls, ovrs):
+        """Starting-11 rating of a squad given its players' OVRs."""
+        top_11_ovr = heapq.nlargest(cls.STARTING_XI, ovrs)
+        return sum(top_11_ovr) / len(top_11_ovr) if top_11_ovr else 0
+
+    def get_team_ovr(self):
+        if self._rating is None:
+            # Use starting 11 for OVR
+            self._rating = self.rating_of([p.ovr for p in self._players])
+        return self._rating
+
+
+class Team(RatedSquad):
     """Represents a football team with a roster of players and season stats."""
     def __init__(self, name, league=None): 
         self.name = name
@@ -148,14 +320,6 @@ class Team:
             return True
         return False
 
-    def get_team_ovr(self):
-        if not self.players:
-            return 0
-        # Use starting 11 for OVR
-        sorted_players = sorted(self.players, key=lambda p: p.ovr, reverse=True)
-        top_11_ovr = [p.ovr for p in sorted_players[:11]]
-        return sum(top_11_ovr) / len(top_11_ovr) if top_11_ovr else 0
-
     def get_starting_goalkeeper(self):
         goalkeepers = [p for p in self.players if p.position == 'GK']
         if not goalkeepers:
@@ -189,26 +353,31 @@ class Team:
     @classmethod
     def from_dict(cls, data):
         team = cls(data["name"], data.get("league"))
-        team.budget = data["budget"]
-        team.stadium_level = data["stadium_level"]
-        team.stadium_name = data.get("stadium_name", f"{team.name} Stadium")
-        team.academy_level = data["academy_level"]
-        team.points = data["points"]
-        team.games_played = data["games_played"]
-        team.wins = data["wins"]
-        team.draws = data["draws"]
-        team.losses = data["losses"]
-        team.goals_for = data["goals_for"]
-        team.goals_against = data["goals_against"]
-        team.trophies = data.get("trophies", [])
-        team.reputation = data.get("reputation", 50)
-        
-        for p_data in data["players"]:
-            team.players.append(Player.from_dict(p_data))
-        for yp_data in data["youth_academy"]:
-            team.youth_academy.append(Player.from_dict(yp_data))
+        team._load(data)
         return team
 
+    def _load(self, data):
+        self.budget = data["budget"]
+        self.stadium_level = data["stadium_level"]
+        self.stadium_name = data.get("stadium_name", f"{self.name} Stadium")
+        self.academy_level = data["academy_level"]
+        self.points = data["points"]
+        self.games_played = data["games_played"]
+        self.wins = data["wins"]
+        self.draws = data["draws"]
+        self.losses = data["losses"]
+        self.goals_for = data["goals_for"]
+        self.goals_against = data["goals_against"]
+        self.trophies = data.get("trophies", [])
+        self.reputation = data.get("reputation", 50)
+        
+        self.players.extend(Player.from_dict(p_data) for p_data in data["players"])
+        self.youth_academy.extend(Player.from_dict(yp_data) for yp_data in data["youth_academy"])
+        for player in self.players:
+            player.team = self # Owned players report OVR changes to the cached rating
+        for youth_player in self.youth_academy:
+            youth_player.team = self
+
     def copy(self):
         """Creates a deep copy of the team, isolating stats for simulations."""
         new_team = Team(self.name, self.league)
@@ -226,10 +395,65 @@ class Team:
         new_team.goals_for = 0
         new_team.goals_against = 0
         
-        new_team.players = [Player.from_dict(p.to_dict()) for p in self.players]
+        new_team.players = [p.clone() for p in self.players]
         for p in new_team.players:
             p.team = new_team 
-        new_team.youth_academy = [Player.from_dict(p.to_dict()) for p in self.youth_academy]
+        new_team.youth_academy = [p.clone() for p in self.youth_academy]
         for p in new_team.youth_academy:
             p.team = new_team
         return new_team
+
+
+class LazyTeam(Team):
+    """Stub for a club loaded from a save, hydrated into a full Team on first use.
+
+    Until then it holds only the name, league and starting-11 rating (computed
+    from the saved OVRs, without building any Player), so listing or ranking
+    clubs outside the user's league costs nothing. Reading or setting anything
+    else builds the roster and stats in place from the saved dict.
+    """
+    def __init__(self, data):
+        self.__dict__.update(
+            name=data["name"],
+            league=data.get("league"),
+            _rating=self.rating_of([p["ovr"] for p in data["players"]]),
+            _data=data
+        )
+
+    @property
+    def is_hydrated(self):
+        return "_data" not in self.__dict__
+
+    def hydrate(self):
+        data = self.__dict__.pop("_data", None)
+        if data is not None:
+            Team.__init__(self, data["name"], data.get("league"))
+            self._load(data)
+            self.__dict__["_loaded_players"] = list(self.players) # Saved order, for loaded_player()
+        return self
+
+    def loaded_player(self, slot):
+        """The Player built from the saved dict's ``players[slot]``, wherever they play now."""
+        return self.hydrate().__dict__["_loaded_players"][slot]
+
+    def __getattr__(self, name):
+        # Only reached for attributes a stub does not have yet
+        if name.startswith("__") or self.is_hydrated:
+            raise AttributeError(name)
+        return getattr(self.hydrate(), name)
+
+    def __setattr__(self, name, value):
+        self.hydrate() # Never let a write be overwritten by a later hydration
+        super().__setattr__(name, value)
+
+    def to_dict(self):
+        # An untouched stub still matches what was loaded, so save it without building it
+        return self.__dict__["_data"] if not self.is_hydrated else super().to_dict()
+
+def saved_data(team):
+    """The saved dict an unbuilt LazyTeam will be hydrated from, or None for a built team.
+
+    Season bookkeeping on plain fields (table stats, budget, season totals) can
+    edit it in place: hydration and to_dict() both read from it.
+    """
+    return team.__dict__.get("_data") if isinstance(team, LazyTeam) else None
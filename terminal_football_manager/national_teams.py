@@ -0,0 +1,106 @@
+import random
+
+import numpy as np
+from rich.panel import Panel
+
+from .constants import DEFENDERS, MIDFIELDERS, FORWARDS
+from .cups import run_knockout, seed_by_ovr
+from .group_stage import GROUP_SIZE, GroupStage, draw_groups
+from .models import RatedSquad
+from .player_factory import generate_players
+from .scouting import ScoutingIndex
+from .ui import console
+
+# National teams and the World Cup. Call-ups come from the scouting index's
+# per-country buckets, which follow every club roster through squad_version,
+# so picking a nation's squad is one bucket lookup rather than a scan of every
+# player in the world. Each nation fields its best XI by position (a 4-3-3 of
+# goalkeeper, defenders, midfielders and forwards, short lines topped up with
+# the best outfielders left), then the bench. Nations without enough players
+# at the simulated clubs call up home-based players generated for the
+# tournament. The World Cup itself is the top WORLD_CUP_TEAMS nations by XI
+# strength in groups of four, then a single-leg knockout of the group winners,
+# runners-up and best third-placed teams, all through the batch match engine.
+
+NATIONAL_TEAM_NAMES = [
+    "Brazil", "Germany", "Argentina", "France", "Italy", "Spain", "England",
+    "Portugal", "Belgium", "Netherlands", "Uruguay", "Croatia", "Mexico",
+    "USA", "Colombia", "Chile", "Sweden", "Switzerland", "Denmark", "Poland",
+    "Senegal", "Nigeria", "Egypt", "Japan", "South Korea", "Australia"
+]
+
+SQUAD_SIZE = 23
+SQUAD_GOALKEEPERS = 3
+WORLD_CUP_TEAMS = 24 # Six groups; 12 go through with the four best third-placed teams
+HOME_BASED_OVR = (45, 65) # Players called up from outside the simulated clubs
+
+FORMATION = (({"GK"}, 1), (DEFENDERS, 4), (MIDFIELDERS, 3), (FORWARDS, 3))
+
+class NationalTeam(RatedSquad):
+    """A nation's squad for one tournament. Players stay registered with their clubs."""
+
+    def __init__(self, name, starting_xi, bench):
+        self.name = name
+        self.league = name # Nations never clash in the group draw
+        self.starting_xi = starting_xi
+        self.players = starting_xi + bench
+
+    def get_team_ovr(self):
+        if self._rating is None:
+            self._rating = self.rating_of([p.ovr for p in self.starting_xi])
+        return self._rating
+
+    def __repr__(self):
+        return f"NationalTeam({self.name}, OVR: {self.get_team_ovr():.2f}, Squad: {len(self.players)})"
+
+def pick_squad(candidates, squad_size=SQUAD_SIZE):
+    """Splits ``candidates`` (strongest first) into a best XI by FORMATION and a bench."""
+    picked = set()
+    starting_xi = []
+    for positions, count in FORMATION:
+        line = [p for p in candidates if p.position in positions and id(p) not in picked][:count]
+        starting_xi.extend(line)
+        picked.update(map(id, line))
+    # Lines short of players are filled with the best outfielders left
+    spare = [p for p in candidates if id(p) not in picked and p.position != "GK"]
+    starting_xi.extend(spare[:sum(count for _, count in FORMATION) - len(starting_xi)])
+    picked.update(map(id, starting_xi))
+
+    keepers = sum(p.position == "GK" for p in starting_xi)
+    bench = [p for p in candidates if id(p) not in picked and p.position == "GK"][:max(0, SQUAD_GOALKEEPERS - keepers)]
+    picked.update(map(id, bench))
+    bench += [p for p in candidates if id(p) not in picked][:squad_size - len(starting_xi) - len(bench)]
+    return starting_xi, bench
+
+def generate_national_team_squad(country, scouting, rng=None):
+    """The ``country`` squad from its players at ``scouting``'s clubs, topped up with home-based players."""
+    rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64)) # Follows the seeded global RNG
+    candidates = [entry.player for entry in scouting.query(country=country)]
+    keepers_needed = max(0, SQUAD_GOALKEEPERS - sum(p.position == "GK" for p in candidates))
+    home_based = generate_players(keepers_needed, min_ovr=HOME_BASED_OVR[0], max_ovr=HOME_BASED_OVR[1],
+                                  position="GK", country_pool=[country], rng=rng)
+    home_based += generate_players(SQUAD_SIZE - len(candidates) - keepers_needed, min_ovr=HOME_BASED_OVR[0],
+                                   max_ovr=HOME_BASED_OVR[1], country_pool=[country], rng=rng)
+    candidates = sorted(candidates + home_based, key=lambda p: p.ovr, reverse=True) if home_based else candidates
+    starting_xi, bench = pick_squad(candidates)
+    return NationalTeam(country, starting_xi, bench)
+
+def simulate_world_cup(teams, user, scouting=None, rng=None):
+    """Plays a World Cup between the nations' squads drawn from ``teams``; returns the winning NationalTeam."""
+    console.print(Panel("[bold yellow]WORLD CUP YEAR[/bold yellow]", border_style="red"))
+    rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64)) # Follows the seeded global RNG
+    scouting = scouting if scouting is not None else ScoutingIndex(teams)
+    nations = [generate_national_team_squad(country, scouting, rng) for country in NATIONAL_TEAM_NAMES]
+    field = seed_by_ovr(nations)[:WORLD_CUP_TEAMS]
+    called_up = [p for nation in field for p in nation.players if p.team is user]
+    if called_up:
+        console.print(f"[green]{len(called_up)} of your players are at the World Cup: {', '.join(p.name for p in called_up)}[/green]")
+
+    n_groups = len(field) // GROUP_SIZE
+    stage = GroupStage("World Cup", draw_groups(field, n_groups, rng))
+    stage.play(rng)
+    stage.print_tables()
+    knockout_size = 1 << (2 * n_groups - 1).bit_length()
+    seeds = stage.knockout_seeds(best_thirds=knockout_size - 2 * n_groups)
+    result = run_knockout(seeds, "World Cup", rng=rng)
+    return result.winner if result else None
@@ -0,0 +1,46 @@
+import atexit
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Shared worker pool for CPU-heavy simulations (season forecasts, league shards).
+# Created on first use and reused for the rest of the session, since spawning
+# workers costs far more than a single batch of work. A single background
+# thread runs speculative work that overlaps with waiting on the user.
+
+_pool = None
+_thread_pool = None
+_submitted = weakref.WeakSet() # Process pool futures not yet collected, for cancelling at shutdown
+
+def default_workers():
+    return max(1, min(8, (os.cpu_count() or 1) - 1))
+
+def get_process_pool():
+    """Returns the shared ProcessPoolExecutor, starting it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=default_workers())
+        atexit.register(shutdown_process_pool)
+    return _pool
+
+def submit(fn, *args):
+    """Submits ``fn(*args)`` to the shared process pool; returns its Future."""
+    future = get_process_pool().submit(fn, *args)
+    _submitted.add(future)
+    return future
+
+def shutdown_process_pool():
+    global _pool
+    if _pool is not None:
+        # Drop queued work by hand: shutdown(cancel_futures=True) only exists from Python 3.9
+        for future in list(_submitted):
+            future.cancel()
+        _pool.shutdown(wait=True)
+        _pool = None
+
+def get_thread_pool():
+    """Returns the shared single-thread executor for background work, starting it on first use."""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tfm-background")
+    return _thread_pool
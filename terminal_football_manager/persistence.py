@@ -1,40 +1,212 @@
+import hashlib
+import io
 import json
 import os
-from rich.console import Console
+import pickle
+import struct
+import zlib
+from collections.abc import Iterator
 from .models import Player, Team
+from .ui import console
 # We'll import mode-specific classes inside functions to avoid circular imports if needed
 
-console = Console()
-
 SAVE_FILE = "football_manager_save.json"
+BINARY_SAVE_FILE = "football_manager_save.bin"
+SAVE_BACKEND = "binary" # Backend used for new saves; every backend's file is considered on load
+JOURNAL_COMPACT_EVERY = 50 # Journaled saves before the snapshot is rewritten
+
+class JsonSaveBackend:
+    """The original single-document JSON save."""
+    name = "json"
+
+    def __init__(self, path=SAVE_FILE):
+        self.path = path
+
+    def write(self, mode, state, incremental=False):
+        state = {k: list(v) if isinstance(v, Iterator) else v for k, v in state.items()}
+        with open(self.path, 'w') as f:
+            json.dump({"mode": mode, "state": state}, f, indent=4)
+
+    def read(self):
+        with open(self.path, 'r') as f:
+            full_data = json.load(f)
+        return full_data.get("mode"), full_data.get("state")
+
+    def modified_time(self):
+        return os.path.getmtime(self.path)
+
+class _PlainDataUnpickler(pickle.Unpickler):
+    """Save records only ever contain builtin containers and scalars; refuse anything else."""
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Save file references {module}.{name}, refusing to load it")
+
+def _load_plain_data(data):
+    return _PlainDataUnpickler(io.BytesIO(data)).load()
+
+# --- Journal diffing ---
+# A save is described by a digest tree mirroring its structure: lists become lists
+# of subtrees, dicts that hold lists of records (a club's roster, the world's clubs)
+# become dicts of subtrees, and everything else (a player, a budget) is a leaf
+# digest. Comparing the tree of the last save with the new state yields the
+# (path, value) changes to append to the journal.
+
+def _digest(value):
+    return hashlib.blake2b(pickle.dumps(value, protocol=4), digest_size=16).digest()
+
+def _holds_records(value):
+    return isinstance(value, dict) and any(isinstance(v, list) and v and isinstance(v[0], dict) for v in value.values())
+
+def _digest_tree(value):
+    if isinstance(value, list):
+        return [_digest_tree(item) for item in value]
+    if _holds_records(value):
+        return {k: _digest_tree(v) for k, v in value.items()}
+    return _digest(value)
+
+def _diff(previous, value, path, changes):
+    """Returns the digest tree of ``value``, appending (path, value) for every changed subtree."""
+    if isinstance(value, list) and isinstance(previous, list) and len(previous) == len(value):
+        return [_diff(p, v, path + (i,), changes) for i, (p, v) in enumerate(zip(previous, value))]
+    if _holds_records(value) and isinstance(previous, dict) and previous.keys() == value.keys():
+        return {k: _diff(previous[k], v, path + (k,), changes) for k, v in value.items()}
+    tree = _digest_tree(value)
+    if tree != previous:
+        changes.append((path, value))
+    return tree
+
+def _apply_change(state, path, value):
+    for key in path[:-1]:
+        state = state[key]
+    state[path[-1]] = value
+
+# (mode, digest tree, journal entries) of the last save/load per save file, so
+# journaled saves know what is already on disk
+_saved_trees = {}
 
-def save_game(mode, data):
+class BinarySaveBackend:
+    """Compact streamed save: a header record, then one record per list item (e.g. one per club).
+
+    Each record is a length-prefixed, zlib-compressed pickle of plain data, so
+    writing never materialises the whole world and list values given as
+    generators are streamed straight to disk.
+    """
+    name = "binary"
+    MAGIC = b"TFMSAVE\x01"
+    _LENGTH = struct.Struct("<I")
+
+    def __init__(self, path=BINARY_SAVE_FILE):
+        self.path = path
+
+    def _write_record(self, f, record):
+        payload = zlib.compress(pickle.dumps(record, protocol=4), 1)
+        f.write(self._LENGTH.pack(len(payload)))
+        f.write(payload)
+
+    def _read_records(self, f):
+        while True:
+            prefix = f.read(self._LENGTH.size)
+            if not prefix:
+                return
+            (length,) = self._LENGTH.unpack(prefix)
+            yield _load_plain_data(zlib.decompress(f.read(length)))
+
+    @property
+    def journal_path(self):
+        return self.path + ".journal"
+
+    def write(self, mode, state, incremental=False):
+        """Writes a full snapshot, or with ``incremental`` appends only the changes since the last save."""
+        saved = _saved_trees.get(os.path.abspath(self.path))
+        if (incremental and saved and saved[0] == mode and saved[2] < JOURNAL_COMPACT_EVERY
+                and os.path.exists(self.path) and self._journal_size() <= os.path.getsize(self.path) // 2):
+            state = {k: list(v) if isinstance(v, Iterator) else v for k, v in state.items()}
+            changes = []
+            tree = {k: _diff(saved[1].get(k), v, (k,), changes) for k, v in state.items()}
+            with open(self.journal_path, 'ab') as f:
+                self._write_record(f, {"mode": mode, "changes": changes})
+            _saved_trees[os.path.abspath(self.path)] = (mode, tree, saved[2] + 1)
+        else:
+            # First save, mode switch or a journal that has outgrown its use: compact into a new snapshot
+            self._write_snapshot(mode, state)
+
+    def _journal_size(self):
+        return os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+
+    def _write_snapshot(self, mode, state):
+        streams = {k: v for k, v in state.items() if isinstance(v, (list, Iterator))}
+        fields = {k: v for k, v in state.items() if k not in streams}
+        tree = {k: _digest_tree(v) for k, v in fields.items()}
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self.MAGIC)
+            self._write_record(f, {"mode": mode, "fields": fields, "streams": list(streams)})
+            for key, items in streams.items():
+                tree[key] = []
+                for item in items:
+                    self._write_record(f, (key, item))
+                    tree[key].append(_digest_tree(item))
+        os.replace(tmp_path, self.path) # Never leave a half-written save behind
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        _saved_trees[os.path.abspath(self.path)] = (mode, tree, 0)
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            if f.read(len(self.MAGIC)) != self.MAGIC:
+                raise ValueError("not a Terminal Football Manager binary save")
+            records = self._read_records(f)
+            header = next(records)
+            mode = header["mode"]
+            state = dict(header["fields"])
+            for key in header["streams"]:
+                state[key] = []
+            for key, item in records:
+                state[key].append(item)
+        entries = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'rb') as f:
+                for entry in self._read_records(f):
+                    mode = entry["mode"]
+                    for path, value in entry["changes"]:
+                        _apply_change(state, path, value)
+                    entries += 1
+        _saved_trees[os.path.abspath(self.path)] = (mode, {k: _digest_tree(v) for k, v in state.items()}, entries)
+        return mode, state
+
+    def modified_time(self):
+        if os.path.exists(self.journal_path):
+            return max(os.path.getmtime(self.path), os.path.getmtime(self.journal_path))
+        return os.path.getmtime(self.path)
+
+SAVE_BACKENDS = {"json": JsonSaveBackend, "binary": BinarySaveBackend}
+
+def get_save_backend(name=None):
+    return SAVE_BACKENDS[name or SAVE_BACKEND]()
+
+def save_game(mode, data, backend=None, incremental=False):
     """
     Saves the game state with a mode identifier.
-    data should be a dictionary containing mode-specific state.
+    data should be a dictionary containing mode-specific state; list values may be
+    generators, which streaming backends write item by item. With incremental=True
+    the binary backend only journals what changed since the previous save.
     """
-    full_data = {
-        "mode": mode,
-        "state": data
-    }
     try:
-        with open(SAVE_FILE, 'w') as f:
-            json.dump(full_data, f, indent=4)
+        get_save_backend(backend).write(mode, data, incremental=incremental)
         console.print(f"\n[bold green]Game saved successfully! (Mode: {mode})[/bold green]")
     except Exception as e:
         console.print(f"\n[bold red]Error saving game: {e}[/bold red]")
 
 def load_game():
     """
-    Loads the game state and returns (mode, state).
+    Loads the most recent save from any backend and returns (mode, state).
     """
     try:
-        if not os.path.exists(SAVE_FILE):
+        backends = [b() for b in SAVE_BACKENDS.values()]
+        backends = [b for b in backends if os.path.exists(b.path)]
+        if not backends:
             return None, None
-        with open(SAVE_FILE, 'r') as f:
-            full_data = json.load(f)
-        mode = full_data.get("mode")
-        state = full_data.get("state")
+        latest = max(backends, key=lambda b: b.modified_time())
+        mode, state = latest.read()
         console.print(f"\n[bold green]Game loaded successfully! (Mode: {mode})[/bold green]")
         return mode, state
     except Exception as e:
@@ -0,0 +1,133 @@
+import random
+import sys
+
+import numpy as np
+
+from .constants import COUNTRIES, POSITIONS, ATTRIBUTE_WEIGHTS, FIRST_NAMES, LAST_NAMES, NATIONAL_FIRST_NAMES, NATIONAL_LAST_NAMES
+from .models import Attributes, Player
+
+# Bulk player generation. generate_players draws every random quantity for n
+# players at once: positions, ages and base OVRs as arrays, one attribute
+# matrix per position (the OVR is its row mean), potentials, countries and
+# names from per-country pools built once at import. The rules are the ones
+# generate_player always used; attributes go straight into the packed int16
+# storage Player keeps them in.
+
+HOME_LEAGUE_PRIORITY_COUNTRIES = ["Nigeria", "Uganda", "Kenya", "South Africa"]
+EUROPEAN_PRIORITY_COUNTRIES = ["England", "Spain", "France", "Germany", "Italy", "Portugal", "Netherlands", "Belgium"]
+GLOBAL_TALENT_MIX_COUNTRIES = sorted(set(
+    [c for c in COUNTRIES if c not in HOME_LEAGUE_PRIORITY_COUNTRIES + EUROPEAN_PRIORITY_COUNTRIES]
+    + HOME_LEAGUE_PRIORITY_COUNTRIES[:2] + EUROPEAN_PRIORITY_COUNTRIES[:2] # Some overlap
+))
+
+# (probability, country pool) mixes clubs recruit from
+INTERNATIONAL_COUNTRY_MIX = ((0.7, EUROPEAN_PRIORITY_COUNTRIES), (0.3, GLOBAL_TALENT_MIX_COUNTRIES))
+DOMESTIC_COUNTRY_MIX = ((0.8, HOME_LEAGUE_PRIORITY_COUNTRIES), (0.2, GLOBAL_TALENT_MIX_COUNTRIES))
+
+YOUTH_AGES = (16, 18)
+SENIOR_AGES = (17, 34)
+YOUTH_OVR = (40, 65)
+SENIOR_OVR = (50, 75)
+ATTRIBUTE_CAP = 130
+POTENTIAL_CAP = 150
+WONDERKID_CHANCE = 0.1 # Youth players with a 130-160 potential
+WONDERKID_POTENTIAL = (130, 160)
+
+# Per-position attribute layout: shared key tuple and weight vector
+_LAYOUTS = {
+    position: (Attributes.shared_keys(weights), np.array(list(weights.values()), dtype=float))
+    for position, weights in ATTRIBUTE_WEIGHTS.items()
+}
+
+# Per-country (first names, last names), falling back to the general pools
+_NAME_POOLS = {
+    country: (NATIONAL_FIRST_NAMES.get(country) or FIRST_NAMES, NATIONAL_LAST_NAMES.get(country) or LAST_NAMES)
+    for country in set(COUNTRIES) | set(NATIONAL_FIRST_NAMES) | set(NATIONAL_LAST_NAMES)
+}
+
+def _rng():
+    return np.random.default_rng(random.getrandbits(64)) # Follows the seeded global RNG
+
+def draw_countries(n, country_pool=None, country_mix=None, rng=None):
+    """Draws n countries from ``country_pool``, a (probability, pool) ``country_mix`` or all COUNTRIES."""
+    rng = rng if rng is not None else _rng()
+    if country_mix is None:
+        pool = country_pool if country_pool else COUNTRIES
+        return [pool[i] for i in rng.integers(0, len(pool), n).tolist()]
+    weights = np.array([p for p, _ in country_mix], dtype=float)
+    which = rng.choice(len(country_mix), size=n, p=weights / weights.sum())
+    countries = [None] * n
+    for k, (_, pool) in enumerate(country_mix):
+        rows = np.flatnonzero(which == k)
+        for row, i in zip(rows.tolist(), rng.integers(0, len(pool), len(rows)).tolist()):
+            countries[row] = pool[i]
+    return countries
+
+def draw_names(countries, rng=None):
+    """A "First Last" name for each country, from that country's pools."""
+    rng = rng if rng is not None else _rng()
+    names = [None] * len(countries)
+    rows_by_country = {}
+    for row, country in enumerate(countries):
+        rows_by_country.setdefault(country, []).append(row)
+    for country, rows in rows_by_country.items():
+        firsts, lasts = _NAME_POOLS.get(country) or (FIRST_NAMES, LAST_NAMES)
+        first_idx = rng.integers(0, len(firsts), len(rows)).tolist()
+        last_idx = rng.integers(0, len(lasts), len(rows)).tolist()
+        for row, f, l in zip(rows, first_idx, last_idx):
+            names[row] = f"{firsts[f]} {lasts[l]}"
+    return names
+
+def generate_players(n, is_youth=False, min_ovr=None, max_ovr=None, position=None,
+                     country_pool=None, country_mix=None, rng=None):
+    """Generates ``n`` players in one vectorized pass; returns them as a list.
+
+    ``position`` fixes every player's position (random otherwise). Countries
+    come from ``country_pool`` or, per player, from a ``country_mix`` of
+    (probability, pool) pairs; all countries when neither is given.
+    """
+    if n <= 0:
+        return []
+    rng = rng if rng is not None else _rng()
+    default_min, default_max = YOUTH_OVR if is_youth else SENIOR_OVR
+    min_ovr = default_min if min_ovr is None else min_ovr
+    max_ovr = default_max if max_ovr is None else max_ovr
+    min_age, max_age = YOUTH_AGES if is_youth else SENIOR_AGES
+    ages = rng.integers(min_age, max_age + 1, n)
+    base_ovr = rng.integers(min_ovr, max_ovr + 1, n)
+    if position is None:
+        positions = np.array(POSITIONS, dtype=object)[rng.integers(0, len(POSITIONS), n)]
+    else:
+        positions = np.full(n, position, dtype=object)
+
+    # Attributes: base OVR +/-25% per attribute, raised by the position weight, capped
+    ovr = np.zeros(n, dtype=np.int64)
+    attribute_keys = [None] * n
+    attribute_values = [None] * n
+    for pos in np.unique(positions).tolist():
+        rows = np.flatnonzero(positions == pos)
+        keys, weights = _LAYOUTS[pos]
+        spread = 1 + (rng.random((len(rows), len(keys))) - 0.5) * 0.5
+        values = np.floor(base_ovr[rows, None] * spread)
+        values = np.clip(np.floor(values * (1 + weights)), 10, ATTRIBUTE_CAP).astype(np.int64)
+        ovr[rows] = values.sum(axis=1) // len(keys)
+        packed = values.astype("<i2").tobytes()
+        width = 2 * len(keys)
+        for j, row in enumerate(rows.tolist()):
+            attribute_keys[row] = keys
+            attribute_values[row] = packed[width * j:width * (j + 1)]
+
+    potential = rng.integers(ovr + 5, np.minimum(POTENTIAL_CAP, ovr + 30) + 1)
+    if is_youth:
+        wonderkids = rng.random(n) < WONDERKID_CHANCE
+        potential[wonderkids] = rng.integers(WONDERKID_POTENTIAL[0], WONDERKID_POTENTIAL[1] + 1, int(wonderkids.sum()))
+
+    countries = draw_countries(n, country_pool, country_mix, rng)
+    names = draw_names(countries, rng)
+    players = []
+    for i, (name, pos, age, player_ovr, player_potential, country) in enumerate(
+            zip(names, positions.tolist(), ages.tolist(), ovr.tolist(), potential.tolist(), countries)):
+        player = Player(name, pos, age, player_ovr, (), sys.intern(country), potential=player_potential)
+        player._attribute_keys, player._attribute_values = attribute_keys[i], attribute_values[i] # Already packed
+        players.append(player)
+    return players
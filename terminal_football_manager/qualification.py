@@ -0,0 +1,69 @@
+from collections import namedtuple
+
+# Continental qualification. Each competition is a rule: how many clubs it
+# takes, which league table places qualify directly (league -> slice of that
+# league's table) and which leagues may fill the remaining places by strength
+# (None for any). allocate() fills the competitions in order, each with its
+# direct places and then its strength fill, so a strong club whose table place
+# points at a lower competition can still be taken by a higher one's fill.
+# Clubs already placed are tracked by id in a set, so no club enters two
+# competitions, and each competition walks the strength ranking at most once:
+# the cost is linear in the world size per competition.
+#
+# The strength ranking is cached against every club's squad_version and only
+# re-sorted when a squad changed since the last allocation.
+
+QualificationRule = namedtuple("QualificationRule", ["competition", "size", "league_places", "fill_leagues"])
+
+PLAYOFF_LEAGUE = "Domestic Playoff"
+
+_ranking_cache = {"key": None, "ranking": []}
+
+def strength_ranking(teams):
+    """``teams`` strongest squad first, re-sorted only when a squad changed."""
+    teams = list(teams)
+    key = tuple((id(t), t.squad_version) for t in teams)
+    if key != _ranking_cache["key"]:
+        _ranking_cache["key"] = key
+        _ranking_cache["ranking"] = sorted(teams, key=lambda t: t.get_team_ovr(), reverse=True)
+    return _ranking_cache["ranking"]
+
+def continental_rules(user_league, major_leagues):
+    """Champions, Europa and Conference League rules for a season the user plays in ``user_league``.
+
+    A major-league club's league sends its top 12 (4 per competition) and the
+    rest come from the major leagues by strength; otherwise the user's league
+    sends its top 6 and any club outside the playoff league can fill.
+    """
+    per_competition = 4 if user_league in major_leagues else 2
+    fill = frozenset(major_leagues) if user_league in major_leagues else None
+    return [
+        QualificationRule(name, 16, {user_league: slice(k * per_competition, (k + 1) * per_competition)}, fill)
+        for k, name in enumerate(("Champions League", "Europa League", "Conference League"))
+    ]
+
+def allocate(rules, teams, league_tables):
+    """Participants of every rule's competition, as {competition: [team, ...]}.
+
+    ``league_tables`` maps a league to its clubs in table order; ``teams`` is
+    the pool the remaining places are filled from (playoff clubs never qualify).
+    """
+    placed = set()
+    participants = {}
+    ranking = strength_ranking(teams)
+    for rule in rules:
+        entrants = participants[rule.competition] = []
+        for league, places in rule.league_places.items():
+            for team in league_tables.get(league, [])[places]:
+                if id(team) not in placed and len(entrants) < rule.size:
+                    entrants.append(team)
+                    placed.add(id(team))
+        for team in ranking:
+            if len(entrants) >= rule.size:
+                break
+            if id(team) in placed or team.league == PLAYOFF_LEAGUE:
+                continue
+            if rule.fill_leagues is None or team.league in rule.fill_leagues:
+                entrants.append(team)
+                placed.add(id(team))
+    return participants
@@ -0,0 +1,162 @@
+import bisect
+import heapq
+
+# Scouting index over the senior squads of every club. Each player is indexed
+# by position and OVR (sorted), market value (sorted), age and country
+# (buckets). A query starts from whichever index narrows the search the most
+# and filters the rest, so "CB under 24, OVR above 100, value below €50M"
+# touches a handful of entries instead of every player in the world.
+#
+# The index follows the world through RatedSquad.squad_version, which changes
+# whenever a squad gains or loses a player or one of its players' OVR changes
+# (transfers, ageing and development all do). refresh(), run before every
+# query, re-indexes only the clubs whose version moved. Nothing is indexed
+# until the first query, so creating an index never builds LazyTeam stubs.
+
+ORDERS = ("ovr", "age", "value", "potential")
+REBUILD_FRACTION = 8 # refresh() rebuilds from scratch once over 1/8 of the clubs changed
+
+class ScoutEntry:
+    """A player as indexed: the live Player and Team plus the values it is filed under."""
+    __slots__ = ("player", "team", "position", "ovr", "age", "country", "value", "potential")
+
+    def __init__(self, player, team):
+        self.player = player
+        self.team = team
+        self.position = player.position
+        self.ovr = player.ovr
+        self.age = player.age
+        self.country = player.country
+        self.value = player.market_value
+        self.potential = player.potential
+
+    def __repr__(self):
+        return f"ScoutEntry({self.player.name}, {self.team.name}, {self.position}, OVR {self.ovr}, {self.age}y, €{self.value:,})"
+
+class ScoutingIndex:
+    """Queryable index of every senior player in ``teams``."""
+
+    def __init__(self, teams):
+        self.teams = list(teams)
+        self._entries = None # Built by the first refresh()
+
+    def _rebuild(self):
+        self._entries = {} # id(player) -> ScoutEntry
+        self._by_team = {} # id(team) -> (squad_version, [id(player), ...])
+        self._by_position = {} # position -> sorted [(ovr, id(player))]
+        self._by_ovr = []
+        self._by_value = []
+        self._by_age = {} # age -> {id(player)}
+        self._by_country = {} # country -> {id(player)}
+        # Bulk build: file every player, then sort each index once
+        for team in self.teams:
+            pids = []
+            for player in team.players:
+                entry = self._entries[id(player)] = ScoutEntry(player, team)
+                self._by_position.setdefault(entry.position, []).append((entry.ovr, id(player)))
+                self._by_ovr.append((entry.ovr, id(player)))
+                self._by_value.append((entry.value, id(player)))
+                self._by_age.setdefault(entry.age, set()).add(id(player))
+                self._by_country.setdefault(entry.country, set()).add(id(player))
+                pids.append(id(player))
+            self._by_team[id(team)] = (team.squad_version, pids)
+        for keys in (self._by_ovr, self._by_value, *self._by_position.values()):
+            keys.sort()
+
+    def __len__(self):
+        self.refresh()
+        return len(self._entries)
+
+    def _add(self, player, team):
+        entry = ScoutEntry(player, team)
+        pid = id(player)
+        self._entries[pid] = entry
+        bisect.insort(self._by_position.setdefault(entry.position, []), (entry.ovr, pid))
+        bisect.insort(self._by_ovr, (entry.ovr, pid))
+        bisect.insort(self._by_value, (entry.value, pid))
+        self._by_age.setdefault(entry.age, set()).add(pid)
+        self._by_country.setdefault(entry.country, set()).add(pid)
+        return pid
+
+    @staticmethod
+    def _discard(keys, key):
+        i = bisect.bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            del keys[i]
+
+    def _remove(self, pid):
+        entry = self._entries.pop(pid, None)
+        if entry is None:
+            return
+        self._discard(self._by_position[entry.position], (entry.ovr, pid))
+        self._discard(self._by_ovr, (entry.ovr, pid))
+        self._discard(self._by_value, (entry.value, pid))
+        self._by_age[entry.age].discard(pid)
+        self._by_country[entry.country].discard(pid)
+
+    def _index_team(self, team):
+        _, old = self._by_team.get(id(team), (None, ()))
+        for pid in old:
+            # A player who moved clubs may already be filed under the new one
+            if pid in self._entries and self._entries[pid].team is team:
+                self._remove(pid)
+        pids = []
+        for player in team.players:
+            self._remove(id(player))
+            pids.append(self._add(player, team))
+        self._by_team[id(team)] = (team.squad_version, pids)
+
+    def refresh(self):
+        """Re-indexes the clubs whose squads changed since they were last indexed; returns how many."""
+        if self._entries is None:
+            self._rebuild()
+            return len(self.teams)
+        stale = [t for t in self.teams if self._by_team[id(t)][0] != t.squad_version]
+        if len(stale) > len(self.teams) // REBUILD_FRACTION:
+            # Past this many clubs one bulk sort beats thousands of list inserts
+            self._rebuild()
+            return len(stale)
+        for team in stale:
+            self._index_team(team)
+        return len(stale)
+
+    def _range(self, keys, low, high):
+        start = 0 if low is None else bisect.bisect_left(keys, (low,))
+        end = len(keys) if high is None else bisect.bisect_left(keys, (high + 1,))
+        return [pid for _, pid in keys[start:end]]
+
+    def query(self, position=None, min_ovr=None, max_ovr=None, min_age=None, max_age=None, country=None,
+              min_value=None, max_value=None, exclude_team=None, order_by="ovr", limit=None):
+        """Returns matching ScoutEntry objects, highest ``order_by`` first (ranges are inclusive)."""
+        if order_by not in ORDERS:
+            raise ValueError(f"cannot order players by {order_by!r}")
+        self.refresh()
+
+        # Start from the smallest candidate set any single index can give
+        plans = []
+        if position is not None:
+            plans.append(lambda: self._range(self._by_position.get(position, []), min_ovr, max_ovr))
+        elif min_ovr is not None or max_ovr is not None:
+            plans.append(lambda: self._range(self._by_ovr, min_ovr, max_ovr))
+        if min_value is not None or max_value is not None:
+            plans.append(lambda: self._range(self._by_value, min_value, max_value))
+        if country is not None:
+            plans.append(lambda: self._by_country.get(country, ()))
+        if min_age is not None or max_age is not None:
+            plans.append(lambda: [pid for age, pids in self._by_age.items()
+                                  if (min_age is None or age >= min_age) and (max_age is None or age <= max_age) for pid in pids])
+        candidates = min((plan() for plan in plans), key=len) if plans else self._entries.keys()
+
+        def matches(e):
+            return ((position is None or e.position == position)
+                    and (min_ovr is None or e.ovr >= min_ovr) and (max_ovr is None or e.ovr <= max_ovr)
+                    and (min_age is None or e.age >= min_age) and (max_age is None or e.age <= max_age)
+                    and (country is None or e.country == country)
+                    and (min_value is None or e.value >= min_value) and (max_value is None or e.value <= max_value)
+                    and (exclude_team is None or e.team is not exclude_team))
+
+        hits = [e for e in (self._entries[pid] for pid in candidates) if matches(e)]
+        key = lambda e: getattr(e, order_by)
+        if limit is not None:
+            return heapq.nlargest(limit, hits, key=key)
+        return sorted(hits, key=key, reverse=True)
@@ -0,0 +1,127 @@
+import bisect
+import heapq
+import random
+
+# Transfer window listings. Listings are indexed by player id, position and OVR
+# band, so membership checks and "who is for sale at this position/level" are
+# lookups rather than scans of the whole list. The AI phase ranks listings once
+# by OVR and lets buyers pick from a priority queue, ordered by how much the
+# best listing would lift them and then by budget; each buyer bisects straight
+# to the listings that would lift its squad and walks them from a random start,
+# stopping at its first deal, so a window costs about n log n in the listings.
+
+OVR_BAND = 10 # Width of the OVR bands listings are indexed by
+AI_SQUAD_LIMIT = 30
+AI_MIN_BUDGET = 1_000_000
+AI_BUY_CHANCE = 0.3 # Chance an AI club goes through with a deal it can make
+
+class Listing:
+    """A player for sale (or scouted) from ``seller`` at ``fee``."""
+    __slots__ = ("player", "seller", "fee")
+
+    def __init__(self, player, seller, fee=None):
+        self.player = player
+        self.seller = seller
+        self.fee = player.market_value if fee is None else fee
+
+    def __repr__(self):
+        return f"Listing({self.player.name}, {self.seller.name}, €{self.fee:,})"
+
+def transfer(player, seller, buyer, fee):
+    """Moves ``player`` from ``seller`` to ``buyer`` and settles ``fee``."""
+    buyer.budget -= fee
+    seller.budget += fee
+    seller.remove_player(player)
+    buyer.add_player(player)
+
+class TransferMarket:
+    """The listings of one transfer window."""
+
+    def __init__(self):
+        self._by_player = {} # id(player) -> Listing, in listing order
+        self._index_keys = {} # id(player) -> (position, band) it was indexed under
+        self._by_position = {}
+        self._by_band = {}
+
+    def __len__(self):
+        return len(self._by_player)
+
+    def __iter__(self):
+        return iter(list(self._by_player.values()))
+
+    def __contains__(self, player):
+        return id(player) in self._by_player
+
+    def get(self, player):
+        return self._by_player.get(id(player))
+
+    def list_player(self, player, seller, fee=None):
+        """Lists ``player``; returns the Listing, or None if already listed."""
+        if player in self:
+            return None
+        listing = Listing(player, seller, fee)
+        position, band = player.position, player.ovr // OVR_BAND
+        self._by_player[id(player)] = listing
+        self._index_keys[id(player)] = (position, band)
+        self._by_position.setdefault(position, {})[id(player)] = listing
+        self._by_band.setdefault(band, {})[id(player)] = listing
+        return listing
+
+    def delist(self, player):
+        listing = self._by_player.pop(id(player), None)
+        if listing is not None:
+            position, band = self._index_keys.pop(id(player)) # As listed, even if the player has changed since
+            del self._by_position[position][id(player)]
+            del self._by_band[band][id(player)]
+        return listing
+
+    def at_position(self, position):
+        return list(self._by_position.get(position, {}).values())
+
+    def in_ovr_range(self, min_ovr, max_ovr=None):
+        """Listings with min_ovr <= OVR (<= max_ovr), read from the bands that can hold them."""
+        bands = sorted(self._by_band)
+        first = bisect.bisect_left(bands, min_ovr // OVR_BAND)
+        last = len(bands) if max_ovr is None else bisect.bisect_right(bands, max_ovr // OVR_BAND)
+        return [l for band in bands[first:last] for l in self._by_band[band].values()
+                if l.player.ovr >= min_ovr and (max_ovr is None or l.player.ovr <= max_ovr)]
+
+    def complete(self, listing, buyer, fee=None):
+        """Sells a listing to ``buyer`` (at its fee unless ``fee`` is given) and takes it off the market."""
+        transfer(listing.player, listing.seller, buyer, listing.fee if fee is None else fee)
+        self.delist(listing.player)
+
+    def run_ai_round(self, buyers):
+        """Each AI club buys at most one listed player that improves it; returns the completed listings."""
+        ranked = sorted(self._by_player.values(), key=lambda l: -l.player.ovr)
+        if not ranked:
+            return []
+        neg_ovrs = [-l.player.ovr for l in ranked]
+        # Buyers who stand to gain the most from the best listing go first, richest first among equals
+        queue = []
+        for i, buyer in enumerate(buyers):
+            squad = len(buyer.players)
+            if buyer.budget < AI_MIN_BUDGET or squad >= AI_SQUAD_LIMIT:
+                continue
+            # Signing p improves the buyer if (squad OVR sum + p.ovr) / (squad + 1) > team OVR + 1
+            threshold = (buyer.get_team_ovr() + 1) * (squad + 1) - sum(p.ovr for p in buyer.players)
+            if ranked[0].player.ovr > threshold:
+                queue.append((threshold, -buyer.budget, i, buyer))
+        heapq.heapify(queue)
+        sold = set()
+        completed = []
+        while queue:
+            threshold, _, _, buyer = heapq.heappop(queue)
+            count = bisect.bisect_left(neg_ovrs, -threshold) # ranked[:count] would lift the squad
+            # Walked from a random start, so buyers do not all reach for the same player first
+            start = random.randrange(count)
+            for k in range(count):
+                listing = ranked[(start + k) % count]
+                if id(listing) in sold or listing.seller is buyer:
+                    continue
+                if listing.fee <= buyer.budget and random.random() < AI_BUY_CHANCE:
+                    self.complete(listing, buyer)
+                    sold.add(id(listing))
+                    completed.append(listing)
+                    break
+        return completed
@@ -0,0 +1,5 @@
+from rich.console import Console
+
+# The one Console every module prints through, so output settings (quiet for
+# headless runs, width, recording) apply to the whole game at once.
+console = Console()
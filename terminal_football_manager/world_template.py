@@ -0,0 +1,175 @@
+import hashlib
+import json
+import random
+
+import numpy as np
+
+from .constants import ATTRIBUTE_WEIGHTS, COUNTRIES
+from .models import Player, Team
+from .player_factory import generate_players, INTERNATIONAL_COUNTRY_MIX, DOMESTIC_COUNTRY_MIX
+
+# World template for new games. The static parts of a world (club lists,
+# league groupings and the star players with their attribute bonuses) are
+# compiled once per process into a plain-data template, stamped with
+# TEMPLATE_VERSION and a fingerprint of the source data. Compiling takes well
+# under a millisecond, so the template lives in memory only and nothing is
+# written to disk. build_world() then only rolls the random parts (star ages
+# and attributes, filler players, academies and budgets) from one seeded
+# generator: the same seed always gives the same world.
+
+TEMPLATE_VERSION = 1
+SQUAD_SIZE = 22
+ACADEMY_SIZE = (5, 10)
+INTERNATIONAL_FILLER_OVR = (100, 140)
+
+# Domestic leagues
+DOMESTIC_LEAGUE_CLUBS = [
+    "Superstars", "Kitoha FC", "Red Stars", "FC Pastro", "SC Annex",
+    "Tripple X", "CityBoys", "FC Kabanana", "Nevis FC", "Guliza",
+    "Dragon Stars", "Young Stars", "FC Pacific Coast", "The Blues"
+]
+
+DOMESTIC_PLAYOFF_CLUBS = ["Dreamwarriors", "CF Tesa"]
+
+# International leagues
+INTERNATIONAL_LEAGUE_GROUPS = {
+    "Premier League": ["Manchester City", "Arsenal", "Liverpool", "Chelsea", "Manchester United", "Tottenham Hotspur", "Newcastle United", "Brighton & Hove Albion"],
+    "La Liga": ["Real Madrid", "Barcelona", "Atletico Madrid", "Girona", "Real Sociedad", "Athletic Club", "Real Betis", "Sevilla"],
+    "Serie A": ["Inter Milan", "AC Milan", "Juventus", "Napoli", "Roma", "Lazio", "Atalanta", "Fiorentina"],
+    "Ligue 1": ["Paris Saint-Germain", "Monaco", "Lille", "Nice", "Marseille", "Rennes", "Lens", "Lyon"]
+}
+
+STAR_PLAYERS = [
+    # Our Domestic League Stars
+    {"name": "Mark Muonge", "ovr": 120, "pos": "GK", "team": "Superstars", "country": "Uganda"},
+    {"name": "Akankunda Emmanuel", "ovr": 113, "pos": "RWF", "team": "Superstars", "country": "Uganda"},
+    {"name": "T. Trevor", "ovr": 111, "pos": "AMF", "team": "Superstars", "country": "Uganda"},
+    {"name": "Loughlan", "ovr": 108, "pos": "AMF", "team": "Superstars", "country": "England"},
+    {"name": "T. Andrew", "ovr": 119, "pos": "CF", "team": "Superstars", "country": "Uganda"},
+    {"name": "Tomy Chan", "ovr": 117, "pos": "CMF", "team": "Superstars", "country": "China"},
+    {"name": "Mark Davins", "ovr": 103, "pos": "AMF", "team": "Superstars", "country": "Uganda"},
+    {"name": "Ariho Raymond", "ovr": 105, "pos": "CB", "team": "Superstars", "country": "Uganda"},
+    {"name": "Cosmas", "ovr": 102, "pos": "LB", "team": "Superstars", "country": "Uganda"},
+    {"name": "Balikudembe", "ovr": 97, "pos": "RB", "team": "Superstars", "country": "Uganda"},
+    {"name": "Rukundo Emmanuel", "ovr": 99, "pos": "CB", "team": "Superstars", "country": "Uganda"},
+    {"name": "Isaiah", "ovr": 101, "pos": "AMF", "team": "FC Pastro", "country": "Uganda"},
+    {"name": "Naju Godwin", "ovr": 117, "pos": "LWF", "team": "FC Pastro", "country": "Nigeria"},
+    {"name": "Innocent", "ovr": 113, "pos": "GK", "team": "FC Pastro", "country": "Kenya"},
+    {"name": "Arinaitwe Davies Kapara", "ovr": 111, "pos": "LWF", "team": "FC Pastro", "country": "Uganda"},
+    {"name": "Felix B", "ovr": 89, "pos": "RB", "team": "FC Pastro", "country": "South Africa"},
+    {"name": "Agustus Kanyantabe", "ovr": 118, "pos": "RWF", "team": "FC Pastro", "country": "Uganda"},
+    {"name": "Ahimibisibwe John Stuart", "ovr": 110, "pos": "CF", "team": "Red Stars", "country": "Nigeria"},
+    {"name": "Barrerio", "ovr": 112, "pos": "LB", "team": "Kitoha FC", "country": "Spain"},
+    {"name": "Avitus", "ovr": 115, "pos": "CB", "team": "Kitoha FC", "country": "Uganda"},
+    {"name": "Shield", "ovr": 116, "pos": "RB", "team": "Kitoha FC", "country": "England"},
+    {"name": "Amanya Andrew", "ovr": 113, "pos": "CF", "team": "Kitoha FC", "country": "Uganda"},
+    {"name": "Nevis", "ovr": 121, "pos": "CF", "team": "Nevis FC", "country": "Portugal"},
+    {"name": "Benjamin", "ovr": 114, "pos": "CF", "team": "Nevis FC", "country": "South Africa"},
+    {"name": "Nasa", "ovr": 122, "pos": "CF", "team": "Dragon Stars", "country": "Brazil"},
+    {"name": "Regina Nantes", "ovr": 121, "pos": "AMF", "team": "Dragon Stars", "country": "France"},
+    {"name": "Fredrick M", "ovr": 101, "pos": "CMF", "team": "Dragon Stars", "country": "Kenya"},
+    {"name": "Lawrence", "ovr": 112, "pos": "CB", "team": "FC Kabanana", "country": "Nigeria"},
+    {"name": "Aine Arnold", "ovr": 117, "pos": "CF", "team": "Young Stars", "country": "Uganda"},
+    {"name": "Ainembabazi Brian", "ovr": 119, "pos": "LB", "team": "Young Stars", "country": "Uganda"},
+    {"name": "Eric", "ovr": 101, "pos": "CMF", "team": "The Blues", "country": "England"},
+    # Premier League Stars - added specific countries
+    {"name": "Erling Haaland", "ovr": 130, "pos": "CF", "team": "Manchester City", "country": "Norway"},
+    {"name": "Kevin De Bruyne", "ovr": 128, "pos": "CMF", "team": "Manchester City", "country": "Belgium"},
+    {"name": "Bukayo Saka", "ovr": 125, "pos": "RWF", "team": "Arsenal", "country": "England"},
+    {"name": "Mohamed Salah", "ovr": 127, "pos": "RWF", "team": "Liverpool", "country": "Egypt"},
+    {"name": "Virgil van Dijk", "ovr": 126, "pos": "CB", "team": "Liverpool", "country": "Netherlands"},
+    {"name": "Bruno Fernandes", "ovr": 124, "pos": "AMF", "team": "Manchester United", "country": "Portugal"},
+    # La Liga Stars - added specific countries
+    {"name": "Jude Bellingham", "ovr": 129, "pos": "CMF", "team": "Real Madrid", "country": "England"},
+    {"name": "Vinicius Jr.", "ovr": 127, "pos": "LWF", "team": "Real Madrid", "country": "Brazil"},
+    {"name": "Robert Lewandowski", "ovr": 126, "pos": "CF", "team": "Barcelona", "country": "Poland"},
+    {"name": "Marc-Andre ter Stegen", "ovr": 125, "pos": "GK", "team": "Barcelona", "country": "Germany"},
+    {"name": "Antoine Griezmann", "ovr": 124, "pos": "SS", "team": "Atletico Madrid", "country": "France"},
+    # Serie A Stars - added specific countries
+    {"name": "Lautaro Martinez", "ovr": 126, "pos": "CF", "team": "Inter Milan", "country": "Argentina"},
+    {"name": "Rafael Leão", "ovr": 125, "pos": "LWF", "team": "AC Milan", "country": "Portugal"},
+    {"name": "Victor Osimhen", "ovr": 127, "pos": "CF", "team": "Napoli", "country": "Nigeria"},
+    {"name": "Federico Chiesa", "ovr": 123, "pos": "RWF", "team": "Juventus", "country": "Italy"},
+    # Ligue 1 Stars - added specific countries
+    {"name": "Kylian Mbappé", "ovr": 132, "pos": "LWF", "team": "Paris Saint-Germain", "country": "France"},
+    {"name": "Neymar Jr.", "ovr": 128, "pos": "LWF", "team": "Paris Saint-Germain", "country": "Brazil"},
+]
+
+_template = None # Compiled template, once loaded
+
+def _fingerprint():
+    source = [TEMPLATE_VERSION, DOMESTIC_LEAGUE_CLUBS, DOMESTIC_PLAYOFF_CLUBS, INTERNATIONAL_LEAGUE_GROUPS, STAR_PLAYERS, ATTRIBUTE_WEIGHTS]
+    return hashlib.blake2b(json.dumps(source, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+def compile_template():
+    """Compiles the static world data into the plain-data template build_world() uses."""
+    clubs = [[name, "Domestic League"] for name in DOMESTIC_LEAGUE_CLUBS]
+    clubs += [[name, "Domestic Playoff"] for name in DOMESTIC_PLAYOFF_CLUBS]
+    clubs += [[name, league] for league, names in INTERNATIONAL_LEAGUE_GROUPS.items() for name in names]
+    club_index = {name: i for i, (name, _) in enumerate(clubs)}
+    stars = []
+    squad_sizes = [0] * len(clubs)
+    for star in STAR_PLAYERS:
+        if star["team"] not in club_index:
+            continue
+        club = club_index[star["team"]]
+        weights = ATTRIBUTE_WEIGHTS[star["pos"]]
+        stars.append({
+            "club": club, "name": star["name"], "pos": star["pos"], "ovr": star["ovr"], "country": star.get("country"),
+            "attributes": list(weights), "bonus": [star["ovr"] * 0.2 * w for w in weights.values()]
+        })
+        squad_sizes[club] += 1
+    return {
+        "version": TEMPLATE_VERSION,
+        "fingerprint": _fingerprint(),
+        "clubs": clubs,
+        "international": [league in INTERNATIONAL_LEAGUE_GROUPS for _, league in clubs],
+        "stars": stars,
+        "fill": [max(0, SQUAD_SIZE - n) for n in squad_sizes]
+    }
+
+def load_template():
+    """Returns the compiled template, compiling it on first use."""
+    global _template
+    if _template is None:
+        _template = compile_template()
+    return _template
+
+def build_world(seed=None):
+    """Builds every club of a new world from the template; returns them in template order."""
+    template = load_template()
+    rng = np.random.default_rng(seed if seed is not None else random.getrandbits(64))
+    teams = [Team(name, league=league) for name, league in template["clubs"]]
+
+    # Star players: attributes 5-20 under their OVR plus the position bonus
+    stars = template["stars"]
+    ages = rng.integers(19, 30, len(stars)).tolist() # Stars are typically in their prime
+    potential_gains = rng.integers(5, 46, len(stars)).tolist()
+    for star, age, gain in zip(stars, ages, potential_gains):
+        ovr = star["ovr"]
+        base = rng.integers(ovr - 20, ovr - 4, len(star["attributes"]))
+        values = np.clip(np.floor(base + np.array(star["bonus"])), 10, 130).astype(int).tolist()
+        country = star["country"] or str(rng.choice(COUNTRIES))
+        player = Player(star["name"], star["pos"], age, ovr, dict(zip(star["attributes"], values)), country, potential=min(250, ovr + gain))
+        teams[star["club"]].add_player(player)
+
+    # Filler players and academies, one batch per kind of club
+    international = template["international"]
+    for is_international, mix, ovr_range in ((True, INTERNATIONAL_COUNTRY_MIX, INTERNATIONAL_FILLER_OVR), (False, DOMESTIC_COUNTRY_MIX, (None, None))):
+        clubs = [i for i, flag in enumerate(international) if flag == is_international]
+        needed = [template["fill"][i] for i in clubs]
+        academy_sizes = rng.integers(ACADEMY_SIZE[0], ACADEMY_SIZE[1] + 1, len(clubs)).tolist()
+        seniors = iter(generate_players(sum(needed), False, *ovr_range, country_mix=mix, rng=rng))
+        youth = iter(generate_players(sum(academy_sizes), True, country_mix=mix, rng=rng))
+        for i, n_seniors, n_youth in zip(clubs, needed, academy_sizes):
+            for _ in range(n_seniors):
+                teams[i].add_player(next(seniors))
+            teams[i].youth_academy.extend(next(youth) for _ in range(n_youth))
+
+    # Budgets from team OVR and league importance
+    for team, is_international in zip(teams, international):
+        if is_international:
+            team.budget = int(7 * (team.get_team_ovr() * 2_000_000 + int(rng.integers(50_000_000, 100_000_001))))
+        else: # Domestic or Playoff teams
+            team.budget = int(7 * (team.get_team_ovr() * 1_000_000 + int(rng.integers(5_000_000, 15_000_001))))
+    return teams